@@ -8,6 +8,8 @@ Kramer Harrison, 2025
 
 import abc
 
+from optiland.parallel import map_method
+
 
 class BaseAnalysis(abc.ABC):
     """Base class for all analysis routines.
@@ -17,6 +19,12 @@ class BaseAnalysis(abc.ABC):
         wavelengths (str or list, optional): The wavelengths to analyze.
             Can be 'all', 'primary', or a list of wavelength values.
             Defaults to 'all'.
+        n_workers (int, optional): If given, independent tasks of the analysis
+            (e.g. fields and wavelengths) are run in this many worker
+            processes. Defaults to None (serial).
+        executor (OpticExecutor, optional): An existing executor for the
+            optic, used to run independent tasks in parallel. Defaults to
+            None.
 
     Attributes:
         optic (Optic): The optic object being analyzed.
@@ -25,8 +33,10 @@ class BaseAnalysis(abc.ABC):
               `_generate_data` method implemented by subclasses.
     """
 
-    def __init__(self, optic, wavelengths="all"):
+    def __init__(self, optic, wavelengths="all", *, n_workers=None, executor=None):
         self.optic = optic
+        self.n_workers = n_workers
+        self.executor = executor
 
         if isinstance(wavelengths, str):
             if wavelengths == "all":
@@ -56,6 +66,28 @@ class BaseAnalysis(abc.ABC):
         """
         pass
 
+    @property
+    def is_parallel(self):
+        """bool: whether tasks of the analysis are run in worker processes"""
+        return self.executor is not None or (
+            self.n_workers is not None and self.n_workers > 1
+        )
+
+    def _map_tasks(self, method_name, tasks):
+        """Run a method of the analysis for each task.
+
+        The tasks are run in worker processes if `n_workers` or `executor`
+        is set, and serially otherwise.
+
+        Args:
+            method_name (str): The name of the method to call.
+            tasks (Iterable[tuple]): The arguments of each task.
+
+        Returns:
+            list: The results, in the order of the tasks.
+        """
+        return map_method(self, method_name, tasks, self.n_workers, self.executor)
+
     @abc.abstractmethod
     def view(self, figsize=None, **kwargs):
         """Abstract method to visualize the analysis data.
@@ -140,30 +140,18 @@ class EncircledEnergy(SpotDiagram):
             ee_np = be.to_numpy(ee)
             ax.plot(r_np, ee_np, label=f"Hx: {field[0]:.3f}, Hy: {field[1]:.3f}")
 
-    def _generate_field_data(
-        self,
-        field,
-        wavelength,
-        num_rays=100,
-        distribution="hexapolar",
-        coordinates="local",
-    ):
-        """Generate the field data for a specific field and wavelength.
+    def _to_spot_data(self, x_global, y_global, z_global, intensity, coordinates):
+        """Convert image surface intersections to spot data.
 
         Args:
-            field (tuple): Tuple representing the field coordinates.
-            wavelength (float): The wavelength.
-            num_rays (int, optional): The number of rays. Defaults to 100.
-            distribution (str, optional): The distribution of rays.
-                Defaults to 'hexapolar'.
+            x_global (be.ndarray): The global x-coordinates of the rays.
+            y_global (be.ndarray): The global y-coordinates of the rays.
+            z_global (be.ndarray): The global z-coordinates of the rays.
+            intensity (be.ndarray): The intensities of the rays.
             coordinates (str): Coordinate system choice (ignored).
 
         Returns:
             SpotData: SpotData object containing x, y, and intensity arrays.
 
         """
-        self.optic.trace(*field, wavelength, num_rays, distribution)
-        x = self.optic.surface_group.x[-1, :]
-        y = self.optic.surface_group.y[-1, :]
-        intensity = self.optic.surface_group.intensity[-1, :]
-        return SpotData(x=x, y=y, intensity=intensity)
+        return SpotData(x=x_global, y=y_global, intensity=intensity)
@@ -18,6 +18,7 @@ import numpy as _np  # Use _np for the binning. Later extend to
 
 # other backends
 import optiland.backend as be
+from optiland.raytrace.reducers import HistogramReducer, reduce_chunks
 
 from .base import BaseAnalysis
 
@@ -52,6 +53,17 @@ class IncoherentIrradiance(BaseAnalysis):
      user_initial_rays : RealRays | None
          Optional user-provided initial rays (at the source/object plane)
          to be traced through the whole optical system.
+     chunk_size : int | None
+         If given, rays are traced in chunks of at most this many rays and
+         accumulated into the irradiance grid chunk by chunk, so that memory
+         use does not grow with `num_rays`. Ignored when
+         `user_initial_rays` is provided.
+     n_workers : int | None
+         If given, the fields and wavelengths are traced in this many worker
+         processes.
+     executor : OpticExecutor | None
+         An existing executor for the optic, used to trace the fields and
+         wavelengths in parallel.
 
      Methods
      ---
@@ -74,6 +86,9 @@ class IncoherentIrradiance(BaseAnalysis):
         wavelengths="all",
         distribution: str = "random",
         user_initial_rays=None,
+        chunk_size: int = None,
+        n_workers: int = None,
+        executor=None,
     ):
         if fields == "all":
             self.fields = optic.fields.get_field_coords()
@@ -88,6 +103,7 @@ class IncoherentIrradiance(BaseAnalysis):
         self.detector_surface = int(detector_surface)
         self.user_initial_rays = user_initial_rays
         self.distribution = distribution
+        self.chunk_size = chunk_size
 
         # The detector surface must have a physical aperture
         surf = optic.surface_group.surfaces[self.detector_surface]
@@ -97,7 +113,7 @@ class IncoherentIrradiance(BaseAnalysis):
                 "(e.g. RectangularAperture) so that the detector size is defined."
             )
 
-        super().__init__(optic, wavelengths)
+        super().__init__(optic, wavelengths, n_workers=n_workers, executor=executor)
 
     def view(
         self,
@@ -326,18 +342,50 @@ class IncoherentIrradiance(BaseAnalysis):
     # --- data generation functions ---
 
     def _generate_data(self):  # Signature changed
+        if (
+            self.user_initial_rays is None
+            and self.chunk_size is None
+            and not self.is_parallel
+        ):
+            return self._generate_batch_data()
+
+        # resolve the detector pixels once, before tasks are dispatched
+        self._get_bin_edges(self.optic.surface_group.surfaces[self.detector_surface])
+
+        tasks = [
+            (field, wl, self.distribution, self.user_initial_rays)
+            for field in self.fields
+            for wl in self.wavelengths
+        ]
+        results = self._map_tasks("_generate_field_data", tasks)
+
+        num_wavelengths = len(self.wavelengths)
+        return [
+            results[k : k + num_wavelengths]
+            for k in range(0, len(results), num_wavelengths)
+        ]
+
+    def _generate_batch_data(self):
+        """Trace all fields and wavelengths at once and bin each of them."""
+        surf = self.optic.surface_group.surfaces[self.detector_surface]
+        x_edges, y_edges, pixel_area = self._get_bin_edges(surf)
+        batch = self.optic.trace_batch(
+            self.fields,
+            self.wavelengths,
+            self.num_rays,
+            self.distribution,
+            surface=self.detector_surface,
+        )
+
         data = []
-        # Use self.fields, self.wavelengths, self.distribution, self.user_initial_rays
-        for field in self.fields:
+        for f in range(len(self.fields)):
             f_block = []
-            for (
-                wl
-            ) in self.wavelengths:  # self.wavelengths is now a list from BaseAnalysis
-                f_block.append(
-                    self._generate_field_data(
-                        field, wl, self.distribution, self.user_initial_rays
-                    )
+            for w in range(len(self.wavelengths)):
+                rays = batch[f, w]
+                irr = self._bin_power(
+                    surf, rays.x, rays.y, rays.z, rays.i, x_edges, y_edges
                 )
+                f_block.append((be.array(irr / pixel_area), x_edges, y_edges))
             data.append(f_block)
         return data
 
@@ -345,18 +393,52 @@ class IncoherentIrradiance(BaseAnalysis):
         self, field, wavelength, distribution, user_initial_rays
     ):  # Signature unchanged
         """Trace rays and bin their power into the pixels of the detector."""
+        surf = self.optic.surface_group.surfaces[self.detector_surface]
+        x_edges, y_edges, pixel_area = self._get_bin_edges(surf)
+
         # Uses self.num_rays internally
+        if user_initial_rays is None and self.chunk_size is not None:
+            Hx, Hy = field
+            reducer = HistogramReducer(x_edges, y_edges, surface=surf)
+            reduce_chunks(
+                self.optic.trace_iter(
+                    Hx,
+                    Hy,
+                    wavelength,
+                    self.num_rays,
+                    distribution,
+                    chunk_size=self.chunk_size,
+                    surface=self.detector_surface,
+                ),
+                reducer,
+            )
+            return be.array(reducer.result() / pixel_area), x_edges, y_edges
+
         if user_initial_rays is None:
             Hx, Hy = field
-            self.optic.trace(Hx, Hy, wavelength, self.num_rays, distribution)
+            self.optic.trace(
+                Hx,
+                Hy,
+                wavelength,
+                self.num_rays,
+                distribution,
+                record=[self.detector_surface],
+            )
         else:
-            self.optic.surface_group.trace(user_initial_rays)
+            self.optic.surface_group.trace(
+                user_initial_rays, record=[self.detector_surface]
+            )
 
         # get ray coords on detector surface
-        surf = self.optic.surface_group.surfaces[self.detector_surface]
-        x_g, y_g, z_g = surf.x, surf.y, surf.z
-        power = surf.intensity
+        hist = self._bin_power(
+            surf, surf.x, surf.y, surf.z, surf.intensity, x_edges, y_edges
+        )
+        irr = hist / pixel_area
+        return be.array(irr), x_edges, y_edges
 
+    @staticmethod
+    def _bin_power(surf, x_g, y_g, z_g, power, x_edges, y_edges):
+        """Bin the power of rays into the pixels of the detector surface."""
         from optiland.visualization.utils import transform
 
         x_local, y_local, _ = transform(x_g, y_g, z_g, surf, is_global=True)
@@ -367,6 +449,14 @@ class IncoherentIrradiance(BaseAnalysis):
         valid = power_np > 0.0
         x_np, y_np, power_np = x_np[valid], y_np[valid], power_np[valid]
 
+        # 2d binning with numpy histogram
+        hist, _, _ = _np.histogram2d(
+            x_np, y_np, bins=[x_edges, y_edges], weights=power_np
+        )
+        return hist
+
+    def _get_bin_edges(self, surf):
+        """Return the pixel bin edges and the pixel area of the detector."""
         # get the physical siize of the detector
         x_min, x_max, y_min, y_max = surf.aperture.extent
         if self.px_size is None:
@@ -389,9 +479,4 @@ class IncoherentIrradiance(BaseAnalysis):
                 )
                 self.npix_x, self.npix_y = exp_nx, exp_ny
 
-        # 2d binning with numpy histogram
-        hist, _, _ = _np.histogram2d(
-            x_np, y_np, bins=[x_edges, y_edges], weights=power_np
-        )
-        irr = hist / pixel_area
-        return be.array(irr), x_edges, y_edges
+        return x_edges, y_edges, pixel_area
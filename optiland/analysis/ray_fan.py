@@ -120,41 +120,24 @@ class RayFan(BaseAnalysis):
         data = {}
         data["Px"] = be.linspace(-1, 1, self.num_points)
         data["Py"] = be.linspace(-1, 1, self.num_points)
-        for field in self.fields:
-            Hx = field[0]
-            Hy = field[1]
-
+        # trace all fields and wavelengths at once, for each fan direction
+        batch_x = self.optic.trace_batch(
+            self.fields, self.wavelengths, self.num_points, "line_x"
+        )
+        batch_y = self.optic.trace_batch(
+            self.fields, self.wavelengths, self.num_points, "line_y"
+        )
+        for f, field in enumerate(self.fields):
             data[f"{field}"] = {}
-            for wavelength in self.wavelengths:
-                data[f"{field}"][f"{wavelength}"] = {}
-
-                self.optic.trace(
-                    Hx=Hx,
-                    Hy=Hy,
-                    wavelength=wavelength,
-                    num_rays=self.num_points,
-                    distribution="line_x",
-                )
-                data[f"{field}"][f"{wavelength}"]["x"] = self.optic.surface_group.x[
-                    -1, :
-                ]
-                data[f"{field}"][f"{wavelength}"]["intensity_x"] = (
-                    self.optic.surface_group.intensity[-1, :]
-                )
-
-                self.optic.trace(
-                    Hx=Hx,
-                    Hy=Hy,
-                    wavelength=wavelength,
-                    num_rays=self.num_points,
-                    distribution="line_y",
-                )
-                data[f"{field}"][f"{wavelength}"]["y"] = self.optic.surface_group.y[
-                    -1, :
-                ]
-                data[f"{field}"][f"{wavelength}"]["intensity_y"] = (
-                    self.optic.surface_group.intensity[-1, :]
-                )
+            for w, wavelength in enumerate(self.wavelengths):
+                rays_x = batch_x[f, w]
+                rays_y = batch_y[f, w]
+                data[f"{field}"][f"{wavelength}"] = {
+                    "x": rays_x.x,
+                    "intensity_x": rays_x.i,
+                    "y": rays_y.y,
+                    "intensity_y": rays_y.i,
+                }
 
         # remove distortion
         wave_ref = self.optic.primary_wavelength
@@ -88,6 +88,10 @@ class RmsWavefrontErrorVsField(Wavefront):
         num_rays (int): the number of rays. Default is 12.
         distribution (str): the distribution of the fields.
             Default is 'hexapolar'.
+        n_workers (int, optional): the number of worker processes used to
+            trace the fields. Default is None (serial).
+        executor (OpticExecutor, optional): an existing executor for the
+            optic. Default is None.
 
     """
 
@@ -98,10 +102,21 @@ class RmsWavefrontErrorVsField(Wavefront):
         wavelengths="all",
         num_rays=12,
         distribution="hexapolar",
+        *,
+        n_workers=None,
+        executor=None,
     ):
         self.num_fields = num_fields
         fields = [(0, Hy) for Hy in be.linspace(0, 1, num_fields)]
-        super().__init__(optic, fields, wavelengths, num_rays, distribution)
+        super().__init__(
+            optic,
+            fields,
+            wavelengths,
+            num_rays,
+            distribution,
+            n_workers=n_workers,
+            executor=executor,
+        )
 
         self._field = be.array(fields)
         self._wavefront_error = be.array(self._rms_wavefront_error())
@@ -61,6 +61,10 @@ class SpotDiagram(BaseAnalysis):
         num_rings=6,
         distribution="hexapolar",
         coordinates: Literal["global", "local"] = "local",
+        chunk_size: int = None,
+        *,
+        n_workers: int = None,
+        executor=None,
     ):
         """Create an instance of SpotDiagram
 
@@ -82,6 +86,15 @@ class SpotDiagram(BaseAnalysis):
                 Default is 'hexapolar'.
             coordinates (Literal['global', 'local'], optional): Coordinate system
                 for data generation and plotting. Defaults to "local".
+            chunk_size (int, optional): If given, rays are traced in chunks of
+                at most this many rays, so that the transient memory of the
+                trace does not grow with the number of rays. Defaults to None,
+                in which case all rays are traced at once.
+            n_workers (int, optional): If given, the fields and wavelengths
+                are traced in this many worker processes. Defaults to None.
+            executor (OpticExecutor, optional): An existing executor for the
+                optic, used to trace the fields and wavelengths in parallel.
+                Defaults to None.
 
         """
         if fields == "all":
@@ -95,8 +108,9 @@ class SpotDiagram(BaseAnalysis):
 
         self.num_rings = num_rings
         self.distribution = distribution
+        self.chunk_size = chunk_size
 
-        super().__init__(optic, wavelengths)
+        super().__init__(optic, wavelengths, n_workers=n_workers, executor=executor)
 
     def view(self, figsize=(12, 4), add_airy_disk=False):
         """View the spot diagram
@@ -225,6 +239,7 @@ class SpotDiagram(BaseAnalysis):
             Px=0,
             Py=1,
             wavelength=wavelength,
+            record="none",
         )
         ray_south = self.optic.trace_generic(
             Hx=H_x,
@@ -232,6 +247,7 @@ class SpotDiagram(BaseAnalysis):
             Px=0,
             Py=-1,
             wavelength=wavelength,
+            record="none",
         )
         ray_east = self.optic.trace_generic(
             Hx=H_x,
@@ -239,6 +255,7 @@ class SpotDiagram(BaseAnalysis):
             Px=1,
             Py=0,
             wavelength=wavelength,
+            record="none",
         )
         ray_west = self.optic.trace_generic(
             Hx=H_x,
@@ -246,6 +263,7 @@ class SpotDiagram(BaseAnalysis):
             Px=-1,
             Py=0,
             wavelength=wavelength,
+            record="none",
         )
 
         ray_tuple = ray_north, ray_south, ray_east, ray_west
@@ -301,6 +319,7 @@ class SpotDiagram(BaseAnalysis):
                 Px=0,
                 Py=0,
                 wavelength=wavelength,
+                record="none",
             )
             chief_ray_cosines_list.append(
                 be.array([ray_chief.L, ray_chief.M, ray_chief.N]).ravel(),
@@ -327,6 +346,7 @@ class SpotDiagram(BaseAnalysis):
                 Px=0,
                 Py=0,
                 wavelength=wavelength,
+                record="none",
             )
             x, y = ray_chief.x, ray_chief.y
             chief_ray_centers.append([x, y])
@@ -467,24 +487,42 @@ class SpotDiagram(BaseAnalysis):
             data (List): A nested list of spot intersection data for each
                 field and wavelength.
         """
-        data = []
-        # Access attributes from self
-        for field in self.fields:
-            field_data = []
-            for (
-                wavelength
-            ) in self.wavelengths:  # self.wavelengths is set by BaseAnalysis
-                field_data.append(
-                    self._generate_field_data(
-                        field,
-                        wavelength,
-                        self.num_rings,  # Use self.num_rings
-                        self.distribution,  # Use self.distribution
-                        self.coordinates,  # Use self.coordinates
-                    ),
-                )
-            data.append(field_data)
-        return data
+        if self.chunk_size is None and not self.is_parallel:
+            # trace all fields and wavelengths at once
+            batch = self.optic.trace_batch(
+                self.fields, self.wavelengths, self.num_rings, self.distribution
+            )
+            data = []
+            for f in range(len(self.fields)):
+                field_data = []
+                for w in range(len(self.wavelengths)):
+                    rays = batch[f, w]
+                    field_data.append(
+                        self._to_spot_data(
+                            rays.x, rays.y, rays.z, rays.i, self.coordinates
+                        )
+                    )
+                data.append(field_data)
+            return data
+
+        tasks = [
+            (
+                field,
+                wavelength,
+                self.num_rings,
+                self.distribution,
+                self.coordinates,
+            )
+            for field in self.fields
+            for wavelength in self.wavelengths
+        ]
+        results = self._map_tasks("_generate_field_data", tasks)
+
+        num_wavelengths = len(self.wavelengths)
+        return [
+            results[k : k + num_wavelengths]
+            for k in range(0, len(results), num_wavelengths)
+        ]
 
     def _generate_field_data(
         self,
@@ -510,7 +548,26 @@ class SpotDiagram(BaseAnalysis):
                 of the generated spot data.
 
         """
-        self.optic.trace(*field, wavelength, num_rays, distribution)
+        if self.chunk_size is not None:
+            chunks = [
+                self._to_spot_data(rays.x, rays.y, rays.z, rays.i, coordinates)
+                for rays in self.optic.trace_iter(
+                    *field,
+                    wavelength,
+                    num_rays,
+                    distribution,
+                    chunk_size=self.chunk_size,
+                )
+            ]
+            return SpotData(
+                x=be.concatenate([chunk.x for chunk in chunks]),
+                y=be.concatenate([chunk.y for chunk in chunks]),
+                intensity=be.concatenate([chunk.intensity for chunk in chunks]),
+            )
+
+        self.optic.trace(
+            *field, wavelength, num_rays, distribution, record="image_only"
+        )
 
         # Extract the global intersection coordinates from the image
         # surface (i.e. final surface)
@@ -520,6 +577,23 @@ class SpotDiagram(BaseAnalysis):
         z_global = self.optic.surface_group.z[-1, :]
         intensity = self.optic.surface_group.intensity[-1, :]
 
+        return self._to_spot_data(x_global, y_global, z_global, intensity, coordinates)
+
+    def _to_spot_data(self, x_global, y_global, z_global, intensity, coordinates):
+        """Converts image surface intersections to spot data.
+
+        Args:
+            x_global (be.ndarray): The global x-coordinates of the rays.
+            y_global (be.ndarray): The global y-coordinates of the rays.
+            z_global (be.ndarray): The global z-coordinates of the rays.
+            intensity (be.ndarray): The intensities of the rays.
+            coordinates (str): The coordinate system ('local' or 'global').
+
+        Returns:
+            SpotData: An object containing x, y, and intensity values
+                of the spot data.
+
+        """
         if coordinates == "local":
             # Now, convert the global coordinates to the image's local
             # coordinate system.
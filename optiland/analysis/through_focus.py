@@ -8,6 +8,7 @@ Kramer Harrison, 2025
 from abc import ABC, abstractmethod
 
 import optiland.backend as be
+from optiland.parallel import map_method
 
 
 class ThroughFocusAnalysis(ABC):
@@ -32,6 +33,11 @@ class ThroughFocusAnalysis(ABC):
             analysis. If "all", uses all wavelengths from
             `optic.wavelengths`. Otherwise, expects a list of
             wavelength values. Defaults to "all".
+        n_workers (int, optional): If given, the focal planes are analyzed in
+            this many worker processes. Defaults to None (serial).
+        executor (OpticExecutor, optional): An existing executor for the
+            optic, used to analyze the focal planes in parallel. Defaults to
+            None.
 
     Attributes:
         results (list): A list to store the results from the analysis performed
@@ -50,8 +56,13 @@ class ThroughFocusAnalysis(ABC):
         num_steps: int = 5,
         fields="all",
         wavelengths="all",
+        *,
+        n_workers=None,
+        executor=None,
     ):
         self.optic = optic
+        self.n_workers = n_workers
+        self.executor = executor
         self.delta_focus = delta_focus
         self._validate_num_steps(num_steps)
         self.num_steps = num_steps
@@ -138,8 +149,25 @@ class ThroughFocusAnalysis(ABC):
         to the optical system, and performs the specific analysis defined in
         `_perform_analysis_at_focus`. The results are stored in `self.results`.
         """
-        for position in self.positions:
-            self._defocus_image_plane(position)
-            result = self._perform_analysis_at_focus()
-            self.results.append(result)
-        self._reset_focus()
+        self.results = map_method(
+            self,
+            "_analysis_at_position",
+            [(position,) for position in self.positions],
+            self.n_workers,
+            self.executor,
+        )
+
+    def _analysis_at_position(self, z_position):
+        """Performs the analysis with the image plane at the given position.
+
+        Args:
+            z_position (float): The z-coordinate of the image surface.
+
+        Returns:
+            Any: The result of the analysis at the focal position.
+        """
+        self._defocus_image_plane(z_position)
+        try:
+            return self._perform_analysis_at_focus()
+        finally:
+            self._reset_focus()
@@ -55,6 +55,9 @@ class ThroughFocusSpotDiagram(ThroughFocusAnalysis):
         num_rings: int = 6,
         distribution: str = "hexapolar",
         coordinates: Literal["global", "local"] = "local",
+        *,
+        n_workers: int = None,
+        executor=None,
     ):
         """Initializes the ThroughFocusSpotDiagram analysis.
 
@@ -81,6 +84,11 @@ class ThroughFocusSpotDiagram(ThroughFocusAnalysis):
             coordinates (Literal["global", "local"], optional): Coordinate
                 system for spot data generation in `SpotDiagram`.
                 Defaults to "local".
+            n_workers (int, optional): If given, the focal planes are
+                analyzed in this many worker processes. Defaults to None.
+            executor (OpticExecutor, optional): An existing executor for the
+                optic, used to analyze the focal planes in parallel.
+                Defaults to None.
         """
         self.num_rings = num_rings
         self.distribution = distribution
@@ -94,6 +102,8 @@ class ThroughFocusSpotDiagram(ThroughFocusAnalysis):
             num_steps=num_steps,
             fields=fields,
             wavelengths=wavelengths,
+            n_workers=n_workers,
+            executor=executor,
         )
 
     def _perform_analysis_at_focus(self):
@@ -9,8 +9,10 @@ the input provided is the diameter of the stop surface.
 Kramer Harrison, 2024
 """
 
+from optiland.revision import RevisionMixin
 
-class Aperture:
+
+class Aperture(RevisionMixin):
     """Represents an aperture used in optics.
 
     Attributes:
@@ -25,6 +27,9 @@ class Aperture:
             or 'objectNA', or if the aperture type is 'EPD' or 'imageFNO'
             and the lens is telecentric in object space.
 
+    Note:
+        The aperture keeps a revision of its parameters, see `RevisionMixin`.
+
     """
 
     def __init__(self, aperture_type, value, object_space_telecentric=False):
@@ -13,7 +13,12 @@ Kramer Harrison, 2025
 import numpy as _np
 
 from optiland.backend import numpy_backend
-from optiland.backend.utils import to_numpy  # noqa: F401
+from optiland.backend.utils import (  # noqa: F401
+    AutodiffUnsupportedError,
+    backend_key,
+    to_numpy,
+    unique_wavelengths,
+)
 
 try:
     import torch as _torch
@@ -98,6 +98,13 @@ def batched_chain_matmul3(a, b, c):
     return np.matmul(np.matmul(a.astype(dtype), b.astype(dtype)), c.astype(dtype))
 
 
+def masked_assign(x, mask, values):
+    """Return a copy of x with the masked elements replaced by values."""
+    out = np.array(x, copy=True)
+    out[mask] = values
+    return out
+
+
 def factorial(n):
     return gamma(n + 1)
 
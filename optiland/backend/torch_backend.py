@@ -26,6 +26,8 @@ import numpy as np
 import torch
 import torch.nn.functional as F
 
+from optiland.backend.utils import AutodiffUnsupportedError
+
 _lib = torch  # Alias for torch library
 
 
@@ -113,6 +115,9 @@ def array(x):
     """Create a tensor with current device, precision, and grad settings."""
     if isinstance(x, torch.Tensor):
         return x
+    if isinstance(x, (list, tuple)) and any(_requires_grad(item) for item in x):
+        # stack the items, as torch.tensor would detach them from the graph
+        return torch.stack([_list_item(item) for item in x])
     return torch.tensor(
         x,
         device=get_device(),
@@ -121,6 +126,23 @@ def array(x):
     )
 
 
+def _list_item(x):
+    """Convert a list item to a tensor. Like torch.tensor, single-element
+    tensors are taken as scalars."""
+    if isinstance(x, torch.Tensor) and x.numel() == 1:
+        return cast(x).reshape(())
+    return cast(array(x))
+
+
+def _requires_grad(x):
+    """Check whether a tensor, or any tensor in a nested list, requires grad."""
+    if isinstance(x, torch.Tensor):
+        return x.requires_grad
+    if isinstance(x, (list, tuple)):
+        return any(_requires_grad(item) for item in x)
+    return False
+
+
 def zeros(shape):
     return torch.zeros(
         shape,
@@ -130,6 +152,14 @@ def zeros(shape):
     )
 
 
+def empty(shape):
+    return torch.empty(
+        shape,
+        device=get_device(),
+        dtype=get_precision(),
+    )
+
+
 def ones(shape):
     return torch.ones(
         shape,
@@ -140,6 +170,9 @@ def ones(shape):
 
 
 def full(shape, fill_value):
+    if _requires_grad(fill_value):
+        # keep the fill value in the graph
+        return zeros(shape) + cast(fill_value)
     return torch.full(
         shape,
         fill_value,
@@ -204,6 +237,9 @@ def ones_like(x):
 
 def full_like(x, fill_value):
     x_t = array(x)
+    if _requires_grad(fill_value):
+        # keep the fill value in the graph
+        return zeros_like(x_t) + cast(fill_value)
     val = fill_value.item() if isinstance(fill_value, torch.Tensor) else fill_value
     return torch.full_like(
         x_t,
@@ -404,6 +440,10 @@ def factorial(n):
     return torch.lgamma(array(n + 1)).exp()
 
 
+def flatnonzero(x):
+    return torch.nonzero(torch.ravel(x), as_tuple=True)[0]
+
+
 # --------------------------
 # Linear Algebra
 # --------------------------
@@ -417,6 +457,18 @@ def batched_chain_matmul3(a, b, c):
     return torch.matmul(torch.matmul(a.to(dtype), b.to(dtype)), c.to(dtype))
 
 
+def masked_assign(x, mask, values):
+    """Return a copy of x with the masked elements replaced by values.
+
+    As in NumPy, a mask with fewer dimensions than x selects along the
+    leading dimensions of x.
+    """
+    if mask.dim() < x.dim():
+        mask = mask.reshape(mask.shape + (1,) * (x.dim() - mask.dim()))
+        mask = mask.expand_as(x)
+    return x.masked_scatter(mask, values.to(x.dtype))
+
+
 def cross(a, b):
     return torch.linalg.cross(a, b)
 
@@ -590,6 +642,76 @@ def path_contains_points(
     return inside
 
 
+# --------------------------
+# Automatic Differentiation
+# --------------------------
+def jacobian(fun, x):
+    """Jacobian of a function by reverse-mode automatic differentiation.
+
+    The function is evaluated once, and the rows of the Jacobian are obtained
+    by a batched backward pass through the recorded graph. If an operation
+    does not support batched gradients, the rows are backpropagated one at a
+    time instead.
+
+    Args:
+        fun (callable): Function mapping a 1D tensor to a tensor.
+        x (array-like): The point at which the Jacobian is evaluated.
+
+    Returns:
+        torch.Tensor: The Jacobian, with shape fun(x).shape + x.shape. Outputs
+            that do not depend on x have zero derivatives.
+
+    Raises:
+        AutodiffUnsupportedError: If no output of the function is connected
+            to x in the autograd graph, or if the graph cannot be
+            backpropagated.
+    """
+    x = cast(x).detach().requires_grad_(True)
+    with torch.enable_grad():
+        y = fun(x)
+    if not isinstance(y, torch.Tensor) or (y.grad_fn is None and y is not x):
+        raise AutodiffUnsupportedError(
+            "The output of the function is not connected to its input in the "
+            "autograd graph."
+        )
+
+    rows = y.reshape(-1)
+    try:
+        eye = torch.eye(rows.numel(), dtype=rows.dtype, device=rows.device)
+        (jac,) = torch.autograd.grad(
+            rows,
+            x,
+            eye,
+            retain_graph=True,
+            is_grads_batched=True,
+            allow_unused=True,
+        )
+    except RuntimeError:
+        try:
+            grads = [_row_gradient(row, x) for row in rows]
+        except RuntimeError as error:
+            raise AutodiffUnsupportedError(str(error)) from error
+        jac = None
+        if any(grad is not None for grad in grads):
+            jac = torch.stack(
+                [torch.zeros_like(x) if grad is None else grad for grad in grads]
+            )
+    if jac is None:
+        raise AutodiffUnsupportedError(
+            "The output of the function does not depend on its input in the "
+            "autograd graph."
+        )
+    return jac.reshape(y.shape + x.shape).detach()
+
+
+def _row_gradient(row, x):
+    """Gradient of one output of a recorded graph, or None if unconnected."""
+    if row.grad_fn is None:
+        return None
+    (grad,) = torch.autograd.grad(row, x, retain_graph=True, allow_unused=True)
+    return grad
+
+
 # --------------------------
 # Exported Symbols
 # --------------------------
@@ -668,4 +790,6 @@ __all__ = [
     "eye",
     # Error State
     "errstate",
+    # Automatic Differentiation
+    "jacobian",
 ]
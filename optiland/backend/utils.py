@@ -12,6 +12,10 @@ import importlib
 import numpy as np
 
 
+class AutodiffUnsupportedError(RuntimeError):
+    """Raised if a function cannot be differentiated by autodiff."""
+
+
 # Conversion functions for backends
 def torch_to_numpy(obj):
     if importlib.util.find_spec("torch"):
@@ -62,3 +66,33 @@ def to_numpy(obj):
         except TypeError:
             continue
     raise TypeError(f"Unsupported object type: {type(obj)}")
+
+
+def unique_wavelengths(wavelength):
+    """Find the distinct values of an array of wavelengths.
+
+    Args:
+        wavelength (be.ndarray): The wavelengths in microns.
+
+    Returns:
+        tuple: The distinct wavelengths as a list of floats, and the index of
+            each wavelength into this list. The index is None if all
+            wavelengths are equal.
+
+    """
+    w = np.ravel(to_numpy(wavelength))
+    if w.size == 0:
+        return [], None
+    if w.min() == w.max():
+        return [float(w[0])], None
+    values, inverse = np.unique(w, return_inverse=True)
+    return [float(v) for v in values], inverse
+
+
+def backend_key():
+    """Returns a key identifying the current backend and its precision."""
+    import optiland.backend as be
+
+    if be.get_backend() == "torch":
+        return "torch", str(be.get_precision())
+    return be.get_backend(), None
@@ -11,9 +11,10 @@ import optiland.backend as be
 from optiland.jones import JonesFresnel
 from optiland.materials import BaseMaterial
 from optiland.rays import RealRays
+from optiland.revision import RevisionMixin
 
 
-class BaseCoating(ABC):
+class BaseCoating(RevisionMixin, ABC):
     """Base class for coatings.
 
     This class defines the basic structure and behavior of a coating.
@@ -13,9 +13,15 @@ from scipy.spatial.transform import Rotation as R
 
 import optiland.backend as be
 from optiland.rays import RealRays
+from optiland.revision import RevisionMixin
 
 
-class CoordinateSystem:
+def _scalar(value):
+    """Converts a scalar or single-element array to a 0-d array."""
+    return be.reshape(be.array(value), ())
+
+
+class CoordinateSystem(RevisionMixin):
     """Represents a coordinate system in 3D space.
 
     Args:
@@ -48,6 +54,8 @@ class CoordinateSystem:
         rz: float = 0,
         reference_cs: "CoordinateSystem" = None,
     ):
+        self._transform_cache = None
+
         self.x = be.array(x)
         self.y = be.array(y)
         self.z = be.array(z)
@@ -64,9 +72,41 @@ class CoordinateSystem:
         Args:
             rays (RealRays): The rays to be localized.
 
+        """
+        if not isinstance(rays, RealRays):
+            self._localize_sequential(rays)
+            return
+
+        rotation, translation = self._get_transform()
+        rays.translate(-translation[0], -translation[1], -translation[2])
+        if rotation is not None:
+            self._rotate(rays, rotation.T)
+
+    def globalize(self, rays):
+        """Globalizes the rays from the coordinate system.
+
+        Args:
+            rays (RealRays): The rays to be globalized.
+
+        """
+        if not isinstance(rays, RealRays):
+            self._globalize_sequential(rays)
+            return
+
+        rotation, translation = self._get_transform()
+        if rotation is not None:
+            self._rotate(rays, rotation)
+        rays.translate(translation[0], translation[1], translation[2])
+
+    def _localize_sequential(self, rays):
+        """Localizes the rays by applying each elementary transformation.
+
+        Args:
+            rays (BaseRays): The rays to be localized.
+
         """
         if self.reference_cs:
-            self.reference_cs.localize(rays)
+            self.reference_cs._localize_sequential(rays)
 
         rays.translate(-self.x, -self.y, -self.z)
         if self.rz:
@@ -76,11 +116,11 @@ class CoordinateSystem:
         if self.rx:
             rays.rotate_x(-self.rx)
 
-    def globalize(self, rays):
-        """Globalizes the rays from the coordinate system.
+    def _globalize_sequential(self, rays):
+        """Globalizes the rays by applying each elementary transformation.
 
         Args:
-            rays (RealRays): The rays to be globalized.
+            rays (BaseRays): The rays to be globalized.
 
         """
         if self.rx:
@@ -92,7 +132,109 @@ class CoordinateSystem:
         rays.translate(self.x, self.y, self.z)
 
         if self.reference_cs:
-            self.reference_cs.globalize(rays)
+            self.reference_cs._globalize_sequential(rays)
+
+    @staticmethod
+    def _rotate(rays, rotation):
+        """Rotates the ray positions and directions with a single matmul.
+
+        Args:
+            rays (RealRays): The rays to be rotated.
+            rotation (be.ndarray): The 3x3 rotation matrix.
+
+        """
+        vectors = be.stack(
+            [
+                be.stack([rays.x, rays.y, rays.z]),
+                be.stack([rays.L, rays.M, rays.N]),
+            ]
+        )
+        rotated = be.matmul(rotation, vectors)
+        rays.x, rays.y, rays.z = rotated[0]
+        rays.L, rays.M, rays.N = rotated[1]
+
+    def _chain(self):
+        """Returns the coordinate systems from this one up to the global one."""
+        chain = []
+        cs = self
+        while cs is not None:
+            chain.append(cs)
+            cs = cs.reference_cs
+        return chain
+
+    def _get_transform(self):
+        """Get the effective rotation and translation to the global system.
+
+        The transform includes the reference coordinate systems and is cached
+        until the position, rotation or reference of any coordinate system in
+        the chain changes. A point p in this coordinate system is at
+        `rotation @ p + translation` in the global coordinate system. The
+        rotation is None if no coordinate system in the chain is rotated.
+
+        Returns:
+            tuple: The effective rotation matrix (or None) and translation.
+
+        """
+        chain = self._chain()
+        key = tuple((id(cs), cs._revision) for cs in chain)
+        cache = self._transform_cache
+        if cache is not None and cache[0] == key:
+            return cache[1], cache[2]
+
+        rotation = self._local_rotation() if self._is_rotated() else None
+        translation = self._translation()
+        for cs in chain[1:]:
+            if cs._is_rotated():
+                cs_rotation = cs._local_rotation()
+                translation = be.matmul(cs_rotation, translation)
+                rotation = (
+                    cs_rotation
+                    if rotation is None
+                    else be.matmul(cs_rotation, rotation)
+                )
+            translation = translation + cs._translation()
+
+        # do not keep gradient history alive between traces
+        if not any(
+            getattr(v, "requires_grad", False)
+            for cs in chain
+            for v in (cs.x, cs.y, cs.z, cs.rx, cs.ry, cs.rz)
+        ):
+            self._transform_cache = (key, rotation, translation)
+        return rotation, translation
+
+    def _translation(self):
+        """Returns the local translation as a vector of length 3."""
+        return be.stack([_scalar(v) for v in (self.x, self.y, self.z)])
+
+    def _is_rotated(self):
+        """Returns True if any rotation angle is nonzero."""
+        return bool(self.rx) or bool(self.ry) or bool(self.rz)
+
+    def _local_rotation(self):
+        """Get the rotation matrix of this coordinate system, Rz @ Ry @ Rx.
+
+        Unlike `get_rotation_matrix`, the matrix is built from the angle
+        arrays directly, so that gradients propagate through it.
+
+        Returns:
+            be.ndarray: The 3x3 rotation matrix.
+
+        """
+        rx, ry, rz = (_scalar(v) for v in (self.rx, self.ry, self.rz))
+        zero = be.zeros_like(rx)
+        one = be.ones_like(rx)
+
+        def matrix(rows):
+            return be.stack([be.stack(row) for row in rows])
+
+        cx, sx = be.cos(rx), be.sin(rx)
+        cy, sy = be.cos(ry), be.sin(ry)
+        cz, sz = be.cos(rz), be.sin(rz)
+        Rx = matrix([[one, zero, zero], [zero, cx, -sx], [zero, sx, cx]])
+        Ry = matrix([[cy, zero, sy], [zero, one, zero], [-sy, zero, cy]])
+        Rz = matrix([[cz, -sz, zero], [sz, cz, zero], [zero, zero, one]])
+        return be.matmul(Rz, be.matmul(Ry, Rx))
 
     @property
     def position_in_gcs(self):
@@ -7,9 +7,10 @@ Kramer Harrison, 2023
 """
 
 import optiland.backend as be
+from optiland.revision import RevisionMixin
 
 
-class Field:
+class Field(RevisionMixin):
     """Represents a field with specific properties.
 
     Attributes:
@@ -19,6 +20,9 @@ class Field:
         vx (float): The vignette factor in the x-direction.
         vy (float): The vignette factor in the y-direction.
 
+    Note:
+        The field keeps a revision of its parameters, see `RevisionMixin`.
+
     """
 
     def __init__(
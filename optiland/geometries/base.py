@@ -8,13 +8,18 @@ Kramer Harrison, 2024
 
 from abc import ABC, abstractmethod
 
+from optiland.revision import RevisionMixin
 
-class BaseGeometry(ABC):
+
+class BaseGeometry(RevisionMixin, ABC):
     """Base geometry for all geometries.
 
     Args:
         cs (CoordinateSystem): The coordinate system of the geometry.
 
+    Note:
+        The geometry keeps a revision of its parameters, see `RevisionMixin`.
+
     """
 
     _registry = {}
@@ -155,6 +155,39 @@ class BiconicGeometry(NewtonRaphsonGeometry):
 
         return nx, ny, nz
 
+    def _analytic_distance(self, rays):
+        """Calculates the distance to the geometry in closed form for the
+        biconic surfaces that are quadrics: cylinders, where one of the
+        curvatures is zero, and paraboloids, where both conic constants are -1.
+
+        Args:
+            rays (RealRays): The rays used for calculating distance.
+
+        Returns:
+            be.ndarray or None: The distance for each ray, with NaN for rays
+            that miss the surface, or None if the surface is not a quadric.
+        """
+        if be.all(self.cy == 0):
+            return self._quadric_distance(rays, self.cx, 0.0, (1 + self.kx) * self.cx)
+        if be.all(self.cx == 0):
+            return self._quadric_distance(rays, 0.0, self.cy, (1 + self.ky) * self.cy)
+        if be.all(self.kx == -1) and be.all(self.ky == -1):
+            return self._quadric_distance(rays, self.cx, self.cy, 0.0)
+        return None
+
+    def _intersection(self, rays):
+        """Calculates the starting points of the Newton-Raphson iteration on
+        the paraboloid with the vertex curvatures of the surface.
+
+        Args:
+            rays (RealRays): The rays to calculate the intersection points for.
+
+        Returns:
+            tuple[be.ndarray, be.ndarray, be.ndarray]: The x, y, and z
+            coordinates of the initial intersection points.
+        """
+        return self._paraboloid_intersection(rays, self.cx, self.cy)
+
     def flip(self):
         """Flip the geometry.
 
@@ -118,25 +118,20 @@ class ChebyshevPolynomialGeometry(NewtonRaphsonGeometry):
         r2 = x**2 + y**2
         z = r2 / (self.radius * (1 + be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)))
 
-        non_zero_indices = be.argwhere(self.c != 0)
-        for i, j in non_zero_indices:
-            z = z + self.c[i, j] * self._chebyshev(i, x_norm) * self._chebyshev(
-                j, y_norm
-            )
-
-        return z
+        tx = self._chebyshev_basis(x_norm, self.c.shape[0])[0]
+        ty = self._chebyshev_basis(y_norm, self.c.shape[1])[0]
+        return z + be.sum(tx * self._contract(ty), axis=-1)
 
-    def _surface_normal(self, x, y):
-        """Calculates the surface normal of the Chebyshev polynomial surface at
-        the given x and y position.
+    def _sag_and_normal(self, x, y):
+        """Calculates the sag and the surface normal of the Chebyshev
+        polynomial surface at the given x and y position.
 
         Args:
-            x (be.ndarray): The x-coordinate(s) at which to calculate the normal.
-            y (be.ndarray): The y-coordinate(s) at which to calculate the normal.
+            x (be.ndarray): The x-coordinate(s).
+            y (be.ndarray): The y-coordinate(s).
 
         Returns:
-            tuple[be.ndarray, be.ndarray, be.ndarray]: The surface normal
-            components (nx, ny, nz).
+            tuple: The sag and the surface normal components (nx, ny, nz).
 
         """
         x_norm = x / self.norm_x
@@ -145,59 +140,78 @@ class ChebyshevPolynomialGeometry(NewtonRaphsonGeometry):
         self._validate_inputs(x_norm, y_norm)
 
         r2 = x**2 + y**2
-        denom = self.radius * be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
-        dzdx = x / denom
-        dzdy = y / denom
-
-        non_zero_indices = be.argwhere(self.c != 0)
-        for i, j in non_zero_indices:
-            dzdx = dzdx + (
-                self._chebyshev_derivative(i, x_norm)
-                * self.c[i, j]
-                * self._chebyshev(j, y_norm)
-            )
-            dzdy = dzdy + (
-                self._chebyshev_derivative(j, y_norm)
-                * self.c[i, j]
-                * self._chebyshev(i, x_norm)
-            )
+        root = be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
+        z = r2 / (self.radius * (1 + root))
+        dzdx = x / (self.radius * root)
+        dzdy = y / (self.radius * root)
+
+        # The polynomial derivatives are taken with respect to the normalized
+        # coordinates.
+        tx, dtx = self._chebyshev_basis(x_norm, self.c.shape[0], derivative=True)
+        ty, dty = self._chebyshev_basis(y_norm, self.c.shape[1], derivative=True)
+        c_ty = self._contract(ty)
+        z = z + be.sum(tx * c_ty, axis=-1)
+        dzdx = dzdx + be.sum(dtx * c_ty, axis=-1)
+        dzdy = dzdy + be.sum(tx * self._contract(dty), axis=-1)
+
+        return z, self._normal_from_gradient(dzdx, dzdy)
+
+    def _surface_normal(self, x, y):
+        """Calculates the surface normal of the Chebyshev polynomial surface at
+        the given x and y position.
+
+        Args:
+            x (be.ndarray): The x-coordinate(s) at which to calculate the normal.
+            y (be.ndarray): The y-coordinate(s) at which to calculate the normal.
 
-        norm = be.sqrt(dzdx**2 + dzdy**2 + 1)
-        nx = dzdx / norm
-        ny = dzdy / norm
-        nz = -1 / norm
+        Returns:
+            tuple[be.ndarray, be.ndarray, be.ndarray]: The surface normal
+            components (nx, ny, nz).
 
-        return nx, ny, nz
+        """
+        return self._sag_and_normal(x, y)[1]
 
-    def _chebyshev(self, n, x):
-        """Calculates the Chebyshev polynomial of the first kind of degree n at
-        the given x value.
+    def _contract(self, ty):
+        """Contracts the coefficient matrix with the Chebyshev polynomials in y.
 
         Args:
-            n (int): The degree of the Chebyshev polynomial.
-            x (be.ndarray or float): The coordinate value(s) (normalized).
+            ty (be.ndarray): The polynomials T_j(y) (or their derivatives),
+                stacked along the last axis.
 
         Returns:
-            be.ndarray or float: The Chebyshev polynomial T_n(x).
+            be.ndarray: The sums sum_j(Cij * T_j(y)), stacked along the last
+            axis by i.
 
         """
-        return be.cos(n * be.arccos(x))
+        return be.matmul(ty, self.c.T)
 
-    def _chebyshev_derivative(self, n, x):
-        """Calculates the derivative of the Chebyshev polynomial of the first kind
-        of degree n at the given x value.
+    @staticmethod
+    def _chebyshev_basis(x, num_terms, derivative=False):
+        """Calculates the Chebyshev polynomials of the first kind T_0 to
+        T_(num_terms - 1) with the three-term recurrence
+        T_(n+1)(x) = 2 * x * T_n(x) - T_(n-1)(x).
 
         Args:
-            n (int): The degree of the Chebyshev polynomial.
             x (be.ndarray or float): The coordinate value(s) (normalized).
+            num_terms (int): The number of polynomials.
+            derivative (bool, optional): Whether to also calculate the
+                derivatives of the polynomials with respect to x. Defaults to
+                False.
 
         Returns:
-            be.ndarray or float: The derivative of the Chebyshev polynomial T_n(x)
-            with respect to x, scaled by 1/norm_factor if applicable
-            (handled by caller). Returns 0 for n=0.
+            tuple: The polynomials stacked along the last axis, and their
+            derivatives, or None if derivative is False.
 
         """
-        return n * be.sin(n * be.arccos(x)) / be.sqrt(1 - x**2)
+        t = [be.ones_like(x), x]
+        dt = [be.zeros_like(x), be.ones_like(x)]
+        for n in range(2, num_terms):
+            t.append(2 * x * t[n - 1] - t[n - 2])
+            if derivative:
+                dt.append(2 * t[n - 1] + 2 * x * dt[n - 1] - dt[n - 2])
+
+        t = be.stack(t, axis=-1)[..., :num_terms]
+        return t, be.stack(dt, axis=-1)[..., :num_terms] if derivative else None
 
     def _validate_inputs(self, x_norm, y_norm):
         """Validates the input coordinates for the Chebyshev polynomial surface.
@@ -20,6 +20,7 @@ Kramer Harrison, 2024
 
 import optiland.backend as be
 from optiland.coordinate_system import CoordinateSystem
+from optiland.geometries.horner import polyval, polyval_with_derivative
 from optiland.geometries.newton_raphson import NewtonRaphsonGeometry
 
 
@@ -90,10 +91,49 @@ class EvenAsphere(NewtonRaphsonGeometry):
         """
         r2 = x**2 + y**2
         z = r2 / (self.radius * (1 + be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)))
-        for i, Ci in enumerate(self.c):
-            z = z + Ci * r2 ** (i + 1)
+        return z + r2 * polyval(self.c, r2)
 
-        return z
+    def _sag_and_gradient(self, x, y):
+        """Calculates the sag of the asphere and its partial derivatives.
+
+        The aspheric terms are evaluated with Horner's scheme in r^2, and r^2
+        and the square root of the conic term are shared between the sag and
+        the derivatives.
+
+        Args:
+            x (be.ndarray): The x-coordinate(s).
+            y (be.ndarray): The y-coordinate(s).
+
+        Returns:
+            tuple[be.ndarray, be.ndarray, be.ndarray]: The sag and its
+            derivatives with respect to x and y.
+
+        """
+        r2 = x**2 + y**2
+        root = be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
+        z = r2 / (self.radius * (1 + root))
+        dz_dr2 = 1 / (2 * self.radius * root)
+
+        # aspheric terms: r2 * p(r2), with p(r2) = sum(Ci * r2^(i-1))
+        p, dp = polyval_with_derivative(self.c, r2)
+        z = z + r2 * p
+        dz_dr2 = dz_dr2 + p + r2 * dp
+
+        return z, 2 * x * dz_dr2, 2 * y * dz_dr2
+
+    def _sag_and_normal(self, x, y):
+        """Calculates the sag and the surface normal of the asphere.
+
+        Args:
+            x (be.ndarray): The x-coordinate(s).
+            y (be.ndarray): The y-coordinate(s).
+
+        Returns:
+            tuple: The sag and the surface normal components (nx, ny, nz).
+
+        """
+        z, dzdx, dzdy = self._sag_and_gradient(x, y)
+        return z, self._normal_from_gradient(dzdx, dzdy)
 
     def _surface_normal(self, x, y):
         """Calculates the surface normal of the asphere at the given x and y
@@ -108,23 +148,7 @@ class EvenAsphere(NewtonRaphsonGeometry):
             components (nx, ny, nz).
 
         """
-        r2 = x**2 + y**2
-
-        denom = self.radius * be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
-        dfdx = x / denom
-        dfdy = y / denom
-
-        for i, Ci in enumerate(self.c):
-            dfdx = dfdx + 2 * (i + 1) * x * Ci * r2**i
-            dfdy = dfdy + 2 * (i + 1) * y * Ci * r2**i
-
-        mag = be.sqrt(dfdx**2 + dfdy**2 + 1)
-
-        nx = dfdx / mag
-        ny = dfdy / mag
-        nz = -1 / mag
-
-        return nx, ny, nz
+        return self._sag_and_normal(x, y)[1]
 
     def to_dict(self):
         """Converts the geometry to a dictionary.
@@ -0,0 +1,95 @@
+"""Horner
+
+This module contains functions to evaluate polynomials and their derivatives
+with Horner's scheme. They are shared by the geometries defined by power
+series, such as the even and odd aspheres and the XY polynomial surfaces.
+Compared to summing the terms one by one, Horner's scheme needs no explicit
+powers of the coordinates, and the derivatives are obtained in the same pass
+as the polynomial values.
+
+Kramer Harrison, 2025
+"""
+
+
+def polyval(c, t):
+    """Evaluates a polynomial in one variable.
+
+    Args:
+        c (list or be.ndarray): The coefficients in increasing order of
+            power, i.e. the polynomial is sum(c[i] * t^i).
+        t (float or be.ndarray): The variable.
+
+    Returns:
+        float or be.ndarray: The polynomial value(s). This is 0 if there are
+        no coefficients.
+
+    """
+    p = 0
+    for k in range(len(c) - 1, -1, -1):
+        p = p * t + c[k]
+    return p
+
+
+def polyval_with_derivative(c, t):
+    """Evaluates a polynomial in one variable and its derivative.
+
+    Args:
+        c (list or be.ndarray): The coefficients in increasing order of
+            power, i.e. the polynomial is sum(c[i] * t^i).
+        t (float or be.ndarray): The variable.
+
+    Returns:
+        tuple: The polynomial value(s) and the derivative(s) with respect to
+        t.
+
+    """
+    p = 0
+    dp = 0
+    for k in range(len(c) - 1, -1, -1):
+        dp = dp * t + p
+        p = p * t + c[k]
+    return p, dp
+
+
+def polyval2d(c, x, y):
+    """Evaluates a polynomial in two variables.
+
+    Args:
+        c (list[list] or be.ndarray): The 2D coefficients, where c[i][j] is
+            the coefficient of x^i * y^j.
+        x (float or be.ndarray): The first variable.
+        y (float or be.ndarray): The second variable.
+
+    Returns:
+        float or be.ndarray: The polynomial value(s).
+
+    """
+    p = 0
+    for i in range(len(c) - 1, -1, -1):
+        p = p * x + polyval(c[i], y)
+    return p
+
+
+def polyval2d_with_gradient(c, x, y):
+    """Evaluates a polynomial in two variables and its partial derivatives.
+
+    Args:
+        c (list[list] or be.ndarray): The 2D coefficients, where c[i][j] is
+            the coefficient of x^i * y^j.
+        x (float or be.ndarray): The first variable.
+        y (float or be.ndarray): The second variable.
+
+    Returns:
+        tuple: The polynomial value(s) and the partial derivatives with
+        respect to x and y.
+
+    """
+    p = 0
+    dp_dx = 0
+    dp_dy = 0
+    for i in range(len(c) - 1, -1, -1):
+        q, dq_dy = polyval_with_derivative(c[i], y)
+        dp_dx = dp_dx * x + p
+        dp_dy = dp_dy * x + dq_dy
+        p = p * x + q
+    return p, dp_dx, dp_dy
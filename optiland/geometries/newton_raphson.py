@@ -41,6 +41,21 @@ def _is_radius_infinite(radius):
 class NewtonRaphsonGeometry(StandardGeometry, ABC):
     """Represents a geometry that uses the Newton-Raphson method for ray tracing.
 
+    The intersection is found with Newton steps on the propagation distance
+    along each ray, using the surface slope given by `_surface_normal`. Only
+    the rays that have not yet converged are re-evaluated at each iteration.
+    After each call to `distance`, the per-ray number of iterations and the
+    mask of rays for which the iteration failed are available as
+    `iterations` and `failed`. Subclasses can bypass the iteration for
+    configurations with a closed-form intersection by overriding
+    `_analytic_distance`, in which case `failed` flags the rays that miss the
+    surface.
+
+    If `warm_start` is set to True, the iteration starts from the
+    intersection points of the previous call instead of the base sphere,
+    provided the number of rays is unchanged. This speeds up repeated traces
+    of similar rays, e.g. during optimization.
+
     Args:
         coordinate_system (CoordinateSystem): The coordinate system of the geometry.
         radius (float): The radius of curvature of the base sphere.
@@ -53,11 +68,18 @@ class NewtonRaphsonGeometry(StandardGeometry, ABC):
 
     """
 
+    _trace_attributes = frozenset({"iterations", "failed"})
+
     def __init__(self, coordinate_system, radius, conic=0.0, tol=1e-10, max_iter=100):
         super().__init__(coordinate_system, radius, conic)
         self.tol = tol
         self.max_iter = max_iter
 
+        self.warm_start = False
+        self.iterations = None
+        self.failed = None
+        self._last_intersection = None
+
     def __str__(self):
         return "Newton Raphson"  # pragma: no cover
 
@@ -100,6 +122,40 @@ class NewtonRaphsonGeometry(StandardGeometry, ABC):
         """
         # pragma: no cover
 
+    def _sag_and_normal(self, x, y):
+        """Calculate the surface sag and normal at the given x and y position.
+
+        This is used at each Newton-Raphson iteration. Subclasses can
+        override it to share intermediate results between the sag and the
+        normal.
+
+        Args:
+            x (be.ndarray): The x-coordinate(s).
+            y (be.ndarray): The y-coordinate(s).
+
+        Returns:
+            tuple: The surface sag and the surface normal components
+            (nx, ny, nz).
+
+        """
+        return self.sag(x, y), self._surface_normal(x, y)
+
+    @staticmethod
+    def _normal_from_gradient(dzdx, dzdy):
+        """Calculate the surface normal from the gradient of the sag.
+
+        Args:
+            dzdx (be.ndarray): The derivative of the sag with respect to x.
+            dzdy (be.ndarray): The derivative of the sag with respect to y.
+
+        Returns:
+            tuple[be.ndarray, be.ndarray, be.ndarray]: The surface normal
+            components (nx, ny, nz).
+
+        """
+        mag = be.sqrt(dzdx**2 + dzdy**2 + 1)
+        return dzdx / mag, dzdy / mag, -1 / mag
+
     def surface_normal(self, rays):
         """Calculates the surface normal of the geometry at the given rays.
 
@@ -125,24 +181,199 @@ class NewtonRaphsonGeometry(StandardGeometry, ABC):
             rays (RealRays): The rays used for calculating distance.
 
         Returns:
-            be.ndarray: An array of distances from each ray's current position
-            to its intersection point with the geometry.
+            be.ndarray: An array of signed distances from each ray's current
+            position to its intersection point with the geometry.
+
+        """
+        t = self._analytic_distance(rays)
+        if t is not None:
+            self.iterations = be.zeros_like(t)
+            self.failed = ~be.isfinite(t)
+            return t
+
+        t = self._initial_distance(rays)
+        t, self.iterations, self.failed = self._newton_raphson(rays, t)
+
+        if self.warm_start:
+            # stored without gradient history, as only a starting point
+            self._last_intersection = tuple(
+                be.array(be.to_numpy(p + t * d))
+                for p, d in zip((rays.x, rays.y, rays.z), (rays.L, rays.M, rays.N))
+            )
+        return t
+
+    def _analytic_distance(self, rays):
+        """Calculates the distance to the geometry in closed form, if possible.
+
+        Subclasses return the distance for configurations in which the
+        surface is a quadric, such as cylinders. Rays that miss the surface
+        get a distance of NaN.
+
+        Args:
+            rays (RealRays): The rays used for calculating distance.
+
+        Returns:
+            be.ndarray or None: The distance for each ray, or None if the
+            intersection must be found iteratively.
+        """
+        return None
+
+    def _quadric_distance(self, rays, cx, cy, e):
+        """Calculates the distance to the quadric
+        cx * x^2 + cy * y^2 - 2 * z + e * z^2 = 0.
+
+        Only the branch through the vertex, where e * z <= 1, is used. If a
+        ray crosses this branch twice, the intersection closest to z = 0 is
+        taken. With cy = 0 and e = (1 + k) * cx, this is the cylinder with
+        the conic profile of curvature cx and conic constant k, and with
+        e = 0 it is a paraboloid.
+
+        Args:
+            rays (RealRays): The rays used for calculating distance.
+            cx (float): The coefficient of x^2.
+            cy (float): The coefficient of y^2.
+            e (float): The coefficient of z^2.
+
+        Returns:
+            be.ndarray: The distance for each ray, or NaN where the ray misses
+            the quadric.
+        """
+        a = cx * rays.L**2 + cy * rays.M**2 + e * rays.N**2
+        b = 2 * (
+            cx * rays.x * rays.L + cy * rays.y * rays.M + (e * rays.z - 1) * rays.N
+        )
+        c = cx * rays.x**2 + cy * rays.y**2 + (e * rays.z - 2) * rays.z
+
+        # numerically stable roots, also valid for a = 0
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            q = -0.5 * (b + be.where(b < 0, -1.0, 1.0) * be.sqrt(b**2 - 4 * a * c))
+            t1 = q / a
+            t2 = c / q
+
+            z1 = rays.z + t1 * rays.N
+            z2 = rays.z + t2 * rays.N
+            valid1 = be.isfinite(t1) & (e * z1 <= 1)
+            valid2 = be.isfinite(t2) & (e * z2 <= 1)
+
+        t = be.where(valid2, t2, be.nan)
+        return be.where(valid1 & (~valid2 | (be.abs(z1) <= be.abs(z2))), t1, t)
+
+    def _paraboloid_intersection(self, rays, cx, cy):
+        """Calculates the intersection points of the rays with the paraboloid
+        z = (cx * x^2 + cy * y^2) / 2, or with the plane z = 0 for rays that
+        miss it.
+
+        This paraboloid has the vertex curvatures of the geometry, and is used
+        as the starting point of the iteration for anamorphic geometries.
+
+        Args:
+            rays (RealRays): The rays to calculate the intersection points for.
+            cx (float): The vertex curvature in x.
+            cy (float): The vertex curvature in y.
+
+        Returns:
+            tuple[be.ndarray, be.ndarray, be.ndarray]: The x, y, and z
+            coordinates of the intersection points.
+        """
+        t = self._quadric_distance(rays, cx, cy, 0.0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            t = be.where(be.isfinite(t), t, -rays.z / rays.N)
+
+        return rays.x + rays.L * t, rays.y + rays.M * t, rays.z + rays.N * t
+
+    def _initial_distance(self, rays):
+        """Calculates the starting distance of the Newton-Raphson iteration.
+
+        The distance to the base geometry (sphere or plane) is used, unless
+        a warm start from the previous intersection points is possible.
+
+        Args:
+            rays (RealRays): The rays used for calculating distance.
 
+        Returns:
+            be.ndarray: The initial distance for each ray.
         """
         x, y, z = self._intersection(rays)
-        intersections = be.column_stack((x, y, z))
-        ray_directions = be.column_stack((rays.L, rays.M, rays.N))
+        t = (x - rays.x) * rays.L + (y - rays.y) * rays.M + (z - rays.z) * rays.N
+
+        last = self._last_intersection
+        if self.warm_start and last is not None and be.size(last[0]) == be.size(t):
+            t_warm = (
+                (last[0] - rays.x) * rays.L
+                + (last[1] - rays.y) * rays.M
+                + (last[2] - rays.z) * rays.N
+            )
+            t = be.where(be.isfinite(t_warm), t_warm, t)
+        return t
+
+    def _newton_raphson(self, rays, t):
+        """Refines the distance to the geometry with Newton-Raphson steps.
+
+        The residual of each ray is the difference between the z-coordinate
+        of the point on the ray and the surface sag at that point. Its
+        derivative with respect to the distance follows from the surface
+        normal. Where the derivative is unusable, a z-only step is taken.
+        Once the residuals of a ray have taken both signs, the root is
+        bracketed, and steps that leave the bracket are replaced by
+        bisection.
+
+        Args:
+            rays (RealRays): The rays used for calculating distance.
+            t (be.ndarray): The initial distance for each ray.
+
+        Returns:
+            tuple[be.ndarray, be.ndarray, be.ndarray]: The distance, the
+            number of iterations and the failure mask of each ray.
+        """
+        iterations = be.zeros_like(t)
+        active = be.isfinite(t)
+        failed = ~active
+
+        # last distances with a positive and a negative residual
+        t_pos = be.full_like(t, be.nan)
+        t_neg = be.full_like(t, be.nan)
 
         for _ in range(self.max_iter):
-            z_surface = self.sag(intersections[:, 0], intersections[:, 1])
-            dz = intersections[:, 2] - z_surface
-            distance = dz / ray_directions[:, 2]
-            intersections = intersections - distance[:, None] * ray_directions
-            if be.max(be.abs(dz)) < self.tol:
+            if not be.any(active):
                 break
 
-        position = be.column_stack((rays.x, rays.y, rays.z))
-        return be.linalg.norm(intersections - position, axis=1)
+            L, M, N = rays.L[active], rays.M[active], rays.N[active]
+            t_active = t[active]
+            x = rays.x[active] + t_active * L
+            y = rays.y[active] + t_active * M
+            z = rays.z[active] + t_active * N
+
+            sag, (nx, ny, nz) = self._sag_and_normal(x, y)
+            residual = z - sag
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                derivative = (nx * L + ny * M + nz * N) / nz
+            usable = be.isfinite(derivative) & (be.abs(derivative) > self.tol)
+            derivative = be.where(usable, derivative, N)
+
+            t_pos_active = be.where(residual > 0, t_active, t_pos[active])
+            t_neg_active = be.where(residual < 0, t_active, t_neg[active])
+            t_pos = be.masked_assign(t_pos, active, t_pos_active)
+            t_neg = be.masked_assign(t_neg, active, t_neg_active)
+
+            t_active = t_active - residual / derivative
+            converged = be.abs(residual) < self.tol
+
+            lower = be.minimum(t_pos_active, t_neg_active)
+            upper = be.maximum(t_pos_active, t_neg_active)
+            inside = (t_active >= lower) & (t_active <= upper)
+            bisect = be.isfinite(lower) & be.isfinite(upper) & ~(inside | converged)
+            t_active = be.where(bisect, (lower + upper) / 2, t_active)
+            t = be.masked_assign(t, active, t_active)
+            iterations = iterations + active
+
+            diverged = ~be.isfinite(t_active)
+            failed = be.masked_assign(failed, active, diverged)
+            active = be.masked_assign(active, active, ~(converged | diverged))
+
+        return t, iterations, failed | active
 
     def _intersection_plane(self, rays):
         """Calculates the intersection points of the rays with a plane (z=0).
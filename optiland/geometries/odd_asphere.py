@@ -14,10 +14,9 @@ where
 Kramer Harrison, 2025
 """
 
-import warnings
-
 import optiland.backend as be
 from optiland.geometries.even_asphere import EvenAsphere
+from optiland.geometries.horner import polyval, polyval_with_derivative
 
 
 class OddAsphere(EvenAsphere):
@@ -82,47 +81,36 @@ class OddAsphere(EvenAsphere):
         r2 = be.array(x**2 + y**2)
         r = be.sqrt(r2)
         z = r2 / (self.radius * (1 + be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)))
-        for i, Ci in enumerate(self.c):
-            z = z + Ci * r ** (i + 1)
+        return z + r * polyval(self.c, r)
 
-        return z
+    def _sag_and_gradient(self, x, y):
+        """Calculates the sag of the asphere and its partial derivatives.
 
-    def _surface_normal(self, x, y):
-        """Calculates the surface normal of the asphere at the given x and y
-        position.
+        The aspheric terms are evaluated with Horner's scheme in r. At r = 0,
+        where the derivative of the r^1 term is undefined, the derivatives of
+        the aspheric terms are set to zero.
 
         Args:
-            x (be.ndarray): The x-coordinate(s) at which to calculate the normal.
-            y (be.ndarray): The y-coordinate(s) at which to calculate the normal.
+            x (be.ndarray): The x-coordinate(s).
+            y (be.ndarray): The y-coordinate(s).
 
         Returns:
-            tuple[be.ndarray, be.ndarray, be.ndarray]: The surface normal
-            components (nx, ny, nz).
+            tuple[be.ndarray, be.ndarray, be.ndarray]: The sag and its
+            derivatives with respect to x and y.
 
         """
         r2 = x**2 + y**2
         r = be.sqrt(r2)
-
-        denom = self.radius * be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
-        dfdx = x / denom
-        dfdy = y / denom
-
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            for i, Ci in enumerate(self.c):
-                x_term = (i + 1) * x * Ci * r ** (i - 1)
-                y_term = (i + 1) * y * Ci * r ** (i - 1)
-
-                x_term[~be.isfinite(x_term)] = 0
-                y_term[~be.isfinite(y_term)] = 0
-
-                dfdx = dfdx + x_term
-                dfdy = dfdy + y_term
-
-        mag = be.sqrt(dfdx**2 + dfdy**2 + 1)
-
-        nx = dfdx / mag
-        ny = dfdy / mag
-        nz = -1 / mag
-
-        return nx, ny, nz
+        root = be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
+        z = r2 / (self.radius * (1 + root))
+        dzdx = x / (self.radius * root)
+        dzdy = y / (self.radius * root)
+
+        # aspheric terms: r * p(r), with p(r) = sum(Ci * r^(i-1))
+        p, dp = polyval_with_derivative(self.c, r)
+        z = z + r * p
+
+        nonzero = r > 0
+        dz_dr_over_r = (p + r * dp) / be.where(nonzero, r, 1.0)
+        dz_dr_over_r = be.where(nonzero, dz_dr_over_r, 0.0)
+        return z, dzdx + x * dz_dr_over_r, dzdy + y * dz_dr_over_r
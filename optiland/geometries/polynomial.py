@@ -25,6 +25,7 @@ Kramer Harrison, 2024
 
 import optiland.backend as be
 from optiland.coordinate_system import CoordinateSystem
+from optiland.geometries.horner import polyval2d, polyval2d_with_gradient
 from optiland.geometries.newton_raphson import NewtonRaphsonGeometry
 
 
@@ -101,10 +102,45 @@ class PolynomialGeometry(NewtonRaphsonGeometry):
         """
         r2 = x**2 + y**2
         z = r2 / (self.radius * (1 + be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)))
-        for i in range(len(self.c)):
-            for j in range(len(self.c[i])):
-                z = z + self.c[i][j] * (x**i) * (y**j)
-        return z
+        return z + polyval2d(self.c, x, y)
+
+    def _sag_and_gradient(self, x, y):
+        """Calculates the sag of the polynomial surface and its partial
+        derivatives.
+
+        The polynomial is evaluated with a nested Horner scheme in y and x,
+        which gives the derivatives in the same pass.
+
+        Args:
+            x (be.ndarray): The x-coordinate(s).
+            y (be.ndarray): The y-coordinate(s).
+
+        Returns:
+            tuple[be.ndarray, be.ndarray, be.ndarray]: The sag and its
+            derivatives with respect to x and y.
+
+        """
+        r2 = x**2 + y**2
+        root = be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
+        z = r2 / (self.radius * (1 + root))
+        denom = self.radius * root
+
+        p, dp_dx, dp_dy = polyval2d_with_gradient(self.c, x, y)
+        return z + p, x / denom + dp_dx, y / denom + dp_dy
+
+    def _sag_and_normal(self, x, y):
+        """Calculates the sag and the surface normal of the polynomial surface.
+
+        Args:
+            x (be.ndarray): The x-coordinate(s).
+            y (be.ndarray): The y-coordinate(s).
+
+        Returns:
+            tuple: The sag and the surface normal components (nx, ny, nz).
+
+        """
+        z, dzdx, dzdy = self._sag_and_gradient(x, y)
+        return z, self._normal_from_gradient(dzdx, dzdy)
 
     def _surface_normal(self, x, y):
         """Calculates the surface normal of the polynomial surface at the given x
@@ -119,25 +155,7 @@ class PolynomialGeometry(NewtonRaphsonGeometry):
             components (nx, ny, nz).
 
         """
-        r2 = x**2 + y**2
-        denom = self.radius * be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
-        dzdx = x / denom
-        dzdy = y / denom
-
-        for i in range(1, len(self.c)):
-            for j in range(len(self.c[i])):
-                dzdx = dzdx + i * self.c[i][j] * (x ** (i - 1)) * (y**j)
-
-        for i in range(len(self.c)):
-            for j in range(1, len(self.c[i])):
-                dzdy = dzdy + j * self.c[i][j] * (x**i) * (y ** (j - 1))
-
-        norm = be.sqrt(dzdx**2 + dzdy**2 + 1)
-        nx = dzdx / norm
-        ny = dzdy / norm
-        nz = -1 / norm
-
-        return nx, ny, nz
+        return self._sag_and_normal(x, y)[1]
 
     def to_dict(self):
         """Converts the geometry to a dictionary.
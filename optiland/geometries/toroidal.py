@@ -234,6 +234,45 @@ class ToroidalGeometry(NewtonRaphsonGeometry):
 
         return nx, ny, nz
 
+    def _analytic_distance(self, rays):
+        """Calculates the distance to the geometry in closed form for the
+        toroidal surfaces without polynomial terms that are cylinders, i.e.,
+        with an infinite radius of rotation or Y-Z radius.
+
+        Args:
+            rays (RealRays): The rays used for calculating distance.
+
+        Returns:
+            be.ndarray or None: The distance for each ray, with NaN for rays
+            that miss the surface, or None if the surface is not a cylinder.
+        """
+        if not be.all(self.coeffs_poly_y == 0):
+            return None
+        if be.isinf(self.R_rot):
+            c = self.c_yz
+            return self._quadric_distance(rays, 0.0, c, (1 + self.k_yz) * c)
+        if self.c_yz == 0 and self.R_rot > 0:
+            c = 1.0 / self.R_rot
+            return self._quadric_distance(rays, c, 0.0, c)
+        return None
+
+    def _intersection(self, rays):
+        """Calculates the starting points of the Newton-Raphson iteration on
+        the paraboloid with the vertex curvatures of the surface.
+
+        Args:
+            rays (RealRays): The rays to calculate the intersection points for.
+
+        Returns:
+            tuple[be.ndarray, be.ndarray, be.ndarray]: The x, y, and z
+            coordinates of the initial intersection points.
+        """
+        cx = 0.0 if be.isinf(self.R_rot) else 1.0 / self.R_rot
+        cy = self.c_yz
+        if len(self.coeffs_poly_y) > 0:
+            cy = cy + 2 * self.coeffs_poly_y[0]
+        return self._paraboloid_intersection(rays, cx, cy)
+
     def flip(self):
         """Flip the geometry.
 
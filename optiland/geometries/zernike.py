@@ -25,6 +25,11 @@ improving performance beyond traditional spherical and aspheric designs.
 drpaprika, 2025
 """
 
+import math
+from functools import lru_cache
+
+import numpy as np
+
 import optiland.backend as be
 from optiland.coordinate_system import CoordinateSystem
 from optiland.geometries.newton_raphson import NewtonRaphsonGeometry
@@ -103,139 +108,109 @@ class ZernikePolynomialGeometry(NewtonRaphsonGeometry):
 
         self._validate_inputs(x_norm, y_norm)
 
-        # Convert to local polar
-        rho = be.sqrt(x_norm**2 + y_norm**2)
-        theta = be.arctan2(y_norm, x_norm)
-
         # Base conic
         r2 = x**2 + y**2
         z = r2 / (self.radius * (1 + be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)))
 
         # Add normalized Fringe Zernike contributions
-        # Sum over all nonzero coefficients
-        non_zero_indices = be.nonzero(self.c)[0]
-        for i in non_zero_indices:
-            normalization_factor = be.sqrt(2 * (i + 1) / be.pi)
-            z_i = self._zernike(i + 1, rho, theta)
-            z = z + normalization_factor * self.c[i] * z_i
+        return z + self._zernike_sum(x_norm, y_norm)[0]
 
-        return z
+    def _zernike_sum(self, x_norm, y_norm, gradient=False):
+        """Evaluate the weighted sum of the Zernike terms.
 
-    def _zernike(self, i: int, rho: be.ndarray, theta: be.ndarray) -> be.ndarray:
-        """Calculate the i-th Fringe Zernike polynomial at the given rho, theta.
+        Each term is written as q(rho^2) * Re((x + iy)^m) or
+        q(rho^2) * Im((x + iy)^m), where q is a polynomial, so that
+        rho^m * cos(m * theta) and rho^m * sin(m * theta) follow from the
+        Chebyshev recurrence of the powers of (x + iy). The coefficients are
+        first collapsed into one polynomial in rho^2 per azimuthal order,
+        which are evaluated together with Horner's scheme, and the azimuthal
+        orders are then summed with Horner's scheme in (x + iy). No angles,
+        factorials or explicit powers are evaluated, and the result is smooth
+        at the origin.
 
         Args:
-            i (int): The degree of the Zernike polynomial.
-            rho (be.ndarray): Radial coordinate.
-            theta (be.ndarray): Azimuthal coordinate.
+            x_norm (be.ndarray): The normalized x-coordinate(s).
+            y_norm (be.ndarray): The normalized y-coordinate(s).
+            gradient (bool, optional): Whether to also compute the partial
+                derivatives with respect to the normalized coordinates.
+                Defaults to False.
 
         Returns:
-            float or be.ndarray: Z_i(rho, theta).
+            tuple: The sum, and its derivatives with respect to x_norm and
+            y_norm. The derivatives are None if gradient is False.
 
         """
-        n, m = self._fringezernike_order_to_zernike_order(i)
-        Rnm = self._radial_poly(n, abs(m), rho)
-
-        if m == 0:
-            return Rnm
-        if m > 0:
-            return Rnm * be.cos(m * theta)
-        return Rnm * be.sin(abs(m) * theta)
-
-    def _zernike_derivative(
-        self,
-        i: int,
-        rho: be.ndarray,
-        theta: be.ndarray,
-    ) -> tuple[be.ndarray, be.ndarray]:
-        """Return partial derivatives of Z_i w.r.t. rho and theta:
-        (dZ/drho, dZ/dtheta).
-        We'll use them in chain rule for partial derivatives w.r.t x,y.
+        u = x_norm**2 + y_norm**2
+        table, num_powers = _coefficient_table(len(self.c))
+        if table.size == 0:
+            zero = be.zeros_like(u)
+            return (zero, zero, zero) if gradient else (zero, None, None)
+
+        # coefficients of the polynomials in u of the cosine (index 0) and
+        # sine (index 1) terms of each azimuthal order m
+        coefficients = be.matmul(self.c, be.array(table.reshape(len(table), -1)))
+        shape = table.shape[1:] + (1,) * getattr(u, "ndim", 0)
+        coefficients = be.reshape(coefficients, shape)
+
+        # sum of c_m(u) * (x + iy)^m, with c_m = p_cos - i * p_sin, and of
+        # the derivatives of c_m with respect to u (g) and of the sum with
+        # respect to (x + iy) (f)
+        h_re = h_im = g_re = g_im = f_re = f_im = 0.0
+        for m in range(len(num_powers) - 1, -1, -1):
+            p = coefficients[:, m, num_powers[m] - 1]
+            dp = be.zeros_like(p)
+            for j in range(num_powers[m] - 2, -1, -1):
+                if gradient:
+                    dp = dp * u + p
+                p = p * u + coefficients[:, m, j]
+
+            if gradient:
+                f_re, f_im = (
+                    f_re * x_norm - f_im * y_norm + h_re,
+                    f_re * y_norm + f_im * x_norm + h_im,
+                )
+                g_re, g_im = (
+                    g_re * x_norm - g_im * y_norm + dp[0],
+                    g_re * y_norm + g_im * x_norm - dp[1],
+                )
+            h_re, h_im = (
+                h_re * x_norm - h_im * y_norm + p[0],
+                h_re * y_norm + h_im * x_norm - p[1],
+            )
 
-        Args:
-            i (int): Fringe Zernike index
-            rho (float or be.ndarray): radial coordinate
-            theta (float or be.ndarray): azimuthal coordinate
+        if not gradient:
+            return h_re, None, None
 
-        Return:
-            (dZdrho, dZdtheta) as floats or ndarrays
+        dz_dx = 2 * x_norm * g_re + f_re
+        dz_dy = 2 * y_norm * g_re - f_im
+        return h_re, dz_dx, dz_dy
 
-        """
-        n, m = self._fringezernike_order_to_zernike_order(i)
-        Rnm = self._radial_poly(n, abs(m), rho)
-        dRnm = self._radial_poly_derivative(n, abs(m), rho)
-
-        if m == 0:
-            # Z_n^0(rho,theta) = R_n^0(rho), no theta dependence
-            dZdrho = dRnm
-            dZdtheta = 0.0
-        elif m > 0:
-            # Z_n^m = R_n^m(rho)*cos(m*theta)
-            # d/d rho -> dR_n^m(rho)*cos(m*theta)
-            dZdrho = dRnm * be.cos(m * theta)
-            # d/d theta -> R_n^m(rho)*(-m sin(m theta))
-            dZdtheta = -m * Rnm * be.sin(m * theta)
-        else:
-            # m < 0 => Z_n^m = R_n^|m|(rho)*sin(|m|*theta)
-            dZdrho = dRnm * be.sin(abs(m) * theta)
-            dZdtheta = abs(m) * Rnm * be.cos(abs(m) * theta)
-
-        return dZdrho, dZdtheta
-
-    def _radial_poly(self, n: int, m: int, rho: be.ndarray) -> be.ndarray:
-        """Compute the radial polynomial R_n^m(rho).
-
-        R_n^m(rho) = sum_{k=0}^{(n - m)/2} (-1)^k * (n-k)! /
-                     [k! ((n+m)/2 - k)! ((n-m)/2 - k)!] * rho^(n - 2k)
+    def _sag_and_normal(self, x, y):
+        """Calculate the sag and the surface normal of the full surface
+        (conic + Zernike) at (x, y).
 
         Args:
-            n (int): Zernike n
-            m (int): Zernike m (assumed >= 0)
-            rho (float or be.ndarray): Radial coordinate.
+            x (float or be.ndarray): x-coordinate(s).
+            y (float or be.ndarray): y-coordinate(s).
 
         Returns:
-            float or be.ndarray: The radial polynomial evaluated at rho.
+            tuple: The sag and the surface normal components (nx, ny, nz).
 
         """
-        val = 0.0
-        upper_k = (n - m) // 2
-        for k in range(upper_k + 1):
-            sign = (-1) ** k
-            numerator = factorial(n - k)
-            denominator = (
-                factorial(k) * factorial((n + m) // 2 - k) * factorial((n - m) // 2 - k)
-            )
-            val = val + sign * (numerator / denominator) * (rho ** (n - 2 * k))
-        return val
-
-    def _radial_poly_derivative(self, n: int, m: int, rho: be.ndarray):
-        """Derivative of the radial polynomial R_n^m(rho) with respect to rho.
-
-        d/d(rho) R_n^m(rho) = sum_{k=0} (...) (n-2k) * rho^(n-2k-1)
-
-        Args:
-            n (int): Zernike n.
-            m (int): Zernike m (assumed >= 0).
-            rho (float or be.ndarray): radial coordinate.
+        r2 = x**2 + y**2
+        root = be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
+        z = r2 / (self.radius * (1 + root))
+        dz_dr2 = 1 / (2 * self.radius * root)
+
+        zernike, dz_dx, dz_dy = self._zernike_sum(
+            x / self.norm_radius,
+            y / self.norm_radius,
+            gradient=True,
+        )
+        dzdx = 2 * x * dz_dr2 + dz_dx / self.norm_radius
+        dzdy = 2 * y * dz_dr2 + dz_dy / self.norm_radius
 
-        Returns:
-            float or be.ndarray: d/d rho of R_n^m(rho).
-
-        """
-        val = 0.0
-        upper_k = (n - m) // 2
-        for k in range(upper_k + 1):
-            sign = (-1) ** k
-            numerator = factorial(n - k)
-            denominator = (
-                factorial(k) * factorial((n + m) // 2 - k) * factorial((n - m) // 2 - k)
-            )
-            factor = n - 2 * k
-            if factor < 0:
-                continue
-            power_term = rho ** (n - 2 * k - 1) if (n - 2 * k - 1) >= 0 else 0
-            val = val + sign * (numerator / denominator) * factor * power_term
-        return val
+        return z + zernike, self._normal_from_gradient(dzdx, dzdy)
 
     def _surface_normal(
         self,
@@ -253,71 +228,18 @@ class ZernikePolynomialGeometry(NewtonRaphsonGeometry):
             (nx, ny, nz): Normal vector components in Cartesian coords.
 
         """
-        # Conic partial derivatives:
-        r2 = x**2 + y**2
-        denom = self.radius * be.sqrt(1 - (1 + self.k) * r2 / self.radius**2)
-        dzdx = x / denom
-        dzdy = y / denom
-
-        # Protect against divide-by-zero for r=0
-        # or handle small r if needed
-        eps = 1e-14
-        denom = be.where(be.abs(denom) < eps, eps, denom)
-
-        # Now add partial derivatives from the Zernike expansions
-        x_norm = x / self.norm_radius
-        y_norm = y / self.norm_radius
-        rho = be.sqrt(x_norm**2 + y_norm**2)
-        theta = be.arctan2(y_norm, x_norm)
-
-        # Chain rule:
-        # dZ/dx = dZ/drho * d(rho)/dx + dZ/dtheta * d(theta)/dx
-        # We'll define the partials of (rho,theta) wrt x:
-        #   drho/dx    = x / (norm_x^2 * rho)
-        #   dtheta/dx  = - y / (rho^2 * norm_y * norm_x)
-        drho_dx = (
-            be.zeros_like(x)
-            if be.all(rho == 0)
-            else ((x / (self.norm_radius**2)) / (rho + eps))
-        )
-        drho_dy = (
-            be.zeros_like(y)
-            if be.all(rho == 0)
-            else ((y / (self.norm_radius**2)) / (rho + eps))
-        )
-        dtheta_dx = -(y_norm) / (rho**2 + eps) * (1.0 / self.norm_radius)
-        dtheta_dy = +(x_norm) / (rho**2 + eps) * (1.0 / self.norm_radius)
-
-        non_zero_indices = be.nonzero(self.c)[0]
-        for i in non_zero_indices:
-            dZdrho, dZdtheta = self._zernike_derivative(i, rho, theta)
-            # partial wrt x
-            dzdx = dzdx + self.c[i] * (dZdrho * drho_dx + dZdtheta * dtheta_dx)
-            # partial wrt y
-            dzdy = dzdy + self.c[i] * (dZdrho * drho_dy + dZdtheta * dtheta_dy)
-
-        # Surface normal vector in cartesian coords: (-dzdx, -dzdy, 1)
-        # normalized. Check sign conventions!
-        nx = +dzdx
-        ny = +dzdy
-        norm = be.sqrt(nx**2 + ny**2 + 1)
-        norm = be.where(norm < eps, 1.0, norm)  # Avoid division by zero
-        nx = nx / norm
-        ny = ny / norm
-        nz = -be.ones_like(x) / norm
-
-        return (nx, ny, nz)
+        return self._sag_and_normal(x, y)[1]
 
     @staticmethod
-    def _fringezernike_order_to_zernike_order(k: int) -> tuple[float, float]:
+    def _fringezernike_order_to_zernike_order(k: int) -> tuple[int, int]:
         """Convert Fringe Zernike index k to classical Zernike (n, m).
 
         https://wp.optics.arizona.edu/visualopticslab/wp-content/
         uploads/sites/52/2021/10/Zernike-Fit.pdf
         """
-        n = be.ceil((-3 + be.sqrt(9 + 8 * k)) / 2)
+        n = math.ceil((-3 + math.sqrt(9 + 8 * k)) / 2)
         m = 2 * k - n * (n + 2)
-        return (n.astype(int), m.astype(int))
+        return n, m
 
     def _validate_inputs(self, x_norm: float, y_norm: float) -> None:
         """Validate the input coordinates for the Zernike polynomial surface.
@@ -381,5 +303,49 @@ class ZernikePolynomialGeometry(NewtonRaphsonGeometry):
         )
 
 
+@lru_cache
+def _coefficient_table(num_terms):
+    """Return the polynomial coefficients of the first num_terms Zernike terms.
+
+    Each normalized term is written as q(rho^2) * Re((x + iy)^|m|) for m >= 0,
+    or q(rho^2) * Im((x + iy)^|m|) for m < 0, where the radial polynomial is
+    R_n^|m|(rho) = rho^|m| * q(rho^2). The coefficients of q are integers, so
+    they are computed exactly once for each number of terms.
+
+    Args:
+        num_terms (int): The number of coefficients.
+
+    Returns:
+        tuple: The coefficients with shape (num_terms, 2, orders, powers),
+        where entry [i, s, |m|, j] is the coefficient of (rho^2)^j of term i,
+        with s = 1 for sine terms, and the number of powers of rho^2 used by
+        each azimuthal order.
+
+    """
+    orders = [
+        ZernikePolynomialGeometry._fringezernike_order_to_zernike_order(i + 1)
+        for i in range(num_terms)
+    ]
+    num_orders = max((abs(m) + 1 for _, m in orders), default=0)
+    num_powers = [1] * num_orders
+    for n, m in orders:
+        num_powers[abs(m)] = max(num_powers[abs(m)], (n - abs(m)) // 2 + 1)
+
+    table = np.zeros((num_terms, 2, num_orders, max(num_powers, default=0)))
+    for i, (n, m) in enumerate(orders):
+        norm = math.sqrt(2 * (i + 1) / math.pi)
+        a = abs(m)
+        for k in range((n - a) // 2 + 1):
+            coefficient = math.factorial(n - k) // (
+                math.factorial(k)
+                * math.factorial((n + a) // 2 - k)
+                * math.factorial((n - a) // 2 - k)
+            )
+            table[i, int(m < 0), a, (n - a) // 2 - k] = norm * (-1) ** k * coefficient
+
+    table.setflags(write=False)
+    return table, tuple(num_powers)
+
+
 def factorial(n):
     return be.prod(range(1, n + 1))
@@ -4,6 +4,7 @@ refractiveindex.info data files."""
 
 from .abbe import AbbeMaterial
 from .base import BaseMaterial
+from .glass_catalog import GlassCatalog
 from .ideal import IdealMaterial
 from .material import Material
 from .material_file import MaterialFile
@@ -14,6 +15,8 @@ __all__ = [
     "AbbeMaterial",
     # From base.py
     "BaseMaterial",
+    # From glass_catalog.py
+    "GlassCatalog",
     # From ideal.py
     "IdealMaterial",
     # From material.py
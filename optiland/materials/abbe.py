@@ -29,7 +29,12 @@ class AbbeMaterial(BaseMaterial):
     def __init__(self, n, abbe):
         self.index = be.array([n])
         self.abbe = be.array([abbe])
-        self._p = self._get_coefficients()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("index", "abbe") and "abbe" in self.__dict__:
+            # refit the dispersion polynomial to the new parameters
+            self._p = self._get_coefficients()
 
     def n(self, wavelength):
         """Returns the refractive index of the material.
@@ -102,7 +107,9 @@ class AbbeMaterial(BaseMaterial):
 
         """
         material_dict = super().to_dict()
-        material_dict.update({"index": float(self.index), "abbe": float(self.abbe)})
+        material_dict.update(
+            {"index": float(self.index[0]), "abbe": float(self.abbe[0])}
+        )
         return material_dict
 
     @classmethod
@@ -10,8 +10,10 @@ Kramer Harrison, 2024
 
 from abc import ABC, abstractmethod
 
+from optiland.revision import RevisionMixin
 
-class BaseMaterial(ABC):
+
+class BaseMaterial(RevisionMixin, ABC):
     """Base class for materials.
 
     This class defines the interface for material properties such as
@@ -24,6 +26,9 @@ class BaseMaterial(ABC):
     Attributes:
         None
 
+    Note:
+        The material keeps a revision of its parameters, see `RevisionMixin`.
+
     Methods:
         n(wavelength: float or be.ndarray) -> float or be.ndarray:
             Abstract method to calculate the refractive index at a given
@@ -0,0 +1,216 @@
+"""Catalog Index
+
+This module contains the CatalogIndex class, a search index over the material
+catalog (`catalog_nk.csv`) used by the Material class. The lowercased search
+columns, a trigram index of the material names and the wavelength ranges are
+prepared once per process, so that looking up a material does not scan the
+catalog with pandas string operations. Search results and edit distances are
+cached, so that repeated lookups of the same material are nearly free.
+
+Kramer Harrison, 2025
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+# columns searched for the material name
+NAME_COLUMNS = ("category_name", "name", "filename_no_ext")
+
+# columns searched for the material reference
+REFERENCE_COLUMNS = (
+    "category_name",
+    "category_name_full",
+    "reference",
+    "name",
+    "filename",
+)
+
+# separator between the columns of a row, which never occurs in a query
+_SEPARATOR = "\x00"
+
+# characters with a special meaning in regular expressions
+_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+@lru_cache(maxsize=65536)
+def edit_distance(s1, s2):
+    """Calculates the Levenshtein distance between two strings.
+
+    Args:
+        s1 (str): The first string.
+        s2 (str): The second string.
+
+    Returns:
+        int: The Levenshtein distance between the two strings.
+
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, start=1):
+        current = [i]
+        for j, c2 in enumerate(s2, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (c1 != c2),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+class CatalogIndex:
+    """Search index over the rows of a material catalog.
+
+    The index reproduces the matching rules of the catalog search: the
+    material name (a regular expression, as with `pandas.Series.str.contains`)
+    must occur in the category name, the name or the filename of a row, the
+    optional reference must occur in one of the reference columns, and the
+    material must be defined at the requested wavelengths. Matches are
+    ordered by the smallest edit distance between the material name and the
+    name columns of each row.
+
+    Args:
+        df (pandas.DataFrame): The material catalog.
+
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.names = self._joined(df, NAME_COLUMNS)
+        self.references = self._joined(df, REFERENCE_COLUMNS)
+        self.name_columns = [name.split(_SEPARATOR) for name in self.names]
+        self.min_wavelength = df["min_wavelength"].to_numpy(dtype=float)
+        self.max_wavelength = df["max_wavelength"].to_numpy(dtype=float)
+        self.trigrams = self._build_trigrams(self.name_columns)
+        self._records = None
+        self._search = lru_cache(maxsize=1024)(self._search_uncached)
+
+    @staticmethod
+    def _joined(df, columns):
+        """Returns the lowercased columns of each row, joined by a separator."""
+        values = zip(*(df[column].astype(str).str.lower() for column in columns))
+        return [_SEPARATOR.join(row) for row in values]
+
+    @staticmethod
+    def _build_trigrams(name_columns):
+        """Map each trigram of the name columns to the rows containing it."""
+        trigrams = {}
+        for row, columns in enumerate(name_columns):
+            grams = {
+                column[k : k + 3] for column in columns for k in range(len(column) - 2)
+            }
+            for gram in grams:
+                trigrams.setdefault(gram, []).append(row)
+        return {gram: frozenset(rows) for gram, rows in trigrams.items()}
+
+    def record(self, row):
+        """Returns the catalog entry of a row as a dictionary.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            dict: The column values of the row.
+
+        """
+        if self._records is None:
+            self._records = self.df.to_dict("records")
+        return dict(self._records[row])
+
+    def search(self, name, reference=None, min_wavelength=None, max_wavelength=None):
+        """Find the catalog rows matching a material.
+
+        Args:
+            name (str): The material name.
+            reference (str, optional): The material reference. Defaults to
+                None.
+            min_wavelength (float, optional): Minimum wavelength in microns
+                that the material must support. Defaults to None.
+            max_wavelength (float, optional): Maximum wavelength in microns
+                that the material must support. Defaults to None.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The matching row indices and their
+            similarity scores, sorted by ascending score.
+
+        """
+        rows, scores = self._search(
+            name.lower(),
+            reference.lower() if reference else None,
+            min_wavelength or None,
+            max_wavelength or None,
+        )
+        return rows.copy(), scores.copy()
+
+    def _search_uncached(self, name, reference, min_wavelength, max_wavelength):
+        """Find the matching rows of a lowercased query."""
+        rows = self._name_candidates(name)
+
+        if reference is not None:
+            contains = _matcher(reference)
+            rows = [row for row in rows if contains(self.references[row])]
+
+        rows = np.asarray(rows, dtype=int)
+        for wavelength in (min_wavelength, max_wavelength):
+            if wavelength is not None:
+                valid = (self.min_wavelength[rows] <= wavelength) & (
+                    self.max_wavelength[rows] >= wavelength
+                )
+                rows = rows[valid]
+
+        scores = np.array(
+            [
+                min(edit_distance(name, column) for column in self.name_columns[row])
+                for row in rows
+            ],
+            dtype=np.int64,
+        )
+        order = np.argsort(scores, kind="quicksort")
+        return rows[order], scores[order]
+
+    def _name_candidates(self, name):
+        """Returns the rows whose name columns contain the name, in order."""
+        if not _is_literal(name) or len(name) < 3 or _SEPARATOR in name:
+            contains = _matcher(name)
+            return [
+                row
+                for row, columns in enumerate(self.name_columns)
+                if any(contains(column) for column in columns)
+            ]
+
+        candidates = None
+        for k in range(len(name) - 2):
+            rows = self.trigrams.get(name[k : k + 3], frozenset())
+            candidates = rows if candidates is None else candidates & rows
+            if not candidates:
+                return []
+        return [row for row in sorted(candidates) if name in self.names[row]]
+
+
+def _is_literal(pattern):
+    """Returns True if a pattern has no regular expression metacharacters."""
+    return not _METACHARACTERS.intersection(pattern)
+
+
+def _matcher(pattern):
+    """Returns a function testing whether a string contains a pattern.
+
+    Patterns without metacharacters are matched as plain substrings, other
+    patterns are matched as regular expressions.
+
+    Args:
+        pattern (str): The pattern.
+
+    Returns:
+        callable: A function of a string returning whether the string
+        contains the pattern.
+
+    """
+    if _is_literal(pattern):
+        return lambda text: pattern in text
+    return re.compile(pattern).search
@@ -0,0 +1,305 @@
+"""Glass Catalog
+
+This module contains the GlassCatalog class, which evaluates the refractive
+indices of many catalog glasses at once. The dispersion coefficients of all
+glasses that share a dispersion formula are stacked into one 2D array, so
+that the refractive indices of every glass at every wavelength are computed
+with a few array operations instead of one Material object per glass. This
+is useful for glass maps and glass substitution studies.
+
+Kramer Harrison, 2025
+"""
+
+from importlib import resources
+
+import numpy as np
+
+import optiland.backend as be
+from optiland.materials.material import Material
+from optiland.materials.material_file import MaterialFile
+
+# Fraunhofer lines used for the Abbe number and partial dispersions (µm)
+D_LINE = 0.5875618
+F_LINE = 0.4861327
+C_LINE = 0.6562725
+G_LINE = 0.4358343
+
+
+def _formula_1(c, w):
+    """Sellmeier formula, refractiveindex.info dispersion formula 1."""
+    w2 = w**2
+    n2 = 1 + c[:, 0:1]
+    for k in range(1, c.shape[1] - 1, 2):
+        n2 = n2 + c[:, k : k + 1] * w2 / (w2 - c[:, k + 1 : k + 2] ** 2)
+    return be.sqrt(n2)
+
+
+def _formula_2(c, w):
+    """Sellmeier-2 formula, refractiveindex.info dispersion formula 2."""
+    w2 = w**2
+    n2 = 1 + c[:, 0:1]
+    for k in range(1, c.shape[1] - 1, 2):
+        n2 = n2 + c[:, k : k + 1] * w2 / (w2 - c[:, k + 1 : k + 2])
+    return be.sqrt(n2)
+
+
+def _polynomial(c, w):
+    """Sum of powers of the wavelength, as used by formulas 3 and 5."""
+    result = c[:, 0:1]
+    for k in range(1, c.shape[1] - 1, 2):
+        result = result + c[:, k : k + 1] * w ** c[:, k + 1 : k + 2]
+    return result
+
+
+def _formula_3(c, w):
+    """Polynomial formula, refractiveindex.info dispersion formula 3."""
+    return be.sqrt(_polynomial(c, w))
+
+
+def _formula_5(c, w):
+    """Cauchy formula, refractiveindex.info dispersion formula 5."""
+    return _polynomial(c, w)
+
+
+# Dispersion formulas that are evaluated for stacked coefficients. Missing
+# terms are padded with zeros, which do not contribute to these formulas.
+_STACKED_FORMULAS = {
+    "formula 1": _formula_1,
+    "formula 2": _formula_2,
+    "formula 3": _formula_3,
+    "formula 5": _formula_5,
+}
+
+
+class GlassCatalog:
+    """Refractive index data of a collection of catalog glasses.
+
+    The glasses are taken from the material database (`catalog_nk.csv`).
+    Glasses that use the Sellmeier, polynomial or Cauchy dispersion formulas
+    are evaluated together, with one coefficient array per formula. The
+    coefficients are read from the parsed material data shared by all
+    MaterialFile instances, or from its disk cache, see
+    `MaterialFile.enable_disk_cache`. The remaining glasses, e.g. those
+    defined by tabulated data, are evaluated one by one, and their materials
+    are only created when they are first evaluated.
+
+    Args:
+        manufacturers (list[str], optional): The manufacturers to include,
+            e.g. ['schott', 'ohara']. Defaults to None, in which case all
+            glasses are included.
+        group (str, optional): The group of the material database to use.
+            Defaults to 'glass'.
+
+    Attributes:
+        names (list[str]): The names of the glasses.
+        manufacturers (list[str]): The manufacturer of each glass.
+        filenames (list[str]): The material file of each glass.
+        min_wavelength (np.ndarray): The minimum valid wavelength of each
+            glass in microns.
+        max_wavelength (np.ndarray): The maximum valid wavelength of each
+            glass in microns.
+
+    Raises:
+        ValueError: If no glasses match the given manufacturers.
+
+    """
+
+    def __init__(self, manufacturers=None, group="glass"):
+        df = Material._load_dataframe()
+        df = df[df["group"] == group].drop_duplicates(subset="filename")
+        vendor = df["filename"].str.split("/").str[1].str.lower()
+        if manufacturers is not None:
+            df = df[vendor.isin([name.lower() for name in manufacturers])]
+            vendor = vendor.loc[df.index]
+        if df.empty:
+            raise ValueError(f"No glasses found for manufacturers {manufacturers}.")
+
+        self.names = list(df["filename_no_ext"])
+        self.manufacturers = list(vendor)
+        self.filenames = [
+            str(resources.files("optiland.database").joinpath("data-nk", filename))
+            for filename in df["filename"]
+        ]
+        self.min_wavelength = df["min_wavelength"].to_numpy(dtype=float)
+        self.max_wavelength = df["max_wavelength"].to_numpy(dtype=float)
+
+        records = [MaterialFile._parsed_record(name) for name in self.filenames]
+        self._stacked, self._other = self._group_by_formula(records)
+        self._materials = {}
+        order = [*(i for indices, _ in self._stacked.values() for i in indices)]
+        order += self._other
+        self._order = np.argsort(order)
+        self._abbe = None
+
+    def __len__(self):
+        return len(self.names)
+
+    @staticmethod
+    def _group_by_formula(records):
+        """Stack the dispersion coefficients of glasses sharing a formula.
+
+        Args:
+            records (list[dict]): The parsed material data of the glasses,
+                see `MaterialFile._parsed_record`.
+
+        Returns:
+            tuple: A dictionary mapping each formula to the glass indices and
+            the zero-padded NumPy coefficient array, and the list of indices of the
+            glasses that are evaluated one by one.
+
+        """
+        grouped = {}
+        other = []
+        for index, record in enumerate(records):
+            if record["formula"] in _STACKED_FORMULAS:
+                coefficients = np.ravel(record.get("coefficients", []))
+                entries = grouped.setdefault(record["formula"], [])
+                entries.append((index, coefficients))
+            else:
+                other.append(index)
+
+        stacked = {}
+        for formula, entries in grouped.items():
+            size = max(len(coefficients) for _, coefficients in entries)
+            size += (size + 1) % 2  # complete the last term of the formula
+            array = np.zeros((len(entries), size))
+            for row, (_, coefficients) in enumerate(entries):
+                array[row, : len(coefficients)] = coefficients
+            indices = [index for index, _ in entries]
+            stacked[formula] = (indices, array)
+        return stacked, other
+
+    def n(self, wavelength):
+        """Calculates the refractive index of every glass.
+
+        Args:
+            wavelength (float or be.ndarray): The wavelength(s) in microns.
+
+        Returns:
+            be.ndarray: The refractive indices, with shape (num_glasses,) for
+            a single wavelength or (num_glasses, num_wavelengths) for an
+            array of wavelengths.
+
+        """
+        scalar = not be.is_array_like(wavelength)
+        w = be.reshape(be.array(be.atleast_1d(wavelength)), (1, -1))
+
+        parts = [
+            _STACKED_FORMULAS[formula](be.array(coefficients), w)
+            for formula, (_, coefficients) in self._stacked.items()
+        ]
+        for index in self._other:
+            values = be.ravel(be.array(self._material_file(index).n(be.ravel(w))))
+            parts.append(be.reshape(values, (1, -1)))
+
+        result = be.concatenate(parts, axis=0)[self._order]
+        return result[:, 0] if scalar else result
+
+    def _material_file(self, index):
+        """Returns the material of a glass evaluated one by one, creating it once."""
+        if index not in self._materials:
+            self._materials[index] = MaterialFile(self.filenames[index])
+        return self._materials[index]
+
+    @property
+    def nd(self):
+        """be.ndarray: the refractive index of each glass at the d-line"""
+        return self._abbe_data()[0]
+
+    @property
+    def vd(self):
+        """be.ndarray: the Abbe number of each glass"""
+        return self._abbe_data()[1]
+
+    def _abbe_data(self):
+        """Returns the d-line refractive index and Abbe number of each glass.
+
+        The values are computed once for each backend.
+        """
+        if self._abbe is None or self._abbe[0] != be.backend_key():
+            n = self.n(be.array([D_LINE, F_LINE, C_LINE]))
+            vd = (n[:, 0] - 1) / (n[:, 1] - n[:, 2])
+            self._abbe = (be.backend_key(), n[:, 0], vd)
+        return self._abbe[1:]
+
+    def partial_dispersion(self, wavelength_1=G_LINE, wavelength_2=F_LINE):
+        """Calculates the relative partial dispersion of each glass.
+
+        The relative partial dispersion is defined as
+        P = (n(λ1) - n(λ2)) / (n_F - n_C). The default wavelengths give the
+        partial dispersion P_g,F.
+
+        Args:
+            wavelength_1 (float, optional): The first wavelength in microns.
+                Defaults to the g-line (435.8343 nm).
+            wavelength_2 (float, optional): The second wavelength in microns.
+                Defaults to the F-line (486.1327 nm).
+
+        Returns:
+            be.ndarray: The relative partial dispersion of each glass.
+
+        """
+        n = self.n(be.array([wavelength_1, wavelength_2, F_LINE, C_LINE]))
+        return (n[:, 0] - n[:, 1]) / (n[:, 2] - n[:, 3])
+
+    def nearest(self, nd, vd, count=1, weights=(1.0, 0.01)):
+        """Find the glasses nearest to a point of the glass map.
+
+        The distance between glasses is the Euclidean distance of the
+        weighted differences of the refractive index and the Abbe number.
+        The default weights make a difference of 0.01 in refractive index
+        equivalent to a difference of 1 in Abbe number.
+
+        Args:
+            nd (float): The refractive index at the d-line.
+            vd (float): The Abbe number.
+            count (int, optional): The number of glasses to return. Defaults
+                to 1.
+            weights (tuple[float, float], optional): The weights of the
+                refractive index and Abbe number differences. Defaults to
+                (1.0, 0.01).
+
+        Returns:
+            np.ndarray: The indices of the nearest glasses, sorted by
+            increasing distance.
+
+        """
+        delta_n = weights[0] * (be.to_numpy(self.nd) - nd)
+        delta_v = weights[1] * (be.to_numpy(self.vd) - vd)
+        distance = np.hypot(delta_n, delta_v)
+        return np.argsort(distance, kind="stable")[:count]
+
+    def index(self, name, manufacturer=None):
+        """Returns the index of a glass.
+
+        Args:
+            name (str): The glass name, e.g. 'N-BK7'. The comparison is case
+                insensitive.
+            manufacturer (str, optional): The manufacturer of the glass.
+                Defaults to None.
+
+        Returns:
+            int: The index of the first glass with the given name.
+
+        Raises:
+            ValueError: If the glass is not in the catalog.
+
+        """
+        for index, (glass, vendor) in enumerate(zip(self.names, self.manufacturers)):
+            if glass.lower() == name.lower() and (
+                manufacturer is None or vendor == manufacturer.lower()
+            ):
+                return index
+        raise ValueError(f"Glass {name} not found in catalog.")
+
+    def material(self, index):
+        """Returns a material for a glass of the catalog.
+
+        Args:
+            index (int): The index of the glass.
+
+        Returns:
+            MaterialFile: The material of the glass.
+
+        """
+        return MaterialFile(self.filenames[index])
@@ -67,7 +67,9 @@ class IdealMaterial(BaseMaterial):
 
         """
         material_dict = super().to_dict()
-        material_dict.update({"index": float(self.index), "absorp": float(self.absorp)})
+        material_dict.update(
+            {"index": float(self.index[0]), "absorp": float(self.absorp[0])}
+        )
         return material_dict
 
     @classmethod
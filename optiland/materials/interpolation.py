@@ -0,0 +1,125 @@
+"""Interpolation
+
+This module contains the TabulatedInterpolant class, which interpolates
+tabulated material data, such as the refractive index or the extinction
+coefficient of a material as a function of wavelength. The table is sorted,
+converted to the current backend and, for cubic interpolation, converted into
+spline coefficients once, so that each evaluation only locates the table
+interval of each wavelength and evaluates a short polynomial.
+
+Kramer Harrison, 2025
+"""
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+import optiland.backend as be
+
+INTERPOLATION_MODES = ("linear", "cubic")
+
+
+class TabulatedInterpolant:
+    """Interpolant of tabulated data.
+
+    The 'linear' mode interpolates the table linearly with `be.interp`. The
+    'cubic' mode uses a natural cubic spline, or linear interpolation for
+    tables with fewer than three points. In both modes, values outside the
+    table range are clamped to the values at the ends of the table.
+
+    Args:
+        x (be.ndarray): The tabulated wavelengths. Duplicate wavelengths are
+            removed, keeping the first value.
+        y (be.ndarray): The tabulated values.
+        mode (str, optional): The interpolation mode, 'linear' or 'cubic'.
+            Defaults to 'linear'.
+
+    Raises:
+        ValueError: If the mode is invalid or the table is empty or invalid.
+
+    """
+
+    def __init__(self, x, y, mode="linear"):
+        if mode not in INTERPOLATION_MODES:
+            raise ValueError(
+                f"Invalid interpolation mode: {mode}. "
+                f"Must be one of {INTERPOLATION_MODES}."
+            )
+        if x is None or y is None:
+            raise ValueError("No tabulated data found.")
+
+        x = np.ravel(be.to_numpy(x)).astype(float)
+        y = np.ravel(be.to_numpy(y)).astype(float)
+        if x.size == 0 or x.size != y.size:
+            raise ValueError("Tabulated data is empty or invalid.")
+
+        order = np.argsort(x, kind="stable")
+        x, first = np.unique(x[order], return_index=True)
+        y = y[order][first]
+
+        self.mode = mode
+        self.lower = float(x[0])
+        self.upper = float(x[-1])
+        self._x = x
+        self._y = y
+        self._coefficients = self._fit(x, y, mode)
+        self._arrays = {}
+
+    @staticmethod
+    def _fit(x, y, mode):
+        """Compute the spline coefficients of each table interval.
+
+        Args:
+            x (np.ndarray): The sorted, distinct wavelengths.
+            y (np.ndarray): The tabulated values.
+            mode (str): The interpolation mode.
+
+        Returns:
+            np.ndarray or None: The coefficients with shape (4, intervals),
+            highest power first, in terms of the offset from the start of
+            each interval. None if the table is interpolated linearly.
+
+        """
+        if mode == "linear" or x.size < 3:
+            return None
+        return CubicSpline(x, y, bc_type="natural").c
+
+    def _backend_arrays(self):
+        """Returns the table arrays of the current backend."""
+        key = be.backend_key()
+        if key not in self._arrays:
+            coefficients = self._coefficients
+            if coefficients is not None:
+                coefficients = [be.array(row) for row in coefficients]
+            self._arrays[key] = (be.array(self._x), be.array(self._y), coefficients)
+        return self._arrays[key]
+
+    def __call__(self, wavelength):
+        """Interpolate the table at the given wavelengths.
+
+        Args:
+            wavelength (float or be.ndarray): The wavelength(s) in microns.
+
+        Returns:
+            float or be.ndarray: The interpolated value(s).
+
+        """
+        x, y, coefficients = self._backend_arrays()
+        if coefficients is None and len(self._x) > 1:
+            return be.interp(wavelength, x, y)
+
+        w = be.clip(be.array(wavelength), self.lower, self.upper)
+        if coefficients is None:
+            # a single tabulated value
+            result = be.zeros_like(w) + y[0]
+        else:
+            index = be.searchsorted(x, w, side="right") - 1
+            index = be.clip(index, 0, len(coefficients[0]) - 1)
+            t = w - x[index]
+
+            result = coefficients[0][index]
+            for row in coefficients[1:]:
+                result = result * t + row[index]
+
+        if not be.is_array_like(wavelength):
+            return result[()]
+        return result
@@ -14,6 +14,7 @@ from importlib import resources
 
 import pandas as pd
 
+from optiland.materials.catalog_index import CatalogIndex, edit_distance
 from optiland.materials.material_file import MaterialFile
 
 
@@ -41,6 +42,8 @@ class Material(MaterialFile):
             filtering materials based on their valid range. Defaults to None.
         max_wavelength (float, optional): Maximum wavelength in microns for
             filtering materials based on their valid range. Defaults to None.
+        interpolation (str, optional): The interpolation of tabulated data,
+            'linear' or 'cubic'. Defaults to 'linear'.
 
     Attributes:
         name (str): The name of the material.
@@ -49,6 +52,7 @@ class Material(MaterialFile):
     """
 
     _df = None
+    _index = None
     _filename = str(resources.files("optiland.database").joinpath("catalog_nk.csv"))
 
     def __init__(
@@ -58,6 +62,7 @@ class Material(MaterialFile):
         robust_search=True,
         min_wavelength=None,
         max_wavelength=None,
+        interpolation="linear",
     ):
         self.name = name
         self.reference = reference
@@ -65,7 +70,7 @@ class Material(MaterialFile):
         self.min_wavelength = min_wavelength
         self.max_wavelength = max_wavelength
         file, self.material_data = self._retrieve_file()
-        super().__init__(file)
+        super().__init__(file, interpolation)
 
     @classmethod
     def _load_dataframe(cls):
@@ -74,6 +79,24 @@ class Material(MaterialFile):
             cls._df = pd.read_csv(cls._filename)
         return cls._df
 
+    @classmethod
+    def _load_index(cls, df=None):
+        """Load the catalog search index if not yet built.
+
+        Args:
+            df (pandas.DataFrame, optional): The catalog to index. Defaults to
+                None, in which case the material catalog is used.
+
+        Returns:
+            CatalogIndex: The search index of the catalog.
+
+        """
+        if df is None:
+            df = cls._load_dataframe()
+        if cls._index is None or cls._index.df is not df:
+            cls._index = CatalogIndex(df)
+        return cls._index
+
     @staticmethod
     def _levenshtein_distance(s1, s2):
         """Calculates the Levenshtein distance between two strings.
@@ -86,28 +109,37 @@ class Material(MaterialFile):
             int: The Levenshtein distance between the two strings.
 
         """
-        # Initialize matrix of zeros
-        rows = len(s1) + 1
-        cols = len(s2) + 1
-        distance_matrix = [[0 for _ in range(cols)] for _ in range(rows)]
-
-        # Populate matrix with initial values
-        for i in range(1, rows):
-            distance_matrix[i][0] = i
-        for j in range(1, cols):
-            distance_matrix[0][j] = j
-
-        # Calculate the distance
-        for i in range(1, rows):
-            for j in range(1, cols):
-                cost = 0 if s1[i - 1] == s2[j - 1] else 1
-                distance_matrix[i][j] = min(
-                    distance_matrix[i - 1][j] + 1,
-                    distance_matrix[i][j - 1] + 1,
-                    distance_matrix[i - 1][j - 1] + cost,
-                )
-
-        return distance_matrix[-1][-1]
+        return edit_distance(s1, s2)
+
+    def _search(self, df=None):
+        """Searches the catalog index for the material.
+
+        Args:
+            df (pandas.DataFrame, optional): The catalog to search. Defaults
+                to None, in which case the material catalog is used.
+
+        Returns:
+            tuple[CatalogIndex, np.ndarray, np.ndarray]: The index, and the
+            matching row indices and similarity scores sorted by ascending
+            score.
+
+        """
+        index = self._load_index(df)
+        rows, scores = index.search(
+            self.name,
+            self.reference,
+            self.min_wavelength,
+            self.max_wavelength,
+        )
+
+        # Warning if no exact matches found
+        if len(scores) > 0 and scores[0] > 0:
+            print(
+                f"Warning: No exact matches found for material {self.name}. "
+                "Material may be invalid.",
+            )
+
+        return index, rows, scores
 
     def _find_material_matches(self, df):
         """Finds material matches in a DataFrame based on the given name and
@@ -122,63 +154,14 @@ class Material(MaterialFile):
             DataFrame if no potential matches are found.
 
         """
-        # Make input name lowercase
-        name = self.name.lower()
-
-        # Filter rows where input string is substring of category_name or name
-        dfi = df[
-            df["category_name"].str.lower().str.contains(name)
-            | df["name"].str.lower().str.contains(name)
-            | df["filename_no_ext"].str.lower().str.contains(name)
-        ].copy()
-
-        # If reference given, filter rows non-matching rows
-        if self.reference:
-            reference = self.reference.lower()
-            dfi = dfi[
-                dfi["category_name"].str.lower().str.contains(reference)
-                | dfi["category_name_full"].str.lower().str.contains(reference)
-                | dfi["reference"].str.lower().str.contains(reference)
-                | dfi["name"].str.lower().str.contains(reference)
-                | dfi["filename"].str.lower().str.contains(reference)
-            ]
-
-        # Filter rows based on wavelength range
-        if self.min_wavelength:
-            dfi = dfi[
-                (dfi["min_wavelength"] <= self.min_wavelength)
-                & (dfi["max_wavelength"] >= self.min_wavelength)
-            ]
-        if self.max_wavelength:
-            dfi = dfi[
-                (dfi["min_wavelength"] <= self.max_wavelength)
-                & (dfi["max_wavelength"] >= self.max_wavelength)
-            ]
+        _, rows, scores = self._search(df)
 
         # If no rows match, return an empty DataFrame
-        if dfi.empty:
+        if len(rows) == 0:
             return pd.DataFrame()
 
-        # Calculate similarity scores using Levenshtein distance
-        dfi["similarity_score"] = dfi.apply(
-            lambda row: min(
-                self._levenshtein_distance(name, row["category_name"].lower()),
-                self._levenshtein_distance(name, row["name"].lower()),
-                self._levenshtein_distance(name, row["filename_no_ext"].lower()),
-            ),
-            axis=1,
-        )
-
-        # Sort by similarity score in ascending order
-        dfi = dfi.sort_values(by="similarity_score").reset_index(drop=True)
-
-        # Warning if no exact matches found
-        if dfi["similarity_score"].iloc[0] > 0:
-            print(
-                f"Warning: No exact matches found for material {self.name}. "
-                "Material may be invalid.",
-            )
-
+        dfi = df.iloc[rows].reset_index(drop=True)
+        dfi["similarity_score"] = scores
         return dfi
 
     def _raise_material_error(self, no_matches=False, multiple_matches=False):
@@ -223,17 +206,17 @@ class Material(MaterialFile):
             ValueError: If multiple matches are found for the material.
 
         """
-        df = self._load_dataframe()
-        filtered_df = self._find_material_matches(df)
+        index, rows, scores = self._search()
 
-        if filtered_df.empty:
+        if len(rows) == 0:
             self._raise_material_error(no_matches=True)
 
-        if len(filtered_df) > 1 and not self.robust:
+        if len(rows) > 1 and not self.robust:
             self._raise_material_error(multiple_matches=True)
 
-        material_data = filtered_df.loc[0].to_dict()
-        filename = filtered_df.loc[0, "filename"]
+        material_data = index.record(rows[0])
+        material_data["similarity_score"] = int(scores[0])
+        filename = material_data["filename"]
 
         full_filename = str(
             resources.files("optiland.database").joinpath("data-nk", filename),
@@ -282,4 +265,5 @@ class Material(MaterialFile):
             data.get("robust_search", True),
             data.get("min_wavelength", None),
             data.get("max_wavelength", None),
+            data.get("interpolation", "linear"),
         )
@@ -7,7 +7,9 @@ Kramer Harrison, 2024
 """
 
 import contextlib
+import hashlib
 import os
+from collections import OrderedDict
 from io import StringIO
 
 import numpy as np
@@ -15,6 +17,27 @@ import yaml
 
 import optiland.backend as be
 from optiland.materials.base import BaseMaterial
+from optiland.materials.interpolation import INTERPOLATION_MODES, TabulatedInterpolant
+
+# attributes of the material data, whose assignment clears the value cache and
+# increments the revision of the material
+_DATA_ATTRIBUTES = (
+    "coefficients",
+    "formula_map",
+    "_n_formula",
+    "_n_wavelength",
+    "_n",
+    "_k_wavelength",
+    "_k",
+    "interpolation",
+)
+
+# maximum number of cached property values per material, the least recently
+# used values are evicted first
+_MAX_CACHED_VALUES = 1024
+
+# array attributes of the parsed material data, as stored in the disk cache
+_ARRAY_ATTRIBUTES = ("coefficients", "_n_wavelength", "_n", "_k_wavelength", "_k")
 
 
 class MaterialFile(BaseMaterial):
@@ -29,9 +52,12 @@ class MaterialFile(BaseMaterial):
 
     Args:
         filename (str): The path to the material file.
+        interpolation (str, optional): The interpolation of tabulated data,
+            'linear' or 'cubic'. Defaults to 'linear'.
 
     Attributes:
         filename (str): The filename of the material file.
+        interpolation (str): The interpolation of tabulated data.
         coefficients (list): A list of coefficients for calculating the
             refractive index.
 
@@ -41,18 +67,34 @@ class MaterialFile(BaseMaterial):
         k(wavelength): Retrieves the extinction coefficient of the material at
             a given wavelength.
 
+    Note:
+        Parsed material files are shared between instances. Each file is
+        parsed once per process, and instances created from the same file
+        get their own copies of the parsed data. Parsed data can also be
+        stored on disk with `MaterialFile.enable_disk_cache`, so that new
+        processes skip parsing the YAML files.
+
     """
 
-    def __init__(self, filename):
+    # parsed material data, keyed by file path, modification time and size
+    _parsed = {}
+
+    # directory of the parsed material data on disk, if enabled
+    _cache_dir = None
+
+    def __init__(self, filename, interpolation="linear"):
+        if interpolation not in INTERPOLATION_MODES:
+            raise ValueError(
+                f"Invalid interpolation mode: {interpolation}. "
+                f"Must be one of {INTERPOLATION_MODES}."
+            )
+
+        self._cache = {}
+        self._values = OrderedDict()
         self.filename = filename
+        self.interpolation = interpolation
         self._k_warning_printed = False
-        self.coefficients = []
-        self._k_wavelength = None
-        self._k = None
-        self._n_formula = None
-        self._n_wavelength = None
-        self._n = None
-        self.reference_data = None
+        self._clear_data()
 
         self.formula_map = {
             "formula 1": self._formula_1,
@@ -68,8 +110,40 @@ class MaterialFile(BaseMaterial):
             "tabulated nk": self._tabulated_n,
         }
 
-        data = self._read_file()
-        self._parse_file(data)
+        self._load()
+
+    @classmethod
+    def enable_disk_cache(cls, directory):
+        """Store parsed material files on disk.
+
+        The parsed data of each material file is saved in the directory as a
+        NumPy `.npz` file, named after the hash of the material file contents.
+        Material files that are modified are therefore parsed again.
+
+        Args:
+            directory (str): The cache directory. It is created if needed.
+
+        """
+        os.makedirs(directory, exist_ok=True)
+        cls._cache_dir = str(directory)
+
+    @classmethod
+    def disable_disk_cache(cls):
+        """Stop using the disk cache of parsed material files."""
+        cls._cache_dir = None
+
+    @classmethod
+    def clear_parsed_cache(cls):
+        """Remove the parsed material files held in memory."""
+        cls._parsed.clear()
+
+    def __setattr__(self, name, value):
+        if name in _DATA_ATTRIBUTES and "_cache" in self.__dict__:
+            self._cache.clear()
+            self._values.clear()
+        super().__setattr__(name, value)
+        if name in _DATA_ATTRIBUTES and name.startswith("_"):
+            self._bump_revision()
 
     def n(self, wavelength):
         """Calculates the refractive index of the material at given wavelengths.
@@ -82,7 +156,7 @@ class MaterialFile(BaseMaterial):
 
         """
         func = self.formula_map[self._n_formula]
-        return func(wavelength)
+        return self._cached("n", func, wavelength)
 
     def k(self, wavelength):
         """Retrieves the extinction coefficient of the material at a
@@ -113,7 +187,98 @@ class MaterialFile(BaseMaterial):
                 return be.zeros_like(wavelength)
             return 0.0
 
-        return be.interp(wavelength, self._k_wavelength, self._k)
+        return self._cached("k", self._tabulated_k, wavelength)
+
+    def clear_cache(self):
+        """Remove the cached refractive indices and extinction coefficients.
+
+        The cache is cleared automatically when the material data is
+        replaced. This is only required if the material data is modified in
+        place after the material was used.
+        """
+        self._cache.clear()
+        self._values.clear()
+        self._bump_revision()
+
+    def _cached(self, name, func, wavelength):
+        """Evaluate a material property, caching the value per wavelength.
+
+        Values are cached for each distinct wavelength, up to
+        `_MAX_CACHED_VALUES` values per material, evicting the least recently
+        used values first. For arrays of wavelengths, the property is only
+        evaluated at the wavelengths that are not cached, and the values are
+        gathered for each element.
+
+        Args:
+            name (str): The name of the property, e.g. 'n'.
+            func (callable): The function that evaluates the property.
+            wavelength (float or be.ndarray): The wavelength(s) in microns.
+
+        Returns:
+            float or be.ndarray: The property at the given wavelength(s).
+
+        """
+        backend = be.backend_key()
+        if not be.is_array_like(wavelength):
+            key = (name, backend, "scalar", float(wavelength))
+            value = self._lookup(key)
+            if value is None:
+                value = be.to_numpy(func(wavelength))
+                self._store(key, value)
+            return be.array(value)
+
+        values, inverse = be.unique_wavelengths(wavelength)
+        table = [self._lookup((name, backend, w)) for w in values]
+        missing = [i for i, value in enumerate(table) if value is None]
+        if missing:
+            result = func(be.array([values[i] for i in missing]))
+            result = np.broadcast_to(np.ravel(be.to_numpy(result)), (len(missing),))
+            for i, value in zip(missing, result):
+                table[i] = float(value)
+                self._store((name, backend, values[i]), table[i])
+
+        table = np.array(table)
+        shape = tuple(getattr(wavelength, "shape", (len(wavelength),)))
+        if inverse is None:
+            return be.array(np.full(shape, table[0]))
+        return be.array(np.reshape(table[inverse], shape))
+
+    def _lookup(self, key):
+        """Returns a cached property value, or None if it is not cached."""
+        value = self._values.get(key)
+        if value is not None:
+            self._values.move_to_end(key)
+        return value
+
+    def _store(self, key, value):
+        """Cache a property value, evicting the least recently used value."""
+        self._values[key] = value
+        if len(self._values) > _MAX_CACHED_VALUES:
+            self._values.popitem(last=False)
+
+    def _interpolant(self, name, x, y):
+        """Returns the interpolant of tabulated data, building it if needed.
+
+        Interpolants are stored in the cache, so that they are rebuilt
+        when the material data changes.
+
+        Args:
+            name (str): The name of the property, e.g. 'n'.
+            x (be.ndarray): The tabulated wavelengths.
+            y (be.ndarray): The tabulated values.
+
+        Returns:
+            TabulatedInterpolant: The interpolant.
+
+        """
+        key = ("interpolant", name)
+        if key not in self._cache:
+            self._cache[key] = TabulatedInterpolant(x, y, self.interpolation)
+        return self._cache[key]
+
+    def _tabulated_k(self, w):
+        """Interpolate the extinction coefficient from tabulated data."""
+        return self._interpolant("k", self._k_wavelength, self._k)(w)
 
     def _formula_1(self, w):
         """Calculate the refractive index using dispersion formula 1 from
@@ -305,12 +470,145 @@ class MaterialFile(BaseMaterial):
             float or be.ndarray: Interpolated refractive index(s).
         """
         try:
-            return be.interp(w, self._n_wavelength, self._n)
+            return self._interpolant("n", self._n_wavelength, self._n)(w)
         except ValueError as err:  # Typically if _n_wavelength or _n is None or empty
             raise ValueError(
                 "No tabular refractive index data found or data is invalid."
             ) from err
 
+    def _clear_data(self):
+        """Reset the material data to an empty state before parsing."""
+        self.coefficients = []
+        self._k_wavelength = None
+        self._k = None
+        self._n_formula = None
+        self._n_wavelength = None
+        self._n = None
+        self.reference_data = None
+
+    def _load(self):
+        """Load the material data, parsing the material file if required."""
+        self._apply_record(self._parsed_record(self.filename))
+
+    @staticmethod
+    def _parsed_record(filename):
+        """Returns the parsed data of a material file.
+
+        The data is taken from the parsed material files held in memory, or
+        from the disk cache if enabled. The material file is only parsed if
+        neither holds it. The returned arrays are shared and must not be
+        modified.
+
+        Args:
+            filename (str): The path to the material file.
+
+        Returns:
+            dict: The parsed material data, with the dispersion formula under
+            'formula', the reference under 'reference', and NumPy arrays
+            under the names of the material data attributes, e.g.
+            'coefficients'.
+
+        """
+        stat = os.stat(filename)
+        key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+        record = MaterialFile._parsed.get(key)
+
+        if record is None:
+            path = MaterialFile._disk_cache_path(filename)
+            if path is not None and os.path.exists(path):
+                record = MaterialFile._read_record(path)
+            else:
+                parser = MaterialFile.__new__(MaterialFile)
+                parser.filename = filename
+                parser._clear_data()
+                parser._parse_file(parser._read_file())
+                record = parser._make_record()
+                if path is not None:
+                    MaterialFile._write_record(path, record)
+            MaterialFile._parsed[key] = record
+
+        return record
+
+    @staticmethod
+    def _disk_cache_path(filename):
+        """Returns the disk cache file of a material file, if enabled."""
+        if MaterialFile._cache_dir is None:
+            return None
+        with open(filename, "rb") as stream:
+            digest = hashlib.sha256(stream.read()).hexdigest()
+        return os.path.join(MaterialFile._cache_dir, f"{digest}.npz")
+
+    def _make_record(self):
+        """Returns the parsed material data with arrays as NumPy arrays."""
+        record = {"formula": self._n_formula, "reference": self.reference_data}
+        for name in _ARRAY_ATTRIBUTES:
+            value = getattr(self, name)
+            if value is not None and len(value) > 0:
+                record[name] = np.array(be.to_numpy(value))
+        return record
+
+    def _apply_record(self, record):
+        """Set the material data from parsed data.
+
+        Each instance gets its own copies of the arrays, so that modifying
+        the data of one material does not affect other materials.
+        """
+        for name in _ARRAY_ATTRIBUTES:
+            if name not in record:
+                continue
+            if name == "coefficients":
+                setattr(self, name, be.array(record[name]))
+            else:
+                setattr(self, name, be.asarray(record[name].copy()))
+        self._n_formula = record["formula"]
+        self.reference_data = record["reference"]
+
+    @staticmethod
+    def _read_record(path):
+        """Read parsed material data from a disk cache file.
+
+        Args:
+            path (str): The cache file.
+
+        Returns:
+            dict: The parsed material data.
+
+        """
+        with np.load(path, allow_pickle=False) as data:
+            record = {name: data[name] for name in _ARRAY_ATTRIBUTES if name in data}
+            record["formula"] = str(data["formula"]) if "formula" in data else None
+            record["reference"] = (
+                str(data["reference"]) if "reference" in data else None
+            )
+        return record
+
+    @staticmethod
+    def _write_record(path, record):
+        """Write parsed material data to a disk cache file.
+
+        Data that cannot be stored without pickling, e.g. structured
+        reference data, is not written to disk.
+
+        Args:
+            path (str): The cache file.
+            record (dict): The parsed material data.
+
+        """
+        arrays = {name: record[name] for name in _ARRAY_ATTRIBUTES if name in record}
+        for name in ("formula", "reference"):
+            value = record[name]
+            if value is None:
+                continue
+            if not isinstance(value, str):
+                return
+            arrays[name] = np.array(value)
+
+        # write to a temporary file first, so readers never see partial files
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as stream:
+            np.savez(stream, **arrays)
+        os.replace(temporary, path)
+
     def _read_file(self) -> dict:
         """Read the material YAML file.
 
@@ -383,6 +681,8 @@ class MaterialFile(BaseMaterial):
                 "filename": self.filename,
             },
         )
+        if self.interpolation != "linear":
+            material_dict["interpolation"] = self.interpolation
 
         return material_dict
 
@@ -400,5 +700,5 @@ class MaterialFile(BaseMaterial):
         if "filename" not in data:
             raise ValueError("Material file data missing filename.")
 
-        material = cls(data["filename"])
+        material = cls(data["filename"], data.get("interpolation", "linear"))
         return material
@@ -69,6 +69,7 @@ class Optic:
         self.solves = SolveManager(self)
         self.obj_space_telecentric = False
         self._updater = OpticUpdater(self)
+        self._revision = 0
 
     def __add__(self, other):
         """Add two Optic objects together."""
@@ -116,6 +117,18 @@ class Optic:
         """Reset the optical system to its initial state."""
         self._initialize_attributes()
 
+    def invalidate(self):
+        """Mark results cached from the current state of the optic as outdated.
+
+        This is called by the setters of the optic, by variable updates,
+        pickups and solves. Assigning the parameters of a geometry, material,
+        aperture or coordinate system directly, e.g. `geometry.radius`, is
+        tracked by their own revisions. This must be called manually after
+        modifying an array parameter element-wise, e.g. `material.index[0]`.
+        """
+        self._revision += 1
+        self.surface_group.index_table.clear()
+
     def add_surface(
         self,
         new_surface=None,
@@ -155,6 +168,7 @@ class Optic:
             material=material,
             **kwargs,
         )
+        self.invalidate()
 
     def add_field(self, y, x=0.0, vx=0.0, vy=0.0):
         """Add a field to the optical system.
@@ -171,6 +185,7 @@ class Optic:
         """
         new_field = Field(self.field_type, x, y, vx, vy)
         self.fields.add_field(new_field)
+        self.invalidate()
 
     def add_wavelength(self, value, is_primary=False, unit="um"):
         """Add a wavelength to the optical system.
@@ -183,6 +198,7 @@ class Optic:
 
         """
         self.wavelengths.add_wavelength(value, is_primary, unit)
+        self.invalidate()
 
     def set_aperture(self, aperture_type, value):
         """Set the aperture of the optical system.
@@ -193,6 +209,7 @@ class Optic:
 
         """
         self.aperture = Aperture(aperture_type, value)
+        self.invalidate()
 
     def set_field_type(self, field_type):
         """Set the type of field used in the optical system.
@@ -204,6 +221,7 @@ class Optic:
         if field_type not in ["angle", "object_height"]:
             raise ValueError('Invalid field type. Must be "angle" or "object_height".')
         self.field_type = field_type
+        self.invalidate()
 
     def set_radius(self, value, surface_number):
         """Set the radius of curvature of a surface.
@@ -406,7 +424,16 @@ class Optic:
             wavelength = self.primary_wavelength
         return self.surface_group.n(wavelength)
 
-    def trace(self, Hx, Hy, wavelength, num_rays=100, distribution="hexapolar"):
+    def trace(
+        self,
+        Hx,
+        Hy,
+        wavelength,
+        num_rays=100,
+        distribution="hexapolar",
+        record="all",
+        compact=False,
+    ):
         """Trace a distribution of rays through the optical system.
 
         Args:
@@ -419,14 +446,92 @@ class Optic:
                 The distribution of the rays. Can be a string identifier (e.g.,
                 'hexapolar', 'uniform') or a Distribution object.
                 Defaults to 'hexapolar'.
+            record (str or list[int], optional): Which surfaces record ray
+                information. Options are "all", "image_only", "none", or a
+                list of surface indices. Defaults to "all".
+            compact (bool, optional): If True, blocked and lost rays are not
+                traced through the remaining surfaces. They keep their state
+                at the surface on which they were dropped, and are recorded
+                with NaN positions on later surfaces. Defaults to False.
 
         Returns:
             RealRays: The RealRays object containing the traced rays.
 
         """
-        return self.ray_tracer.trace(Hx, Hy, wavelength, num_rays, distribution)
+        return self.ray_tracer.trace(
+            Hx, Hy, wavelength, num_rays, distribution, record, compact
+        )
+
+    def trace_iter(
+        self,
+        Hx,
+        Hy,
+        wavelength,
+        num_rays=100,
+        distribution="hexapolar",
+        chunk_size=100_000,
+        surface=-1,
+    ):
+        """Trace a distribution of rays through the optical system in chunks.
+
+        Ray data is yielded chunk by chunk so that very large numbers of rays
+        can be traced with bounded memory. See `optiland.raytrace.reducers`
+        for reducers that consume the stream.
+
+        Args:
+            Hx (float or be.ndarray): The normalized x field coordinate(s).
+            Hy (float or be.ndarray): The normalized y field coordinate(s).
+            wavelength (float): The wavelength of the rays in microns.
+            num_rays (int, optional): The number of rays to be traced.
+                Defaults to 100.
+            distribution (str or optiland.distribution.BaseDistribution, optional):
+                The distribution of the rays. Defaults to 'hexapolar'.
+            chunk_size (int, optional): The maximum number of rays traced at
+                once. Defaults to 100,000.
+            surface (int, optional): Index of the surface at which ray data is
+                yielded. Defaults to -1 (image surface).
 
-    def trace_generic(self, Hx, Hy, Px, Py, wavelength):
+        Yields:
+            RealRays: The rays of each chunk at the selected surface.
+
+        """
+        yield from self.ray_tracer.trace_chunks(
+            Hx, Hy, wavelength, num_rays, distribution, chunk_size, surface
+        )
+
+    def trace_batch(
+        self,
+        fields="all",
+        wavelengths="all",
+        num_rays=100,
+        distribution="hexapolar",
+        surface=-1,
+    ):
+        """Trace all combinations of fields and wavelengths in a single pass.
+
+        Args:
+            fields (str or list[tuple[float, float]], optional): The
+                normalized field coordinates. If 'all', all fields of the
+                optic are used. Defaults to 'all'.
+            wavelengths (str or list[float], optional): The wavelengths in
+                microns. Options are 'all', 'primary' or a list of
+                wavelengths. Defaults to 'all'.
+            num_rays (int, optional): The number of rays per field and
+                wavelength. Defaults to 100.
+            distribution (str or optiland.distribution.BaseDistribution, optional):
+                The pupil distribution of the rays. Defaults to 'hexapolar'.
+            surface (int, optional): Index of the surface at which the rays
+                are returned. Defaults to -1 (image surface).
+
+        Returns:
+            RayBatch: The traced rays, indexable by [field, wavelength].
+
+        """
+        return self.ray_tracer.trace_batch(
+            fields, wavelengths, num_rays, distribution, surface
+        )
+
+    def trace_generic(self, Hx, Hy, Px, Py, wavelength, record="all", compact=False):
         """Trace generic rays through the optical system.
 
         Args:
@@ -435,9 +540,18 @@ class Optic:
             Px (float or be.ndarray): The normalized x pupil coordinate(s).
             Py (float or be.ndarray): The normalized y pupil coordinate(s).
             wavelength (float): The wavelength of the rays in microns.
+            record (str or list[int], optional): Which surfaces record ray
+                information. Options are "all", "image_only", "none", or a
+                list of surface indices. Defaults to "all".
+            compact (bool, optional): If True, blocked and lost rays are not
+                traced through the remaining surfaces. They keep their state
+                at the surface on which they were dropped, and are recorded
+                with NaN positions on later surfaces. Defaults to False.
 
         """
-        return self.ray_tracer.trace_generic(Hx, Hy, Px, Py, wavelength)
+        return self.ray_tracer.trace_generic(
+            Hx, Hy, Px, Py, wavelength, record, compact
+        )
 
     def to_dict(self):
         """Convert the optical system to a dictionary.
@@ -46,6 +46,7 @@ class OpticUpdater:
             surface.geometry = new_geometry
         else:
             surface.geometry.radius = value
+        self.optic.invalidate()
 
     def set_conic(self, value, surface_number):
         """Set the conic constant of a surface.
@@ -57,6 +58,7 @@ class OpticUpdater:
         """
         surface = self.optic.surface_group.surfaces[surface_number]
         surface.geometry.k = value
+        self.optic.invalidate()
 
     def set_thickness(self, value, surface_number):
         """Set the thickness of a surface.
@@ -75,6 +77,7 @@ class OpticUpdater:
         positions = positions - positions[1]  # force surface 1 to be at zero
         for k, surface in enumerate(self.optic.surface_group.surfaces):
             surface.geometry.cs.z = be.array(positions[k])
+        self.optic.invalidate()
 
     def set_index(self, value, surface_number):
         """Set the index of refraction of a surface.
@@ -92,6 +95,7 @@ class OpticUpdater:
 
         surface_post = self.optic.surface_group.surfaces[surface_number + 1]
         surface_post.material_pre = new_material
+        self.optic.invalidate()
 
     def set_asphere_coeff(self, value, surface_number, aspher_coeff_idx):
         """Set the asphere coefficient on a surface
@@ -105,6 +109,8 @@ class OpticUpdater:
         """
         surface = self.optic.surface_group.surfaces[surface_number]
         surface.geometry.c[aspher_coeff_idx] = value
+        surface.geometry._bump_revision()  # the coefficients changed in place
+        self.optic.invalidate()
 
     def set_polarization(self, polarization: Union[PolarizationState, str]):
         """Set the polarization state of the optic.
@@ -121,6 +127,7 @@ class OpticUpdater:
                 'PolarizationState or "ignore".',
             )
         self.optic.polarization = polarization
+        self.optic.invalidate()
 
     def scale_system(self, scale_factor):
         """Scales the optical system by a given scale factor.
@@ -153,6 +160,7 @@ class OpticUpdater:
         for surface in self.optic.surface_group.surfaces:
             if surface.aperture is not None:
                 surface.aperture.scale(scale_factor)
+        self.optic.invalidate()
 
     def update_paraxial(self):
         """Update the semi-aperture of all surfaces based on paraxial marginal
@@ -166,6 +174,7 @@ class OpticUpdater:
         for k, surface in enumerate(self.optic.surface_group.surfaces):
             surface.set_semi_aperture(r_max=ya[k] + yb[k])
             self.update_normalization(surface)
+        self.optic.invalidate()
 
     def update_normalization(self, surface) -> None:
         """Update the normalization radius/factors of a given non-spherical surface.
@@ -212,3 +221,4 @@ class OpticUpdater:
         self.optic.surface_group.surfaces[-1].geometry.cs.z = (
             self.optic.surface_group.surfaces[-1].geometry.cs.z - offset
         )
+        self.optic.invalidate()
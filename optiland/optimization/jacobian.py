@@ -0,0 +1,180 @@
+"""Jacobian Module
+
+This module contains the ParallelJacobian class, which evaluates the
+forward-difference Jacobian of an optimization objective in parallel worker
+processes. Each worker holds its own copy of the optimizer, including the
+optimization problem and its optics, which is sent to the worker once, when
+the pool starts. For each Jacobian, the objective is evaluated once at the
+base point in the main process. The base value is sent to the workers with
+the perturbed variable vectors, and each worker returns the differences of
+the objective at a slice of the perturbed points. If the
+sparsity pattern of the Jacobian is known, structurally independent variables
+are perturbed together, which reduces the number of points.
+
+Kramer Harrison, 2025
+"""
+
+import numpy as np
+
+from optiland.optimization.sparsity import column_groups
+from optiland.parallel import OpticExecutor
+
+
+def _evaluate_differences(obj, method_name, f0, points):
+    """Evaluate a method of the worker copy of an object at several points.
+
+    Args:
+        obj: The copy of the object in the worker process.
+        method_name (str): The name of the method, which takes the vector of
+            variable values as its only argument.
+        f0 (np.ndarray): The value of the method at the base point.
+        points (list[np.ndarray]): The perturbed variable vectors.
+
+    Returns:
+        list[np.ndarray]: The differences of the values of the method at each
+            point and at the base point.
+
+    """
+    method = getattr(obj, method_name)
+    return [np.asarray(method(x), dtype=float) - f0 for x in points]
+
+
+class ParallelJacobian:
+    """Forward-difference Jacobian evaluated by a pool of worker processes.
+
+    The steps follow the SciPy default for forward differences, i.e. the
+    square root of the machine epsilon relative to the magnitude of each
+    variable. A step is reversed if it would leave the bounds of its
+    variable.
+
+    The object is copied into the workers when the pool is created. Its
+    method must only depend on the variable vector, as changes made to the
+    object afterwards are not seen by the workers.
+
+    Args:
+        obj: The object evaluating the objective, typically an optimizer.
+        method_name (str): The name of the method that evaluates the
+            objective. It takes the vector of variable values and returns a
+            float or a 1D array.
+        n_workers (int, optional): The number of worker processes. Defaults
+            to None, in which case the number of CPUs is used.
+        bounds (tuple, optional): The lower and upper bounds of the
+            variables, as two arrays. Defaults to None (unbounded).
+        mp_context (multiprocessing.context.BaseContext, optional): The
+            multiprocessing context used to start the workers. Defaults to
+            None, in which case the platform default is used.
+        sparsity (array-like, optional): Boolean array of shape
+            (num_outputs, num_variables), which is True where the Jacobian of
+            a vector objective may be nonzero. Defaults to None (dense).
+
+    Raises:
+        ValueError: If `n_workers` is not a positive integer.
+
+    """
+
+    def __init__(
+        self,
+        obj,
+        method_name,
+        n_workers=None,
+        bounds=None,
+        mp_context=None,
+        sparsity=None,
+    ):
+        self.method_name = method_name
+        self._method = getattr(obj, method_name)
+        self.bounds = bounds
+        self.sparsity = None
+        self.groups = None
+        if sparsity is not None:
+            self.sparsity = np.asarray(sparsity, dtype=bool)
+            self.groups = column_groups(self.sparsity)
+        self._executor = OpticExecutor(obj, n_workers, mp_context)
+        self.n_workers = self._executor.n_workers
+
+    def steps(self, x):
+        """Returns the finite-difference step of each variable.
+
+        Args:
+            x (np.ndarray): The variable values.
+
+        Returns:
+            np.ndarray: The signed steps.
+
+        """
+        x = np.asarray(x, dtype=float)
+        sign = np.where(x >= 0, 1.0, -1.0)
+        h = np.sqrt(np.finfo(float).eps) * sign * np.maximum(1.0, np.abs(x))
+        if self.bounds is not None:
+            lower, upper = (np.asarray(b, dtype=float) for b in self.bounds)
+            outside = (x + h > upper) | (x + h < lower)
+            h = np.where(outside, -h, h)
+        return h
+
+    def __call__(self, x):
+        """Evaluate the Jacobian of the objective.
+
+        The objective is evaluated at x in the main process. The n perturbed
+        points, or one point per group of columns if the sparsity pattern is
+        known, are split evenly between the workers.
+
+        Args:
+            x (array-like): The variable values.
+
+        Returns:
+            np.ndarray: The Jacobian, with shape (num_outputs, num_variables)
+                for a vector objective, or the gradient, with shape
+                (num_variables,), for a scalar objective.
+
+        """
+        x = np.asarray(x, dtype=float)
+        h = self.steps(x)
+        groups = self.groups or [[j] for j in range(x.size)]
+        points = []
+        for group in groups:
+            point = x.copy()
+            point[group] += h[group]
+            points.append(point)
+
+        f0 = np.asarray(self._method(x), dtype=float)
+        chunks = np.array_split(np.arange(len(points)), self.n_workers)
+        tasks = [
+            (self.method_name, f0, [points[i] for i in chunk])
+            for chunk in chunks
+            if chunk.size
+        ]
+        diffs = [
+            diff
+            for result in self._executor.map(_evaluate_differences, tasks)
+            for diff in result
+        ]
+
+        if self.groups is None:
+            columns = [diff / step for diff, step in zip(diffs, h)]
+            if f0.ndim == 0:
+                return np.array(columns)
+            return np.stack(columns, axis=-1).reshape(f0.size, x.size)
+
+        jac = np.zeros((f0.size, x.size))
+        for group, diff in zip(groups, diffs):
+            diff = diff.reshape(-1)
+            for j in group:
+                rows = self.sparsity[:, j]
+                jac[rows, j] = diff[rows] / h[j]
+        return jac
+
+    def shutdown(self, wait=True):
+        """Shut down the worker processes.
+
+        Args:
+            wait (bool, optional): Whether to wait for pending tasks to
+                complete. Defaults to True.
+
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
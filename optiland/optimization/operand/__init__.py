@@ -4,4 +4,5 @@ from .paraxial import ParaxialOperand
 from .aberration import AberrationOperand
 from .ray import RayOperand
 from .operand import Operand, operand_registry
+from .evaluation_plan import EvaluationPlan
 from .operand_manager import OperandManager
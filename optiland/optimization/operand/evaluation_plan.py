@@ -0,0 +1,175 @@
+"""Evaluation Plan Module
+
+This module contains the EvaluationPlan class, which shares real ray traces
+between the operands of a merit function. Operands that trace a single real
+ray, such as the real ray intercepts and direction cosines, are grouped by
+optic, field and wavelength. The pupil points of each group are traced
+together in one vectorized trace, and the operands read their values from the
+shared result instead of tracing their own ray.
+
+Kramer Harrison, 2025
+"""
+
+from contextlib import contextmanager
+from numbers import Real
+from types import SimpleNamespace
+
+import optiland.backend as be
+from optiland.optimization.operand.operand import operand_registry
+from optiland.optimization.operand.ray import RayOperand
+
+# operand functions that trace a single real ray
+SINGLE_RAY_FUNCTIONS = (
+    RayOperand.x_intercept,
+    RayOperand.y_intercept,
+    RayOperand.z_intercept,
+    RayOperand.x_intercept_lcs,
+    RayOperand.y_intercept_lcs,
+    RayOperand.z_intercept_lcs,
+    RayOperand.L,
+    RayOperand.M,
+    RayOperand.N,
+)
+
+RAY_ATTRIBUTES = ("x", "y", "z", "L", "M", "N")
+
+
+class EvaluationPlan:
+    """Plan for evaluating a list of operands with shared ray traces.
+
+    The plan groups the single-ray operands by optic, field and wavelength.
+    Operands whose inputs are not real scalars, and all other operand types,
+    are evaluated as usual.
+
+    Args:
+        operands (list[Operand]): The operands to evaluate.
+
+    Attributes:
+        operands (list[Operand]): The operands to evaluate.
+        groups (dict): Maps (optic id, Hx, Hy, wavelength) to the optic and
+            the list of distinct (Px, Py) pupil points of the group.
+
+    """
+
+    def __init__(self, operands):
+        self.operands = list(operands)
+        self.groups = {}
+        self._traces = None
+        for op in self.operands:
+            key = self._group_key(op)
+            if key is None:
+                continue
+            _, pupil_points = self.groups.setdefault(
+                key[:-1], (op.input_data["optic"], [])
+            )
+            if key[-1] not in pupil_points:
+                pupil_points.append(key[-1])
+
+    @property
+    def num_traces(self):
+        """int: The number of shared traces performed by the plan."""
+        return len(self.groups)
+
+    @staticmethod
+    def _group_key(op):
+        """Returns the group and pupil point of a single-ray operand.
+
+        Args:
+            op (Operand): The operand.
+
+        Returns:
+            tuple or None: (optic id, Hx, Hy, wavelength, (Px, Py)), or None if
+            the operand does not trace a single real ray with scalar inputs.
+
+        """
+        if operand_registry.get(op.operand_type) not in SINGLE_RAY_FUNCTIONS:
+            return None
+        data = op.input_data
+        try:
+            values = [data[name] for name in ("Hx", "Hy", "Px", "Py", "wavelength")]
+        except KeyError:
+            return None
+        if "optic" not in data or not all(isinstance(v, Real) for v in values):
+            return None
+        Hx, Hy, Px, Py, wavelength = (float(v) for v in values)
+        return id(data["optic"]), Hx, Hy, wavelength, (Px, Py)
+
+    def _trace(self):
+        """Trace the pupil points of each group in a single trace.
+
+        Returns:
+            dict: Maps each group key to the recorded ray data, with arrays
+            of shape (num_surfaces, num_rays), and the index of each pupil
+            point in it.
+
+        """
+        traces = {}
+        for key, (optic, pupil_points) in self.groups.items():
+            _, Hx, Hy, wavelength = key
+            Px = be.array([point[0] for point in pupil_points])
+            Py = be.array([point[1] for point in pupil_points])
+            optic.trace_generic(Hx, Hy, Px, Py, wavelength)
+
+            surface_group = optic.surface_group
+            data = SimpleNamespace(
+                **{
+                    name: be.copy(getattr(surface_group, name))
+                    for name in RAY_ATTRIBUTES
+                }
+            )
+            index = {point: i for i, point in enumerate(pupil_points)}
+            traces[key] = (data, index)
+        return traces
+
+    def lookup(self, optic, Hx, Hy, Px, Py, wavelength):
+        """Find a ray in the shared traces.
+
+        Args:
+            optic (Optic): The optic.
+            Hx (float): The normalized x field coordinate.
+            Hy (float): The normalized y field coordinate.
+            Px (float): The normalized x pupil coordinate.
+            Py (float): The normalized y pupil coordinate.
+            wavelength (float): The wavelength of the ray.
+
+        Returns:
+            tuple or None: The ray data and the index of the ray in it, or
+            None if the ray was not traced by the plan.
+
+        """
+        values = (Hx, Hy, Px, Py, wavelength)
+        if self._traces is None or not all(isinstance(v, Real) for v in values):
+            return None
+        trace = self._traces.get((id(optic), float(Hx), float(Hy), float(wavelength)))
+        if trace is None:
+            return None
+        data, index = trace
+        i = index.get((float(Px), float(Py)))
+        return None if i is None else (data, i)
+
+    @contextmanager
+    def shared_traces(self):
+        """Context in which the single-ray operands use the shared traces.
+
+        The groups are traced when the context is entered. The traces are
+        only valid while the optics are unchanged, so the context should
+        span a single merit function evaluation.
+        """
+        self._traces = self._trace()
+        previous = RayOperand._shared_traces
+        RayOperand._shared_traces = self
+        try:
+            yield self
+        finally:
+            RayOperand._shared_traces = previous
+            self._traces = None
+
+    def evaluate(self):
+        """Evaluate the objective function values of the operands.
+
+        Returns:
+            be.ndarray: The weighted deltas of the operands.
+
+        """
+        with self.shared_traces():
+            return be.array([op.fun() for op in self.operands])
@@ -1,4 +1,5 @@
 from optiland.optimization.operand import Operand
+from optiland.optimization.operand.evaluation_plan import EvaluationPlan
 
 
 class OperandManager:
@@ -11,6 +12,8 @@ class OperandManager:
         add(operand_type, target, weight=1, input_data={}): Add an operand to
             the merit function.
         clear(): Clear all operands from the merit function.
+        evaluate(): Evaluate all operands, sharing the ray traces between
+            them.
 
     """
 
@@ -49,6 +52,28 @@ class OperandManager:
         """Clear all operands from the merit function"""
         self.operands = []
 
+    def plan(self):
+        """Build the evaluation plan of the current operands.
+
+        Returns:
+            EvaluationPlan: The plan, which groups the single-ray operands by
+                optic, field and wavelength.
+
+        """
+        return EvaluationPlan(self.operands)
+
+    def evaluate(self):
+        """Evaluate the objective function values of all operands.
+
+        The single-ray operands of each optic, field and wavelength are
+        traced together in one trace, and read their values from it.
+
+        Returns:
+            be.ndarray: The weighted deltas of the operands.
+
+        """
+        return self.plan().evaluate()
+
     def __iter__(self):
         """Return the iterator object itself"""
         self._index = 0
@@ -33,6 +33,34 @@ class RayOperand:
 
     """
 
+    # set by EvaluationPlan.shared_traces during a merit function evaluation
+    _shared_traces = None
+
+    @staticmethod
+    def _trace_ray(optic, Hx, Hy, Px, Py, wavelength):
+        """Traces a single real ray, unless it was already traced in a shared
+            trace of the current evaluation plan.
+
+        Args:
+            optic: The optic object.
+            Hx: The normalized x field coordinate.
+            Hy: The normalized y field coordinate.
+            Px: The normalized x pupil coordinate.
+            Py: The normalized y pupil coordinate.
+            wavelength: The wavelength of the ray.
+
+        Returns:
+            tuple: The ray data, with x, y, z, L, M and N arrays of shape
+                (num_surfaces, num_rays), and the index of the ray in it.
+
+        """
+        if RayOperand._shared_traces is not None:
+            shared = RayOperand._shared_traces.lookup(optic, Hx, Hy, Px, Py, wavelength)
+            if shared is not None:
+                return shared
+        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
+        return optic.surface_group, 0
+
     @staticmethod
     def x_intercept(optic, surface_number, Hx, Hy, Px, Py, wavelength):
         """Calculates the x-coordinate of the intercept point on a specific
@@ -51,8 +79,8 @@ class RayOperand:
             The x-coordinate of the intercept point.
 
         """
-        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
-        return optic.surface_group.x[surface_number, 0]
+        rays, index = RayOperand._trace_ray(optic, Hx, Hy, Px, Py, wavelength)
+        return rays.x[surface_number, index]
 
     @staticmethod
     def y_intercept(optic, surface_number, Hx, Hy, Px, Py, wavelength):
@@ -72,8 +100,8 @@ class RayOperand:
             The y-coordinate of the intercept point.
 
         """
-        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
-        return optic.surface_group.y[surface_number, 0]
+        rays, index = RayOperand._trace_ray(optic, Hx, Hy, Px, Py, wavelength)
+        return rays.y[surface_number, index]
 
     @staticmethod
     def z_intercept(optic, surface_number, Hx, Hy, Px, Py, wavelength):
@@ -93,8 +121,8 @@ class RayOperand:
             The z-coordinate of the intercept point.
 
         """
-        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
-        return optic.surface_group.z[surface_number, 0]
+        rays, index = RayOperand._trace_ray(optic, Hx, Hy, Px, Py, wavelength)
+        return rays.z[surface_number, index]
 
     @staticmethod
     def x_intercept_lcs(optic, surface_number, Hx, Hy, Px, Py, wavelength):
@@ -114,8 +142,8 @@ class RayOperand:
             The x-coordinate of the intercept point.
 
         """
-        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
-        intercept = optic.surface_group.x[surface_number, 0]
+        rays, index = RayOperand._trace_ray(optic, Hx, Hy, Px, Py, wavelength)
+        intercept = rays.x[surface_number, index]
         decenter = optic.surface_group.surfaces[surface_number].geometry.cs.x
         return intercept - decenter
 
@@ -137,8 +165,8 @@ class RayOperand:
             The y-coordinate of the intercept point.
 
         """
-        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
-        intercept = optic.surface_group.y[surface_number, 0]
+        rays, index = RayOperand._trace_ray(optic, Hx, Hy, Px, Py, wavelength)
+        intercept = rays.y[surface_number, index]
         decenter = optic.surface_group.surfaces[surface_number].geometry.cs.y
         return intercept - decenter
 
@@ -160,8 +188,8 @@ class RayOperand:
             The z-coordinate of the intercept point.
 
         """
-        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
-        intercept = optic.surface_group.z[surface_number, 0]
+        rays, index = RayOperand._trace_ray(optic, Hx, Hy, Px, Py, wavelength)
+        intercept = rays.z[surface_number, index]
         decenter = optic.surface_group.surfaces[surface_number].geometry.cs.z
 
         # For some reason decenter can sometimes be a single-element array.
@@ -189,8 +217,8 @@ class RayOperand:
             The direction cosine L of the ray.
 
         """
-        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
-        return optic.surface_group.L[surface_number, 0]
+        rays, index = RayOperand._trace_ray(optic, Hx, Hy, Px, Py, wavelength)
+        return rays.L[surface_number, index]
 
     @staticmethod
     def M(optic, surface_number, Hx, Hy, Px, Py, wavelength):
@@ -209,8 +237,8 @@ class RayOperand:
             The direction cosine M of the ray.
 
         """
-        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
-        return optic.surface_group.M[surface_number, 0]
+        rays, index = RayOperand._trace_ray(optic, Hx, Hy, Px, Py, wavelength)
+        return rays.M[surface_number, index]
 
     @staticmethod
     def N(optic, surface_number, Hx, Hy, Px, Py, wavelength):
@@ -229,8 +257,8 @@ class RayOperand:
             The direction cosine N of the ray.
 
         """
-        optic.trace_generic(Hx, Hy, Px, Py, wavelength)
-        return optic.surface_group.N[surface_number, 0]
+        rays, index = RayOperand._trace_ray(optic, Hx, Hy, Px, Py, wavelength)
+        return rays.N[surface_number, index]
 
     @staticmethod
     def rms_spot_size(
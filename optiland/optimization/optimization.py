@@ -9,14 +9,21 @@ Kramer Harrison, 2024
 """
 
 import warnings
+from contextlib import nullcontext
 
+import numpy as np
 import pandas as pd
 from scipy import optimize
 
 import optiland.backend as be
-from optiland.optimization.operand import OperandManager
+from optiland.optimization.jacobian import ParallelJacobian
+from optiland.optimization.operand import EvaluationPlan, OperandManager
+from optiland.optimization.sparsity import declared_sparsity, probed_sparsity
 from optiland.optimization.variable import VariableManager
 
+# methods of scipy.optimize.minimize that do not use the gradient
+GRADIENT_FREE_METHODS = ("nelder-mead", "powell", "cobyla", "cobyqa")
+
 
 class OptimizationProblem:
     """Represents an optimization problem.
@@ -47,11 +54,6 @@ class OptimizationProblem:
         self.variables = VariableManager()
         self.initial_value = 0.0
 
-        if be.get_backend() != "numpy":
-            raise ValueError(
-                "Optiland optimization currently only supports NumPy backend."
-            )
-
     def add_operand(
         self,
         operand_type=None,
@@ -82,7 +84,7 @@ class OptimizationProblem:
 
     def fun_array(self):
         """Array of operand weighted deltas squared"""
-        return be.array([op.fun() for op in self.operands]) ** 2
+        return EvaluationPlan(self.operands).evaluate() ** 2
 
     def sum_squared(self):
         """Calculate the sum of squared operand weighted deltas"""
@@ -166,6 +168,11 @@ class OptimizationProblem:
 class OptimizerGeneric:
     """Generic optimizer class for solving optimization problems.
 
+    With the torch backend, the gradient of the objective function is
+    computed by automatic differentiation and passed to SciPy, instead of
+    being approximated by finite differences. Otherwise, the finite
+    differences can be evaluated in parallel worker processes.
+
     Args:
         problem (OptimizationProblem): The optimization problem to be solved.
 
@@ -179,17 +186,132 @@ class OptimizerGeneric:
             using the specified parameters.
         undo(): Undo the last optimization step.
         _fun(x): Internal function to evaluate the objective function.
+        _grad(x): Internal function to evaluate the gradient of the
+            objective function by automatic differentiation, or by finite
+            differences if autodiff is not supported.
 
     """
 
     def __init__(self, problem: OptimizationProblem):
         self.problem = problem
         self._x = []
+        self._finite_differences = False
 
         if self.problem.initial_value == 0.0:
             self.problem.initial_value = self.problem.sum_squared()
 
-    def optimize(self, method=None, maxiter=1000, disp=True, tol=1e-3, callback=None):
+    def _use_autodiff(self, method=None):
+        """Check whether derivatives are computed by automatic differentiation.
+
+        Args:
+            method (str, optional): The SciPy minimization method.
+
+        Returns:
+            bool: True for the torch backend, unless the method does not use
+                the gradient.
+
+        """
+        if be.get_backend() != "torch":
+            return False
+        return method is None or method.lower() not in GRADIENT_FREE_METHODS
+
+    def _residuals(self, x):
+        """Operand weighted deltas as a function of the variables.
+
+        The variables are updated with the given values, so that the result
+        can be differentiated with respect to them.
+
+        Args:
+            x (be.ndarray): The values of the variables.
+
+        Returns:
+            be.ndarray: The weighted deltas of the operands.
+
+        """
+        for idvar, var in enumerate(self.problem.variables):
+            var.update(x[idvar])
+        self.problem.update_optics()
+        return EvaluationPlan(self.problem.operands).evaluate()
+
+    def _autodiff_jacobian(self, residuals, objective, x):
+        """Jacobian of an objective by automatic differentiation.
+
+        If the objective cannot be differentiated by autodiff, a warning is
+        issued, and the Jacobian is approximated by forward differences for
+        the rest of the optimization.
+
+        Args:
+            residuals (callable): The objective as a function of backend
+                variables, which is differentiated by autodiff.
+            objective (callable): The objective as a function of NumPy
+                variables, which is used for finite differences.
+            x (array-like): The values of the variables.
+
+        Returns:
+            np.ndarray: The Jacobian of the objective.
+
+        """
+        if not self._finite_differences:
+            try:
+                return be.to_numpy(be.jacobian(residuals, x))
+            except be.AutodiffUnsupportedError as error:
+                warnings.warn(
+                    f"Automatic differentiation failed ({error}). Falling back "
+                    "to finite differences.",
+                    stacklevel=2,
+                )
+                self._finite_differences = True
+        return optimize.approx_fprime(np.asarray(x, dtype=float), objective)
+
+    def _grad(self, x):
+        """Internal function to evaluate the gradient of the objective function.
+
+        Args:
+            x (array-like): The values of the variables.
+
+        Returns:
+            np.ndarray: The gradient of the sum of squared operand weighted
+                deltas.
+
+        """
+        grad = self._autodiff_jacobian(
+            lambda x: be.sum(self._residuals(x) ** 2), self._fun, x
+        )
+        return np.nan_to_num(grad, nan=0.0, posinf=0.0, neginf=0.0)
+
+    def _parallel_jacobian(self, method_name, n_workers, bounds, sparsity=None):
+        """Create the parallel finite-difference Jacobian of an objective.
+
+        Args:
+            method_name (str): The name of the objective method.
+            n_workers (int or None): The number of worker processes.
+            bounds (tuple): The (lower, upper) bounds of each variable, where
+                None means unbounded.
+            sparsity (np.ndarray, optional): The sparsity pattern of the
+                Jacobian. Defaults to None (dense).
+
+        Returns:
+            ParallelJacobian or nullcontext: The Jacobian provider, or an
+                empty context yielding None if `n_workers` is None.
+
+        """
+        if n_workers is None:
+            return nullcontext()
+        lower = [-np.inf if b[0] is None else float(b[0]) for b in bounds]
+        upper = [np.inf if b[1] is None else float(b[1]) for b in bounds]
+        return ParallelJacobian(
+            self, method_name, n_workers, (lower, upper), sparsity=sparsity
+        )
+
+    def optimize(
+        self,
+        method=None,
+        maxiter=1000,
+        disp=True,
+        tol=1e-3,
+        callback=None,
+        n_workers=None,
+    ):
         """Optimize the problem using the specified parameters.
 
         Args:
@@ -203,6 +325,10 @@ class OptimizerGeneric:
                 Default is True.
             tol (float, optional): Tolerance for convergence. Default is 1e-3.
             callback (callable): A callable called after each iteration.
+            n_workers (int, optional): If given, the finite-difference
+                gradient is evaluated by this number of worker processes.
+                Ignored with the torch backend and for gradient-free methods.
+                Default is None.
 
         Returns:
             result (OptimizeResult): The optimization result.
@@ -215,12 +341,19 @@ class OptimizerGeneric:
 
         options = {"maxiter": maxiter, "disp": disp}
 
-        with warnings.catch_warnings():
+        use_autodiff = self._use_autodiff(method)
+        self._finite_differences = False
+        if use_autodiff or (method or "").lower() in GRADIENT_FREE_METHODS:
+            n_workers = None
+
+        parallel_jacobian = self._parallel_jacobian("_fun", n_workers, bounds)
+        with warnings.catch_warnings(), parallel_jacobian as jacobian:
             warnings.simplefilter("ignore", category=RuntimeWarning)
             result = optimize.minimize(
                 self._fun,
                 x0,
                 method=method,
+                jac=self._grad if use_autodiff else jacobian,
                 bounds=bounds,
                 options=options,
                 tol=tol,
@@ -275,6 +408,43 @@ class LeastSquares(OptimizerGeneric):
     def __init__(self, problem: OptimizationProblem):
         super().__init__(problem)
 
+    def _jac_sparsity(self, jac_sparsity, x):
+        """
+        Internal function to resolve the sparsity pattern of the Jacobian.
+        'jac_sparsity' is None, 'declared', 'probe' or an array of shape
+        (num_operands, num_variables). Returns None or a boolean array.
+        """
+        if jac_sparsity is None:
+            return None
+        if isinstance(jac_sparsity, str):
+            if jac_sparsity == "declared":
+                return declared_sparsity(self.problem)
+            if jac_sparsity == "probe":
+                return probed_sparsity(self.problem, x)
+            raise ValueError(f'Invalid Jacobian sparsity "{jac_sparsity}"')
+
+        sparsity = np.asarray(jac_sparsity, dtype=bool)
+        expected_shape = (len(self.problem.operands), len(self.problem.variables))
+        if sparsity.shape != expected_shape:
+            raise ValueError(
+                f"Jacobian sparsity must have shape {expected_shape}, "
+                f"got {sparsity.shape}."
+            )
+        return sparsity
+
+    def _compute_jacobian(self, x_numpy_variables_from_scipy):
+        """
+        Internal function to compute the Jacobian of the residuals with respect
+        to the variables by automatic differentiation (torch backend only).
+        Falls back to finite differences if autodiff is not supported.
+        """
+        jac = self._autodiff_jacobian(
+            self._residuals,
+            self._compute_residuals_vector,
+            x_numpy_variables_from_scipy,
+        )
+        return np.nan_to_num(jac, nan=0.0, posinf=0.0, neginf=0.0)
+
     def _compute_residuals_vector(self, x_numpy_variables_from_scipy):
         """
         Internal function to update variables and compute the vector of residuals.
@@ -289,9 +459,7 @@ class LeastSquares(OptimizerGeneric):
         self.problem.update_optics()
 
         try:
-            residuals_backend_array = be.array(
-                [op.fun() for op in self.problem.operands]
-            )
+            residuals_backend_array = EvaluationPlan(self.problem.operands).evaluate()
 
             # Handle cases where ray tracing might fail and produce NaNs
             if be.any(be.isnan(residuals_backend_array)):
@@ -299,7 +467,7 @@ class LeastSquares(OptimizerGeneric):
                 # Return a vector of large constant values to penalize this region
                 # The magnitude should be large enough to indicate a poor solution.
                 error_value = be.sqrt(1e10 / num_operands if num_operands > 0 else 1e10)
-                return be.to_numpy(be.full(num_operands, error_value))
+                return be.to_numpy(be.full((num_operands,), error_value))
 
             return be.to_numpy(
                 residuals_backend_array
@@ -313,10 +481,16 @@ class LeastSquares(OptimizerGeneric):
             num_operands = len(self.problem.operands)
             error_value = be.sqrt(1e10 / num_operands if num_operands > 0 else 1e10)
             # Return a vector of large constant values
-            return be.to_numpy(be.full(num_operands, error_value))
+            return be.to_numpy(be.full((num_operands,), error_value))
 
     def optimize(
-        self, maxiter=None, disp=False, tol=1e-3, method_choice="lm"
+        self,
+        maxiter=None,
+        disp=False,
+        tol=1e-3,
+        method_choice="lm",
+        n_workers=None,
+        jac_sparsity=None,
     ):  # Default to 'lm' for DLS
         """
         Optimize the problem using a SciPy least squares method.
@@ -335,6 +509,21 @@ class LeastSquares(OptimizerGeneric):
                                          'dogbox': Dogleg algorithm
                                          (supports bounds).
                                          Defaults to 'lm'.
+            n_workers (int, optional): If given, the finite-difference Jacobian
+                                       is evaluated by this number of worker
+                                       processes. Ignored with the torch
+                                       backend.
+            jac_sparsity (str or array-like, optional): Sparsity pattern of the
+                                       finite-difference Jacobian, so that
+                                       independent variables are perturbed
+                                       together. 'declared' uses the
+                                       structure of the operands and
+                                       variables, 'probe' also probes it
+                                       numerically once, or a boolean array
+                                       of shape (num_operands, num_variables)
+                                       gives it explicitly. Not supported by
+                                       'lm'. Ignored with the torch backend.
+                                       Defaults to None (dense).
         """
 
         x0_scaled_values = [var.value for var in self.problem.variables]
@@ -353,9 +542,22 @@ class LeastSquares(OptimizerGeneric):
         num_variables = len(x0_numpy)
         original_method_choice = method_choice  # Store for warning message
 
+        use_autodiff = self._use_autodiff()
+        self._finite_differences = False
+        sparsity = None
+        if not use_autodiff:
+            sparsity = self._jac_sparsity(jac_sparsity, x0_numpy)
+
         # Validate and adjust method_choice
         if method_choice == "lm":
-            if num_residuals < num_variables:
+            if sparsity is not None:
+                print(
+                    "Warning: Method 'lm' (Levenberg-Marquardt) chosen, "
+                    "but a Jacobian sparsity pattern is given. "
+                    "This is not supported by 'lm'. Switching to 'trf' method."
+                )
+                method_choice = "trf"
+            elif num_residuals < num_variables:
                 print(
                     f"Warning: Method 'lm' (Levenberg-Marquardt) "
                     f"chosen, but number of residuals ({num_residuals}) is less "
@@ -406,11 +608,27 @@ class LeastSquares(OptimizerGeneric):
 
         scipy_verbose_level = 1 if disp else 0
 
-        with warnings.catch_warnings():
+        if use_autodiff:
+            n_workers = None
+        if method_choice == "lm":
+            current_bounds_scaled = [(None, None)] * num_variables
+
+        parallel_jacobian = self._parallel_jacobian(
+            "_compute_residuals_vector", n_workers, current_bounds_scaled, sparsity
+        )
+        with warnings.catch_warnings(), parallel_jacobian as jacobian:
             warnings.simplefilter("ignore", category=RuntimeWarning)
+            if use_autodiff:
+                jac = self._compute_jacobian
+            else:
+                jac = "2-point" if jacobian is None else jacobian
+            if jacobian is not None:
+                sparsity = None  # columns are grouped by the parallel Jacobian
             result = optimize.least_squares(
                 self._compute_residuals_vector,
                 x0_numpy,
+                jac=jac,
+                jac_sparsity=sparsity,
                 method=method_choice,
                 bounds=actual_bounds_for_scipy,
                 max_nfev=maxiter,
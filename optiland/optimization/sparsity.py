@@ -0,0 +1,234 @@
+"""Sparsity Module
+
+This module determines the sparsity pattern of the Jacobian of the operands of
+an optimization problem with respect to its variables. The pattern is either
+declared from the structure of the operands and variables, or probed
+numerically. It can be passed to SciPy's least squares solver, which then
+groups structurally independent variables and perturbs several of them per
+finite-difference evaluation of the merit function.
+
+Kramer Harrison, 2025
+"""
+
+from numbers import Integral
+
+import numpy as np
+
+import optiland.backend as be
+from optiland.optimization.operand.aberration import AberrationOperand
+from optiland.optimization.operand.evaluation_plan import (
+    SINGLE_RAY_FUNCTIONS,
+    EvaluationPlan,
+)
+from optiland.optimization.operand.operand import operand_registry
+from optiland.optimization.operand.paraxial import ParaxialOperand
+
+# operand functions computed from paraxial rays only
+PARAXIAL_FUNCTIONS = tuple(
+    getattr(cls, name)
+    for cls in (ParaxialOperand, AberrationOperand)
+    for name, attr in vars(cls).items()
+    if isinstance(attr, staticmethod)
+)
+
+# variable types that only change the sag beyond the paraxial region
+SHAPE_VARIABLE_TYPES = (
+    "conic",
+    "asphere_coeff",
+    "polynomial_coeff",
+    "chebyshev_coeff",
+    "zernike_coeff",
+)
+
+
+def _is_downstream(optic, surface_number, variable_surface):
+    """Check whether a variable lies behind the surface of a real ray.
+
+    A real ray reaches a surface without passing any later surface, and it
+    is launched using the paraxial entrance pupil, which only depends on the
+    surfaces up to the stop. This does not hold if pickups or solves couple
+    the surfaces, or if the aperture is defined in image space.
+
+    Args:
+        optic (Optic): The optic of the operand and the variable.
+        surface_number (int): The surface at which the ray is evaluated.
+        variable_surface (int): The surface of the variable.
+
+    Returns:
+        bool: True if the variable cannot change the ray at the surface.
+
+    """
+    if not isinstance(surface_number, Integral):
+        return False
+    if not isinstance(variable_surface, Integral):
+        return False
+    if len(optic.pickups) or len(optic.solves):
+        return False
+    if optic.aperture is None or optic.aperture.ap_type == "imageFNO":
+        return False
+
+    try:
+        stop_index = optic.surface_group.stop_index
+    except ValueError:
+        return False
+
+    num_surfaces = optic.surface_group.num_surfaces
+    surface_number %= num_surfaces
+    variable_surface %= num_surfaces
+    return variable_surface > max(surface_number, stop_index)
+
+
+def _depends(operand, variable):
+    """Check whether an operand may depend on a variable.
+
+    Args:
+        operand (Operand): The operand.
+        variable (Variable): The variable.
+
+    Returns:
+        bool: False if the operand is structurally independent of the
+            variable, True otherwise.
+
+    """
+    data = operand.input_data or {}
+    optic = data.get("optic")
+    if optic is None:
+        return True
+    if optic is not variable.optic:
+        return False
+
+    func = operand_registry.get(operand.operand_type)
+    if func in PARAXIAL_FUNCTIONS:
+        return variable.type not in SHAPE_VARIABLE_TYPES
+    if func in SINGLE_RAY_FUNCTIONS:
+        return not _is_downstream(
+            optic,
+            data.get("surface_number"),
+            getattr(variable, "surface_number", None),
+        )
+    return True
+
+
+def declared_sparsity(problem):
+    """Sparsity pattern declared by the operands and variables of a problem.
+
+    An operand is independent of a variable if they belong to different
+    optics, if the operand is paraxial and the variable only changes the
+    aspheric or freeform shape of a surface, or if the operand traces a real
+    ray to a surface in front of the variable and the stop. All other
+    operand-variable pairs are assumed to be dependent.
+
+    Args:
+        problem (OptimizationProblem): The optimization problem.
+
+    Returns:
+        np.ndarray: Boolean array of shape (num_operands, num_variables),
+            which is False where the operand does not depend on the variable.
+
+    """
+    return np.array(
+        [
+            [_depends(operand, variable) for variable in problem.variables]
+            for operand in problem.operands
+        ],
+        dtype=bool,
+    ).reshape(len(problem.operands), len(problem.variables))
+
+
+def _operand_values(problem, x):
+    """Values of the operands of a problem for given variable values.
+
+    Args:
+        problem (OptimizationProblem): The optimization problem.
+        x (np.ndarray): The values of the variables.
+
+    Returns:
+        np.ndarray: The operand values, or NaN if they cannot be evaluated.
+
+    """
+    for idvar, var in enumerate(problem.variables):
+        var.update(x[idvar])
+    problem.update_optics()
+
+    plan = EvaluationPlan(problem.operands)
+    try:
+        with plan.shared_traces():
+            values = [float(be.to_numpy(op.value)) for op in plan.operands]
+    except Exception:
+        return np.full(len(plan.operands), np.nan)
+    return np.array(values)
+
+
+def probed_sparsity(problem, x=None, rel_step=1e-6):
+    """Sparsity pattern of a problem probed by finite differences.
+
+    Each variable is perturbed once, and the operands whose value changes
+    are marked as dependent on it. The values of the operands are compared,
+    rather than their weighted deltas, so that inequality operands within
+    their bounds are not mistaken as independent. Operands that cannot be
+    evaluated are marked as dependent. The result is combined with the
+    declared sparsity pattern.
+
+    Args:
+        problem (OptimizationProblem): The optimization problem.
+        x (array-like, optional): The values of the variables at which the
+            pattern is probed. Defaults to None, in which case the current
+            values are used.
+        rel_step (float, optional): The step of each variable, relative to
+            its magnitude. Defaults to 1e-6.
+
+    Returns:
+        np.ndarray: Boolean array of shape (num_operands, num_variables),
+            which is False where the operand does not depend on the variable.
+
+    """
+    x0 = be.to_numpy([var.value for var in problem.variables]).astype(float)
+    x = x0 if x is None else np.asarray(x, dtype=float)
+    sparsity = declared_sparsity(problem)
+
+    try:
+        f0 = _operand_values(problem, x)
+        for j in range(x.size):
+            if not sparsity[:, j].any():
+                continue
+            x_step = x.copy()
+            x_step[j] += rel_step * max(1.0, abs(x[j]))
+            sparsity[:, j] &= _operand_values(problem, x_step) != f0
+    finally:
+        for idvar, var in enumerate(problem.variables):
+            var.update(x0[idvar])
+        problem.update_optics()
+
+    return sparsity
+
+
+def column_groups(sparsity):
+    """Group the columns of a sparse Jacobian for finite differences.
+
+    Columns in the same group have no nonzero rows in common, so that their
+    variables can be perturbed together in a single evaluation. The columns
+    are assigned greedily to the first compatible group, following Curtis,
+    Powell and Reid.
+
+    Args:
+        sparsity (array-like): Boolean array of shape (num_outputs,
+            num_variables), which is True where the Jacobian may be nonzero.
+
+    Returns:
+        list[list[int]]: The column indices of each group.
+
+    """
+    sparsity = np.asarray(sparsity, dtype=bool)
+    groups = []
+    occupied = []
+    for j in range(sparsity.shape[1]):
+        column = sparsity[:, j]
+        for group, rows in zip(groups, occupied):
+            if not (rows & column).any():
+                group.append(j)
+                rows |= column
+                break
+        else:
+            groups.append([j])
+            occupied.append(column.copy())
+    return groups
@@ -79,6 +79,7 @@ class PolynomialCoeffVariable(VariableBehavior):
         i, j = self.coeff_index
         try:
             surf.geometry.c[i][j] = new_value
+            surf.geometry._bump_revision()  # the coefficients changed in place
         except IndexError:
             pad_width_i = max(0, i + 1 - surf.geometry.c.shape[0])
             pad_width_j = max(0, j + 1 - surf.geometry.c.shape[1])
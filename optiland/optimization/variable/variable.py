@@ -159,6 +159,7 @@ class Variable:
 
         """
         self.variable.update_value(new_value)
+        self.optic.invalidate()
 
     def reset(self):
         """Reset the variable to its initial value."""
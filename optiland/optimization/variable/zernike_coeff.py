@@ -78,6 +78,7 @@ class ZernikeCoeffVariable(PolynomialCoeffVariable):
         i = self.coeff_index
         try:
             surf.geometry.c[i] = new_value
+            surf.geometry._bump_revision()  # the coefficients changed in place
         except IndexError:
             pad_width_i = max(0, i + 1)
             c_new = np.pad(
@@ -0,0 +1,190 @@
+"""Parallel Module
+
+This module provides an opt-in process-pool executor for running independent
+tasks on an optical system in parallel, e.g. the field and wavelength sweeps
+of analyses. The optic is pickled and shipped to each worker process once,
+when the pool starts. Tasks then only carry their own, lightweight arguments,
+and results are returned in the order of the submitted tasks.
+
+Kramer Harrison, 2025
+"""
+
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import optiland.backend as be
+
+# attributes of an object that are never sent to the workers
+_EXCLUDED_ATTRIBUTES = ("optic", "executor", "data", "results")
+
+# optic of the current worker process, set by the pool initializer
+_worker_optic = None
+
+
+def _initialize_worker(optic_bytes, backend, precision):
+    """Initialize a worker process with the optic and the backend settings.
+
+    Args:
+        optic_bytes (bytes): The pickled optic.
+        backend (str): The name of the backend.
+        precision (str or None): The torch precision, if applicable.
+
+    """
+    global _worker_optic
+    be.set_backend(backend)
+    if precision is not None:
+        be.set_precision(precision)
+    _worker_optic = pickle.loads(optic_bytes)
+
+
+def _call_function(func, args):
+    """Call a function with the optic of the worker as first argument."""
+    return func(_worker_optic, *args)
+
+
+def _call_method(cls, state, method_name, args):
+    """Call a method of an object rebuilt around the optic of the worker."""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    obj.optic = _worker_optic
+    obj.executor = None
+    return getattr(obj, method_name)(*args)
+
+
+class OpticExecutor:
+    """Process-pool executor with a copy of an optic in each worker.
+
+    The optic is copied into the workers when the executor is created.
+    Changes made to the optic afterwards are not seen by the workers, so a
+    new executor should be created after modifying the optic.
+
+    Args:
+        optic (Optic): The optical system shipped to the workers.
+        n_workers (int, optional): The number of worker processes. Defaults
+            to None, in which case the number of CPUs is used.
+        mp_context (multiprocessing.context.BaseContext, optional): The
+            multiprocessing context used to start the workers. Defaults to
+            None, in which case the platform default is used.
+
+    Raises:
+        ValueError: If `n_workers` is not a positive integer.
+
+    """
+
+    def __init__(self, optic, n_workers=None, mp_context=None):
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if int(n_workers) < 1:
+            raise ValueError("n_workers must be a positive integer.")
+
+        self.optic = optic
+        self.n_workers = int(n_workers)
+
+        backend = be.get_backend()
+        precision = None
+        if backend == "torch":
+            precision = str(be.get_precision()).split(".")[-1]
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=mp_context,
+            initializer=_initialize_worker,
+            initargs=(pickle.dumps(optic), backend, precision),
+        )
+
+    def map(self, func, tasks):
+        """Run a function for each task in the worker processes.
+
+        Args:
+            func (callable): A picklable (module-level) function, called as
+                `func(optic, *task)` with the optic of the worker.
+            tasks (Iterable[tuple]): The arguments of each task.
+
+        Returns:
+            list: The results, in the order of the tasks.
+
+        """
+        futures = [self._pool.submit(_call_function, func, task) for task in tasks]
+        return [future.result() for future in futures]
+
+    def map_method(self, obj, method_name, tasks):
+        """Run a method of an object for each task in the worker processes.
+
+        The object is rebuilt in the worker around the optic of the worker.
+        Its `data` and `results` attributes are not sent to the workers.
+
+        Args:
+            obj: The object, whose `optic` attribute must be the optic of the
+                executor.
+            method_name (str): The name of the method to call.
+            tasks (Iterable[tuple]): The arguments of each task.
+
+        Returns:
+            list: The results, in the order of the tasks.
+
+        Raises:
+            ValueError: If the object does not refer to the optic of the
+                executor.
+
+        """
+        if obj.optic is not self.optic:
+            raise ValueError("The executor was created for a different optic.")
+
+        state = {
+            key: value
+            for key, value in obj.__dict__.items()
+            if key not in _EXCLUDED_ATTRIBUTES
+        }
+        futures = [
+            self._pool.submit(_call_method, type(obj), state, method_name, task)
+            for task in tasks
+        ]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait=True):
+        """Shut down the worker processes.
+
+        Args:
+            wait (bool, optional): Whether to wait for pending tasks to
+                complete. Defaults to True.
+
+        """
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+
+def map_method(obj, method_name, tasks, n_workers=None, executor=None):
+    """Run a method of an object for each task, serially or in parallel.
+
+    If neither `n_workers` nor `executor` is given, the tasks are run serially
+    in the current process. If only `n_workers` is given, a temporary
+    executor is created for the tasks.
+
+    Args:
+        obj: The object whose method is called. It must have an `optic`
+            attribute.
+        method_name (str): The name of the method to call.
+        tasks (Iterable[tuple]): The arguments of each task.
+        n_workers (int, optional): The number of worker processes of a
+            temporary executor. Defaults to None.
+        executor (OpticExecutor, optional): An existing executor. Defaults to
+            None.
+
+    Returns:
+        list: The results, in the order of the tasks.
+
+    """
+    tasks = list(tasks)
+    if executor is not None:
+        return executor.map_method(obj, method_name, tasks)
+    if n_workers is None or n_workers == 1 or len(tasks) < 2:
+        method = getattr(obj, method_name)
+        return [method(*task) for task in tasks]
+    with OpticExecutor(obj.optic, min(n_workers, len(tasks))) as temporary:
+        return temporary.map_method(obj, method_name, tasks)
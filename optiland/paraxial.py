@@ -14,10 +14,54 @@ is the back focal point.
 Kramer Harrison, 2024
 """
 
+import functools
+
 import optiland.backend as be
 from optiland.raytrace.paraxial_ray_tracer import ParaxialRayTracer
 
 
+def _copy_result(value):
+    """Copy a cached result, so that callers cannot modify the cache."""
+    if isinstance(value, tuple):
+        return tuple(_copy_result(v) for v in value)
+    if be.is_array_like(value):
+        return be.copy(value)
+    return value
+
+
+def _requires_grad(value):
+    """Returns True if a result is part of an autograd graph."""
+    if isinstance(value, tuple):
+        return any(_requires_grad(v) for v in value)
+    return bool(getattr(value, "requires_grad", False))
+
+
+def _memoize(method):
+    """Cache the result of a paraxial method for the current optic state.
+
+    Results that are part of an autograd graph are not cached, so that a
+    graph is never reused after a backward pass.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self):
+        key = self._state_key()
+        if self._cache_key != key:
+            self._cache.clear()
+            self._cache_key = key
+
+        name = method.__name__
+        if name in self._cache:
+            return _copy_result(self._cache[name])
+
+        value = method(self)
+        if not _requires_grad(value):
+            self._cache[name] = _copy_result(value)
+        return value
+
+    return wrapper
+
+
 class Paraxial:
     """A class representing a paraxial optical system.
 
@@ -33,17 +77,72 @@ class Paraxial:
         optic (Optic): The optical system being analyzed.
         surfaces (SurfaceGroup): The surface group of the optical system.
 
+    Note:
+        The focal lengths, pupil properties, F-number and the marginal and
+        chief ray data are cached until the revision of the optic changes,
+        see `Optic.invalidate`. Replacing surfaces, geometries or materials,
+        or assigning the parameters of a geometry, material, aperture,
+        coordinate system, field or wavelength in place, e.g.
+        `geometry.radius`, also invalidates the cache. So does moving the
+        stop or changing the primary wavelength.
+
     """
 
     def __init__(self, optic):
         self.optic = optic
         self._ray_tracer = ParaxialRayTracer(self.optic)
+        self._cache = {}
+        self._cache_key = None
+
+    def _state_key(self):
+        """Returns a key identifying the state of the optic.
+
+        Returns:
+            tuple: The revision of the optic, the identity and revision of
+                its aperture, fields and wavelengths, and the stop flag and
+                the identity and revision of the geometry, coordinate system
+                and materials of each surface.
+
+        """
+        surfaces = tuple(
+            (
+                id(surface),
+                id(surface.geometry),
+                surface.geometry._revision,
+                surface.geometry.cs._revision,
+                id(surface.material_pre),
+                surface.material_pre._revision,
+                id(surface.material_post),
+                surface.material_post._revision,
+                surface.is_stop,
+            )
+            for surface in self.surfaces.surfaces
+        )
+        fields = tuple(
+            (id(field), field._revision) for field in self.optic.fields.fields
+        )
+        wavelengths = tuple(
+            (id(wavelength), wavelength._revision)
+            for wavelength in self.optic.wavelengths.wavelengths
+        )
+        aperture = self.optic.aperture
+        return (
+            getattr(self.optic, "_revision", None),
+            id(aperture),
+            getattr(aperture, "_revision", None),
+            self.optic.fields.telecentric,
+            fields,
+            wavelengths,
+            self.optic.field_type,
+            surfaces,
+        )
 
     @property
     def surfaces(self):
         """SurfaceGroup: the surface group of the optical system."""
         return self.optic.surface_group
 
+    @_memoize
     def f1(self):
         """Calculate the front focal length (f1).
 
@@ -57,6 +156,7 @@ class Paraxial:
         f1 = y[0] / u[-1]
         return f1[0]
 
+    @_memoize
     def f2(self):
         """Calculate the back focal length (f2), also known as effective focal length.
 
@@ -189,6 +289,7 @@ class Paraxial:
         """
         return self.F2() - self.f1()
 
+    @_memoize
     def EPL(self):
         """Calculate the entrance pupil location (EPL) in global coordinates.
 
@@ -214,6 +315,7 @@ class Paraxial:
         loc_relative = y[-1] / u[-1]
         return loc_relative[0]
 
+    @_memoize
     def EPD(self):
         """Calculate the entrance pupil diameter (EPD).
 
@@ -251,6 +353,7 @@ class Paraxial:
                 u0 = 0.1 * ap_value / y[stop_index]
                 return u0 * (EPL - obj_z)
 
+    @_memoize
     def XPL(self):
         """Calculate the exit pupil location (XPL).
 
@@ -265,6 +368,7 @@ class Paraxial:
         loc_relative = -y[-1] / u[-1]
         return loc_relative[0]
 
+    @_memoize
     def XPD(self):
         """Calculate the exit pupil diameter (XPD).
 
@@ -284,6 +388,7 @@ class Paraxial:
         yxp = yi + ui * xpl
         return 2 * yxp[0]
 
+    @_memoize
     def FNO(self):
         """Calculate the image-space F-number (FNO).
 
@@ -321,6 +426,7 @@ class Paraxial:
         inv = yb[1] * n[1] * ua[1] - ya[1] * n[1] * ub[1]
         return inv[0]
 
+    @_memoize
     def marginal_ray(self):
         """Calculates the marginal ray heights and angles at each surface.
 
@@ -347,6 +453,7 @@ class Paraxial:
         wavelength = self.optic.primary_wavelength
         return self._trace_generic(ya, ua, obj_z, wavelength)
 
+    @_memoize
     def chief_ray(self):
         """Calculates the chief ray heights and angles at each surface.
 
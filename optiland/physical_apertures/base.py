@@ -5,7 +5,9 @@ class is an abstract base class that defines the interface for physical
 apertures. The BaseBooleanAperture class is an abstract base class for boolean
 operations on apertures. The UnionAperture, IntersectionAperture, and
 DifferenceAperture classes are concrete classes that implement the union,
-intersection, and difference of two apertures, respectively.
+intersection, and difference of two apertures, respectively. The boolean
+apertures only evaluate their second aperture on the points that can still
+change the result, and skip the points outside the extent of each aperture.
 
 Kramer Harrison, 2024
 """
@@ -15,9 +17,10 @@ from abc import ABC, abstractmethod
 import matplotlib.pyplot as plt
 
 import optiland.backend as be
+from optiland.revision import RevisionMixin
 
 
-class BaseAperture(ABC):
+class BaseAperture(RevisionMixin, ABC):
     """Base class for physical apertures.
 
     Methods:
@@ -178,6 +181,39 @@ class BaseBooleanAperture(BaseAperture):
         y_max = max(a_extent[3], b_extent[3])
         return x_min, x_max, y_min, y_max
 
+    @staticmethod
+    def _contains_where(aperture, x, y, where=None):
+        """Checks if the given points are inside an aperture, evaluating the
+        aperture only for a subset of the points.
+
+        Points outside the extent of the aperture are rejected without
+        calling its `contains` method.
+
+        Args:
+            aperture (BaseAperture): The aperture.
+            x (be.ndarray): The x-coordinate of the point.
+            y (be.ndarray): The y-coordinate of the point.
+            where (be.ndarray, optional): Boolean array selecting the points
+                to check. The other points are reported as outside. Defaults
+                to None, in which case all points are checked.
+
+        Returns:
+            be.ndarray: Boolean array indicating if the point is inside the
+                aperture
+
+        """
+        x_min, x_max, y_min, y_max = aperture.extent
+        mask = (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+        if where is not None:
+            mask = mask & where
+        if be.all(mask):
+            return aperture.contains(x, y)
+
+        inside = be.copy(mask)
+        if be.any(mask):
+            inside[mask] = aperture.contains(x[mask], y[mask])
+        return inside
+
     @abstractmethod
     def contains(self, x, y):
         """Checks if the given point is inside the aperture.
@@ -254,7 +290,12 @@ class UnionAperture(BaseBooleanAperture):
                 aperture
 
         """
-        return be.logical_or(self.a.contains(x, y), self.b.contains(x, y))
+        x = be.array(x)
+        y = be.array(y)
+        in_a = self._contains_where(self.a, x, y)
+        return be.logical_or(
+            in_a, self._contains_where(self.b, x, y, be.logical_not(in_a))
+        )
 
 
 class IntersectionAperture(BaseBooleanAperture):
@@ -281,7 +322,10 @@ class IntersectionAperture(BaseBooleanAperture):
                 aperture
 
         """
-        return be.logical_and(self.a.contains(x, y), self.b.contains(x, y))
+        x = be.array(x)
+        y = be.array(y)
+        in_a = self._contains_where(self.a, x, y)
+        return self._contains_where(self.b, x, y, in_a)
 
 
 class DifferenceAperture(BaseBooleanAperture):
@@ -308,7 +352,9 @@ class DifferenceAperture(BaseBooleanAperture):
                 aperture
 
         """
+        x = be.array(x)
+        y = be.array(y)
+        in_a = self._contains_where(self.a, x, y)
         return be.logical_and(
-            self.a.contains(x, y),
-            be.logical_not(self.b.contains(x, y)),
+            in_a, be.logical_not(self._contains_where(self.b, x, y, in_a))
         )
@@ -5,6 +5,14 @@ aperture that clips rays based on a set of vertices. It also contains the
 FileAperture class, which reads an aperture definition from a file and creates
 a polygon-based aperture.
 
+Point-in-polygon queries use a slab decomposition of the polygon, which is
+built once when the aperture is created. The distinct y-coordinates of the
+vertices split the plane into horizontal slabs, and each slab stores only the
+edges that cross it. A query point is located in its slab with a binary search
+and its crossing number is counted against the edges of that slab alone, so
+the cost per point scales with the number of edges per slab rather than with
+the total number of vertices.
+
 Kramer Harrison, 2025
 """
 
@@ -24,10 +32,10 @@ class PolygonAperture(BaseAperture):
             polygon vertices.
 
     Note:
-        The implementation of the point-in-polygon algorithm used in this class
-        has slightly different behavior for each backend. FOr the NumPy backend,
-        points on the edge of the polygon are considered to be inside the
-        polygon, while for the PyTorch backend, they are considered to be outside.
+        The point-in-polygon test counts the crossings of a horizontal ray
+        with the polygon edges (even-odd rule). Points on the left or bottom
+        edges of the polygon are considered to be inside the polygon, while
+        points on the right or top edges are considered to be outside.
 
     """
 
@@ -36,6 +44,75 @@ class PolygonAperture(BaseAperture):
         self.x = be.array(x)
         self.y = be.array(y)
         self.vertices = be.column_stack((self.x, self.y))
+        self._build_slabs()
+
+    def _build_slabs(self):
+        """Build the slab decomposition of the polygon edges.
+
+        The edge tables have shape (slabs, max edges per slab). Each entry
+        holds the start vertex and the inverse slope of an edge, so that
+        the edge crosses the line y = py at x = x0 + slope * (py - y0).
+        Slabs with fewer edges are padded with edges at x = -inf, which are
+        never to the right of a point.
+        """
+        x0 = np.ravel(be.to_numpy(self.x)).astype(float)
+        y0 = np.ravel(be.to_numpy(self.y)).astype(float)
+        x1 = np.roll(x0, -1)
+        y1 = np.roll(y0, -1)
+
+        # horizontal edges are never crossed by a horizontal ray
+        sloped = y0 != y1
+        x0, y0, x1, y1 = x0[sloped], y0[sloped], x1[sloped], y1[sloped]
+        slope = (x1 - x0) / (y1 - y0)
+
+        levels = np.unique(np.concatenate([y0, y1]))
+        num_slabs = max(levels.size - 1, 0)
+
+        # each edge spans a contiguous range of slabs
+        first = np.searchsorted(levels, np.minimum(y0, y1))
+        last = np.searchsorted(levels, np.maximum(y0, y1))
+        counts = last - first
+        edge = np.repeat(np.arange(counts.size), counts)
+        offsets = np.arange(edge.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        slab = first[edge] + offsets
+
+        order = np.argsort(slab, kind="stable")
+        edge, slab = edge[order], slab[order]
+        per_slab = np.bincount(slab, minlength=num_slabs)
+        width = int(per_slab.max()) if per_slab.size else 0
+        column = np.arange(slab.size) - np.repeat(
+            np.cumsum(per_slab) - per_slab, per_slab
+        )
+
+        table_x0 = np.full((num_slabs, width), -np.inf)
+        table_y0 = np.zeros((num_slabs, width))
+        table_slope = np.zeros((num_slabs, width))
+        table_x0[slab, column] = x0[edge]
+        table_y0[slab, column] = y0[edge]
+        table_slope[slab, column] = slope[edge]
+
+        self._levels = levels
+        self._edges = (table_x0, table_y0, table_slope)
+        if num_slabs:
+            self._bounds = (
+                float(min(x0.min(), x1.min())),
+                float(max(x0.max(), x1.max())),
+                float(levels[0]),
+                float(levels[-1]),
+            )
+        else:
+            self._bounds = (0.0, 0.0, 0.0, 0.0)
+        self._arrays = {}
+
+    def _backend_slabs(self):
+        """Returns the slab tables of the current backend."""
+        key = be.backend_key()
+        if key not in self._arrays:
+            self._arrays[key] = (
+                be.array(self._levels),
+                *(be.array(table) for table in self._edges),
+            )
+        return self._arrays[key]
 
     @property
     def extent(self):
@@ -61,9 +138,24 @@ class PolygonAperture(BaseAperture):
         """
         x = be.array(x)
         y = be.array(y)
-        pts = be.column_stack((x.ravel(), y.ravel()))
-        mask_flat = be.path_contains_points(self.vertices, pts)
-        return mask_flat.reshape(x.shape)
+        px = x.ravel()
+        py = y.ravel()
+
+        # reject points outside the bounding box of the sloped edges
+        x_min, x_max, y_min, y_max = self._bounds
+        candidates = (px >= x_min) & (px < x_max) & (py >= y_min) & (py < y_max)
+        if not be.any(candidates):
+            return candidates.reshape(x.shape)
+
+        levels, x0, y0, slope = self._backend_slabs()
+        px = px[candidates]
+        py = py[candidates]
+        slab = be.searchsorted(levels, py, side="right") - 1
+        x_cross = x0[slab] + slope[slab] * (py[:, None] - y0[slab])
+        crossings = be.sum(px[:, None] < x_cross, axis=-1)
+        inside = be.copy(candidates)
+        inside[candidates] = crossings % 2 == 1
+        return inside.reshape(x.shape)
 
     def scale(self, scale_factor):
         """Scales the aperture by the given factor.
@@ -75,6 +167,7 @@ class PolygonAperture(BaseAperture):
         self.vertices = self.vertices * scale_factor
         self.x = self.vertices[:, 0]
         self.y = self.vertices[:, 1]
+        self._build_slabs()
 
     def to_dict(self):
         """Convert the aperture to a dictionary.
@@ -65,6 +65,7 @@ class PickupManager:
         """Applies all pickup operations in the manager."""
         for pickup in self.pickups:
             pickup.apply()
+        self.optic.invalidate()
 
     def clear(self):
         """Clears all pickup operations in the manager."""
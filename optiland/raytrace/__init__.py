@@ -2,3 +2,11 @@
 
 from .real_ray_tracer import RealRayTracer
 from .paraxial_ray_tracer import ParaxialRayTracer
+from .reducers import (
+    BaseReducer,
+    HistogramReducer,
+    CentroidReducer,
+    OPDStatsReducer,
+    reduce_chunks,
+)
+from .batch import RayBatch
@@ -0,0 +1,136 @@
+"""Ray Batch Module
+
+This module contains the RayBatch class, which holds the result of tracing a
+set of fields and wavelengths through an optical system in a single pass.
+The rays of every (field, wavelength) pair are stored contiguously in one
+RealRays object and can be retrieved by indexing the batch with the field and
+wavelength indices.
+
+Kramer Harrison, 2025
+"""
+
+import optiland.backend as be
+from optiland.rays import RealRays
+
+_RAY_ATTRIBUTES = ("x", "y", "z", "L", "M", "N", "i", "w", "opd")
+
+
+class RayBatch:
+    """Rays traced for the product of fields, wavelengths and pupil points.
+
+    The rays are ordered field-major, then by wavelength, then by pupil
+    point, i.e. the rays of field `f` and wavelength `w` occupy the
+    contiguous block starting at `(f * num_wavelengths + w) * num_pupil`.
+
+    Args:
+        rays (RealRays): The traced rays of the full batch.
+        fields (list[tuple[float, float]]): The normalized field coordinates.
+        wavelengths (list[float]): The wavelengths in microns.
+        num_pupil (int): The number of pupil points per field and wavelength.
+
+    """
+
+    def __init__(self, rays, fields, wavelengths, num_pupil):
+        self.rays = rays
+        self.fields = list(fields)
+        self.wavelengths = list(wavelengths)
+        self.num_pupil = int(num_pupil)
+
+    @property
+    def shape(self):
+        """tuple[int, int]: the number of fields and wavelengths"""
+        return len(self.fields), len(self.wavelengths)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __getitem__(self, index):
+        """Return the rays of one field and wavelength.
+
+        Args:
+            index (tuple[int, int]): The field and wavelength indices.
+
+        Returns:
+            RealRays: The rays of the selected field and wavelength. The ray
+                data are views into the batch arrays.
+
+        Raises:
+            IndexError: If the index is not a pair of valid indices.
+
+        """
+        if not isinstance(index, tuple) or len(index) != 2:
+            raise IndexError("RayBatch must be indexed by [field, wavelength].")
+
+        num_fields, num_wavelengths = self.shape
+        field_index = self._normalize_index(index[0], num_fields, "Field")
+        wavelength_index = self._normalize_index(
+            index[1], num_wavelengths, "Wavelength"
+        )
+
+        start = (field_index * num_wavelengths + wavelength_index) * self.num_pupil
+        stop = start + self.num_pupil
+        values = {
+            name: getattr(self.rays, name)[start:stop] for name in _RAY_ATTRIBUTES
+        }
+        rays = RealRays(*(values[name] for name in _RAY_ATTRIBUTES[:-1]))
+        rays.opd = values["opd"]
+        return rays
+
+    @staticmethod
+    def _normalize_index(index, size, name):
+        """Convert a possibly negative index to a non-negative index.
+
+        Args:
+            index (int): The index.
+            size (int): The size of the indexed dimension.
+            name (str): The name of the dimension, for error messages.
+
+        Returns:
+            int: The non-negative index.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        """
+        if not -size <= index < size:
+            raise IndexError(f"{name} index {index} is out of range.")
+        return index % size
+
+    def items(self):
+        """Iterate over the rays of all fields and wavelengths.
+
+        Yields:
+            tuple: The field coordinates, the wavelength and the RealRays of
+                each (field, wavelength) pair, in batch order.
+
+        """
+        for f, field in enumerate(self.fields):
+            for w, wavelength in enumerate(self.wavelengths):
+                yield field, wavelength, self[f, w]
+
+    @staticmethod
+    def build_coordinates(fields, wavelengths, Px, Py):
+        """Build the per-ray field, pupil and wavelength coordinates.
+
+        Args:
+            fields (list[tuple[float, float]]): The normalized field coordinates.
+            wavelengths (list[float]): The wavelengths in microns.
+            Px (be.ndarray): The normalized x pupil coordinates.
+            Py (be.ndarray): The normalized y pupil coordinates.
+
+        Returns:
+            tuple: The Hx, Hy, Px, Py and wavelength arrays, one value per ray.
+
+        """
+        num_pupil = be.size(Px)
+        num_wavelengths = len(wavelengths)
+        num_pairs = len(fields) * num_wavelengths
+
+        Hx = be.array([float(field[0]) for field in fields])
+        Hy = be.array([float(field[1]) for field in fields])
+        w = be.array([float(wavelength) for wavelength in wavelengths])
+
+        Hx = be.repeat(Hx, num_wavelengths * num_pupil)
+        Hy = be.repeat(Hy, num_wavelengths * num_pupil)
+        w = be.tile(be.repeat(w, num_pupil), len(fields))
+        return Hx, Hy, be.tile(Px, num_pairs), be.tile(Py, num_pairs), w
@@ -9,7 +9,8 @@ Kramer Harrison, 2025
 
 import optiland.backend as be
 from optiland.distribution import create_distribution
-from optiland.rays import PolarizedRays, RayGenerator
+from optiland.rays import PolarizedRays, RayGenerator, RealRays
+from optiland.raytrace.batch import RayBatch
 
 
 class RealRayTracer:
@@ -26,7 +27,16 @@ class RealRayTracer:
         self.optic = optic
         self.ray_generator = RayGenerator(optic)
 
-    def trace(self, Hx, Hy, wavelength, num_rays=100, distribution="hexapolar"):
+    def trace(
+        self,
+        Hx,
+        Hy,
+        wavelength,
+        num_rays=100,
+        distribution="hexapolar",
+        record="all",
+        compact=False,
+    ):
         """Trace a distribution of rays through the optical system.
 
         Args:
@@ -37,6 +47,13 @@ class RealRayTracer:
                 to 100.
             distribution (str or Distribution, optional): The distribution of
                 the rays. Defaults to 'hexapolar'.
+            record (str or list[int], optional): Which surfaces record ray
+                information. Options are "all", "image_only", "none", or a
+                list of surface indices. Defaults to "all".
+            compact (bool, optional): If True, blocked and lost rays are not
+                traced through the remaining surfaces. They keep their state
+                at the surface on which they were dropped, and are recorded
+                with NaN positions on later surfaces. Defaults to False.
 
         Returns:
             RealRays: The RealRays object containing the traced rays."
@@ -50,17 +67,177 @@ class RealRayTracer:
         Py = distribution.y
 
         rays = self.ray_generator.generate_rays(Hx, Hy, Px, Py, wavelength)
-        self.optic.surface_group.trace(rays)
+        self.optic.surface_group.trace(rays, record=record, compact=compact)
 
         if isinstance(rays, PolarizedRays):
             rays.update_intensity(self.optic.polarization_state)
 
         # update ray intensity
-        self.optic.surface_group.intensity[-1, :] = rays.i
+        if self._image_is_recorded(record):
+            self.optic.surface_group.intensity[-1, :] = rays.i
 
         return rays
 
-    def trace_generic(self, Hx, Hy, Px, Py, wavelength):
+    def trace_chunks(
+        self,
+        Hx,
+        Hy,
+        wavelength,
+        num_rays=100,
+        distribution="hexapolar",
+        chunk_size=100_000,
+        surface=-1,
+    ):
+        """Trace a distribution of rays through the optical system in chunks.
+
+        This is a generator that traces at most `chunk_size` rays at a time
+        and only records ray information on the selected surface, so that the
+        peak memory does not grow with the total number of rays. For the
+        'random' distribution, pupil points are also generated per chunk.
+
+        Args:
+            Hx (float or numpy.ndarray): The normalized x field coordinate.
+            Hy (float or numpy.ndarray): The normalized y field coordinate.
+            wavelength (float): The wavelength of the rays.
+            num_rays (int, optional): The number of rays to be traced. Defaults
+                to 100.
+            distribution (str or Distribution, optional): The distribution of
+                the rays. Defaults to 'hexapolar'.
+            chunk_size (int, optional): The maximum number of rays traced at
+                once. Defaults to 100,000.
+            surface (int, optional): Index of the surface at which ray data is
+                yielded. Defaults to -1 (image surface).
+
+        Yields:
+            RealRays: The rays of each chunk at the selected surface, in
+                global coordinates.
+
+        Raises:
+            ValueError: If `chunk_size` is not a positive integer.
+        """
+        self._validate_normalized_coordinates(Hx, Hy, "field")
+        if int(chunk_size) < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        chunk_size = int(chunk_size)
+
+        surface_group = self.optic.surface_group
+        surface = surface_group.num_surfaces - 1 if surface == -1 else surface
+        (surface,) = surface_group.get_record_indices([surface])
+
+        if isinstance(distribution, str) and distribution == "random":
+            distribution = create_distribution(distribution)
+            chunks = (
+                self._random_chunk(distribution, min(chunk_size, num_rays - start))
+                for start in range(0, num_rays, chunk_size)
+            )
+        else:
+            if isinstance(distribution, str):
+                distribution = create_distribution(distribution)
+                distribution.generate_points(num_rays)
+            total = be.size(distribution.x)
+            chunks = (
+                (
+                    distribution.x[start : start + chunk_size],
+                    distribution.y[start : start + chunk_size],
+                )
+                for start in range(0, total, chunk_size)
+            )
+
+        start = 0
+        for Px, Py in chunks:
+            stop = start + be.size(Px)
+            Hx_chunk = Hx[start:stop] if self._is_per_ray(Hx) else Hx
+            Hy_chunk = Hy[start:stop] if self._is_per_ray(Hy) else Hy
+            start = stop
+
+            rays = self.ray_generator.generate_rays(
+                Hx_chunk, Hy_chunk, Px, Py, wavelength
+            )
+            surface_group.trace(rays, record=[surface])
+
+            if isinstance(rays, PolarizedRays):
+                rays.update_intensity(self.optic.polarization_state)
+
+            if self._image_is_recorded([surface]):
+                surface_group.intensity[-1, :] = rays.i
+
+            yield self._rays_at_surface(surface, rays)
+
+    def trace_batch(
+        self,
+        fields="all",
+        wavelengths="all",
+        num_rays=100,
+        distribution="hexapolar",
+        surface=-1,
+    ):
+        """Trace all combinations of fields and wavelengths in a single pass.
+
+        One ray set is built over the product of fields, wavelengths and
+        pupil points and traced once, with per-ray wavelengths.
+
+        Args:
+            fields (str or list[tuple[float, float]], optional): The
+                normalized field coordinates. If 'all', all fields of the
+                optic are used. Defaults to 'all'.
+            wavelengths (str or list[float], optional): The wavelengths in
+                microns. Options are 'all', 'primary' or a list of
+                wavelengths. Defaults to 'all'.
+            num_rays (int, optional): The number of rays per field and
+                wavelength. Defaults to 100.
+            distribution (str or Distribution, optional): The pupil
+                distribution of the rays. Defaults to 'hexapolar'.
+            surface (int, optional): Index of the surface at which the rays
+                are returned. Defaults to -1 (image surface).
+
+        Returns:
+            RayBatch: The traced rays, indexable by [field, wavelength].
+
+        Raises:
+            ValueError: If `wavelengths` is an invalid string.
+        """
+        if isinstance(fields, str) and fields == "all":
+            fields = self.optic.fields.get_field_coords()
+        if isinstance(wavelengths, str):
+            if wavelengths == "all":
+                wavelengths = self.optic.wavelengths.get_wavelengths()
+            elif wavelengths == "primary":
+                wavelengths = [self.optic.primary_wavelength]
+            else:
+                raise ValueError("Wavelengths must be 'all', 'primary' or a list.")
+
+        Hx = be.array([float(field[0]) for field in fields])
+        Hy = be.array([float(field[1]) for field in fields])
+        self._validate_normalized_coordinates(Hx, Hy, "field")
+
+        if isinstance(distribution, str):
+            distribution = create_distribution(distribution)
+            distribution.generate_points(num_rays)
+        Px = distribution.x
+        Py = distribution.y
+
+        surface_group = self.optic.surface_group
+        surface = surface_group.num_surfaces - 1 if surface == -1 else surface
+        (surface,) = surface_group.get_record_indices([surface])
+
+        Hx, Hy, Px, Py, w = RayBatch.build_coordinates(fields, wavelengths, Px, Py)
+        rays = self.ray_generator.generate_rays(Hx, Hy, Px, Py, w)
+        surface_group.trace(rays, record=[surface])
+
+        if isinstance(rays, PolarizedRays):
+            rays.update_intensity(self.optic.polarization_state)
+
+        if self._image_is_recorded([surface]):
+            surface_group.intensity[-1, :] = rays.i
+
+        return RayBatch(
+            self._rays_at_surface(surface, rays),
+            fields,
+            wavelengths,
+            be.size(distribution.x),
+        )
+
+    def trace_generic(self, Hx, Hy, Px, Py, wavelength, record="all", compact=False):
         """Trace generic rays through the optical system.
 
         Args:
@@ -69,6 +246,13 @@ class RealRayTracer:
             Px (float or numpy.ndarray): The normalized x pupil coordinate.
             Py (float or numpy.ndarray): The normalized y pupil coordinate
             wavelength (float): The wavelength of the rays.
+            record (str or list[int], optional): Which surfaces record ray
+                information. Options are "all", "image_only", "none", or a
+                list of surface indices. Defaults to "all".
+            compact (bool, optional): If True, blocked and lost rays are not
+                traced through the remaining surfaces. They keep their state
+                at the surface on which they were dropped, and are recorded
+                with NaN positions on later surfaces. Defaults to False.
 
         """
         self._validate_normalized_coordinates(Hx, Hy, "field")
@@ -83,13 +267,79 @@ class RealRayTracer:
         Hx, Hy, Px, Py = self._validate_array_size(Hx, Hy, Px, Py)
 
         rays = self.ray_generator.generate_rays(Hx, Hy, Px, Py, wavelength)
-        rays = self.optic.surface_group.trace(rays)
+        rays = self.optic.surface_group.trace(rays, record=record, compact=compact)
 
         # update intensity
-        self.optic.surface_group.intensity[-1, :] = rays.i
+        if self._image_is_recorded(record):
+            self.optic.surface_group.intensity[-1, :] = rays.i
 
         return rays
 
+    def _image_is_recorded(self, record):
+        """Check whether the image surface records ray information.
+
+        Args:
+            record (str or list[int]): The recording mode.
+
+        Returns:
+            bool: True if the image surface is recorded, False otherwise.
+        """
+        surface_group = self.optic.surface_group
+        return surface_group.num_surfaces - 1 in surface_group.get_record_indices(
+            record
+        )
+
+    def _rays_at_surface(self, surface, rays):
+        """Copy the recorded ray data of a surface into a new RealRays object.
+
+        The data are copied, as the recorded data is overwritten by the next
+        trace.
+
+        Args:
+            surface (int): Index of a recorded surface.
+            rays (RealRays): The traced rays.
+
+        Returns:
+            RealRays: The rays at the surface, in global coordinates.
+        """
+        surf = self.optic.surface_group.surfaces[surface]
+        result = RealRays(
+            *(
+                be.copy(value)
+                for value in (surf.x, surf.y, surf.z, surf.L, surf.M, surf.N)
+            ),
+            be.copy(surf.intensity),
+            be.copy(rays.w),
+        )
+        result.opd = be.copy(surf.opd)
+        return result
+
+    @staticmethod
+    def _is_per_ray(value):
+        """Check whether a field coordinate is given per ray.
+
+        Args:
+            value (float or be.ndarray): The field coordinate.
+
+        Returns:
+            bool: True if the value is an array with more than one element.
+        """
+        return be.is_array_like(value) and be.size(value) > 1
+
+    @staticmethod
+    def _random_chunk(distribution, num_points):
+        """Generate a chunk of random pupil points.
+
+        Args:
+            distribution (RandomDistribution): The random distribution.
+            num_points (int): The number of points to generate.
+
+        Returns:
+            tuple: The x and y pupil coordinates.
+        """
+        distribution.generate_points(num_points)
+        return distribution.x, distribution.y
+
     def _validate_normalized_coordinates(self, x, y, coord_type="field"):
         """Validate that normalized coordinates are within the range (-1, 1).
 
@@ -0,0 +1,250 @@
+"""Ray Reducers Module
+
+This module contains reducers that consume a stream of traced ray chunks, as
+produced by `RealRayTracer.trace_chunks` or `Optic.trace_iter`, and
+accumulate summary results with memory that does not depend on the total
+number of rays. Available reducers compute intensity histograms (e.g., for
+irradiance), spot centroids and RMS radii, and OPD statistics.
+
+Kramer Harrison, 2025
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+import optiland.backend as be
+from optiland.rays import RealRays
+
+
+class BaseReducer(ABC):
+    """Base class for reducers of streamed ray chunks.
+
+    Args:
+        surface (Surface, optional): If provided, ray positions are converted
+            to the local coordinate system of this surface before reduction.
+            Defaults to None, in which case global coordinates are used.
+
+    """
+
+    def __init__(self, surface=None):
+        self.surface = surface
+
+    @abstractmethod
+    def update(self, rays):
+        """Accumulate a chunk of traced rays.
+
+        Args:
+            rays (RealRays): A chunk of traced rays.
+
+        """
+        # pragma: no cover
+
+    @abstractmethod
+    def result(self):
+        """Return the accumulated result."""
+        # pragma: no cover
+
+    def _positions(self, rays):
+        """Returns the ray positions and intensities as NumPy arrays.
+
+        Args:
+            rays (RealRays): A chunk of traced rays.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The x and y positions
+            and the intensities of the rays.
+
+        """
+        if self.surface is not None:
+            rays = RealRays(
+                rays.x, rays.y, rays.z, rays.L, rays.M, rays.N, rays.i, rays.w
+            )
+            self.surface.geometry.localize(rays)
+        return be.to_numpy(rays.x), be.to_numpy(rays.y), be.to_numpy(rays.i)
+
+
+class _RunningMoments:
+    """Weighted running mean and sum of squared deviations.
+
+    Chunks are merged using the parallel algorithm of Chan et al., which
+    avoids the loss of precision of accumulating raw sums of squares.
+    """
+
+    def __init__(self):
+        self.weight = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values, weights):
+        w = float(np.sum(weights))
+        if w <= 0:
+            return
+        mean = float(np.sum(weights * values) / w)
+        m2 = float(np.sum(weights * (values - mean) ** 2))
+
+        total = self.weight + w
+        delta = mean - self.mean
+        self.mean += delta * w / total
+        self.m2 += m2 + delta**2 * self.weight * w / total
+        self.weight = total
+
+    @property
+    def variance(self):
+        return self.m2 / self.weight if self.weight > 0 else np.nan
+
+
+class HistogramReducer(BaseReducer):
+    """Accumulates an intensity-weighted 2D histogram of ray positions.
+
+    Rays with zero intensity (e.g., vignetted rays) are ignored.
+
+    Args:
+        x_edges (np.ndarray): Bin edges along x.
+        y_edges (np.ndarray): Bin edges along y.
+        surface (Surface, optional): Surface in whose local coordinate system
+            the rays are binned. Defaults to None.
+
+    """
+
+    def __init__(self, x_edges, y_edges, surface=None):
+        super().__init__(surface)
+        self.x_edges = np.asarray(x_edges, dtype=float)
+        self.y_edges = np.asarray(y_edges, dtype=float)
+        self.hist = np.zeros((len(self.x_edges) - 1, len(self.y_edges) - 1))
+
+    def update(self, rays):
+        """Accumulate a chunk of traced rays.
+
+        Args:
+            rays (RealRays): A chunk of traced rays.
+
+        """
+        x, y, intensity = self._positions(rays)
+        valid = intensity > 0.0
+        hist, _, _ = np.histogram2d(
+            x[valid],
+            y[valid],
+            bins=[self.x_edges, self.y_edges],
+            weights=intensity[valid],
+        )
+        self.hist += hist
+
+    def result(self):
+        """np.ndarray: the accumulated histogram"""
+        return self.hist
+
+
+class CentroidReducer(BaseReducer):
+    """Accumulates the centroid and RMS radius of ray positions.
+
+    Args:
+        surface (Surface, optional): Surface in whose local coordinate system
+            the statistics are computed. Defaults to None.
+        weighted (bool, optional): If True, rays are weighted by intensity.
+            Otherwise, all rays are weighted equally. Defaults to True.
+
+    """
+
+    def __init__(self, surface=None, weighted=True):
+        super().__init__(surface)
+        self.weighted = weighted
+        self._x = _RunningMoments()
+        self._y = _RunningMoments()
+
+    def update(self, rays):
+        """Accumulate a chunk of traced rays.
+
+        Args:
+            rays (RealRays): A chunk of traced rays.
+
+        """
+        x, y, intensity = self._positions(rays)
+        weights = intensity if self.weighted else np.ones_like(x)
+        valid = np.isfinite(x) & np.isfinite(y)
+        self._x.update(x[valid], weights[valid])
+        self._y.update(y[valid], weights[valid])
+
+    @property
+    def centroid(self):
+        """tuple[float, float]: the centroid of the ray positions"""
+        return self._x.mean, self._y.mean
+
+    @property
+    def rms_radius(self):
+        """float: the RMS radius of the ray positions about the centroid"""
+        return float(np.sqrt(self._x.variance + self._y.variance))
+
+    def result(self):
+        """dict: the centroid and the RMS radius"""
+        return {"centroid": self.centroid, "rms_radius": self.rms_radius}
+
+
+class OPDStatsReducer(BaseReducer):
+    """Accumulates statistics of the optical path length of rays.
+
+    Only rays with nonzero intensity are included.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._moments = _RunningMoments()
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, rays):
+        """Accumulate a chunk of traced rays.
+
+        Args:
+            rays (RealRays): A chunk of traced rays.
+
+        """
+        opd = be.to_numpy(rays.opd)
+        valid = (be.to_numpy(rays.i) > 0.0) & np.isfinite(opd)
+        opd = opd[valid]
+        if opd.size == 0:
+            return
+        self._moments.update(opd, np.ones_like(opd))
+        self.min = min(self.min, float(np.min(opd)))
+        self.max = max(self.max, float(np.max(opd)))
+
+    @property
+    def count(self):
+        """int: the number of rays included in the statistics"""
+        return int(self._moments.weight)
+
+    @property
+    def mean(self):
+        """float: the mean optical path length"""
+        return self._moments.mean if self.count else np.nan
+
+    @property
+    def rms(self):
+        """float: the RMS deviation of the optical path length from its mean"""
+        return float(np.sqrt(self._moments.variance))
+
+    @property
+    def pv(self):
+        """float: the peak-to-valley optical path length"""
+        return self.max - self.min if self.count else np.nan
+
+    def result(self):
+        """dict: the OPD mean, RMS, peak-to-valley and ray count"""
+        return {"mean": self.mean, "rms": self.rms, "pv": self.pv, "count": self.count}
+
+
+def reduce_chunks(chunks, *reducers):
+    """Feed a stream of ray chunks to one or more reducers.
+
+    Args:
+        chunks (Iterable[RealRays]): The stream of traced ray chunks.
+        *reducers (BaseReducer): The reducers to update with each chunk.
+
+    Returns:
+        tuple[BaseReducer]: The updated reducers.
+
+    """
+    for rays in chunks:
+        for reducer in reducers:
+            reducer.update(rays)
+    return reducers
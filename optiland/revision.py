@@ -0,0 +1,40 @@
+"""Revision Module
+
+This module contains the RevisionMixin class, which counts the changes made
+to an object. Caches of results computed from an object, e.g. the paraxial
+properties of an optic or the refractive indices of its materials, store the
+revision of the object with each result and recompute the result once the
+revision differs. Direct edits such as `geometry.radius = 10` therefore reach
+the caches without a manual call to `Optic.invalidate`.
+
+Kramer Harrison, 2025
+"""
+
+
+class RevisionMixin:
+    """Mixin that increments a revision counter when an attribute is assigned.
+
+    Assigning a public attribute increments `_revision`. Private attributes,
+    e.g. internal caches, do not change the revision, nor do the attributes
+    listed in `_trace_attributes`, which subclasses use for results of their
+    last computation that are stored on the object. Element-wise edits of
+    array attributes, e.g. `material.index[0] = 1.6`, are not detected.
+
+    Attributes:
+        _revision (int): The number of changes made to the object.
+        _trace_attributes (frozenset[str]): Public attributes that do not
+            change the revision.
+
+    """
+
+    _revision = 0
+    _trace_attributes = frozenset()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_") and name not in self._trace_attributes:
+            self._bump_revision()
+
+    def _bump_revision(self):
+        """Increment the revision, e.g. after a private attribute changed."""
+        object.__setattr__(self, "_revision", self._revision + 1)
@@ -14,6 +14,7 @@ import numpy as np
 from numba import njit, prange
 
 from optiland.rays import RealRays
+from optiland.revision import RevisionMixin
 
 
 @njit(fastmath=True, cache=True)
@@ -131,7 +132,7 @@ def scatter_parallel(L, M, N, nx, ny, nz, get_point):  # pragma: no cover
     return v
 
 
-class BaseBSDF(ABC):  # noqa: B024
+class BaseBSDF(RevisionMixin, ABC):  # noqa: B024
     """Abstract base class for Bidirectional Scattering Distribution Function
     (BSDF).
 
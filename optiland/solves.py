@@ -90,6 +90,7 @@ class MarginalRayHeightSolve(BaseSolve):
         # shift current surface and all subsequent surfaces
         for surface in self.optic.surface_group.surfaces[self.surface_idx :]:
             surface.geometry.cs.z = surface.geometry.cs.z + offset
+        self.optic.invalidate()
 
     def to_dict(self):
         """Returns a dictionary representation of the solve.
@@ -188,6 +189,7 @@ class QuickFocusSolve(BaseSolve):
         )
 
         self.optic.surface_group.surfaces[-1].geometry.cs.z = z_focus
+        self.optic.invalidate()
 
 
 class SolveFactory:
@@ -4,4 +4,5 @@ from .standard_surface import Surface
 from .object_surface import ObjectSurface
 from .image_surface import ImageSurface
 from .surface_group import SurfaceGroup
+from .trace_plan import TracePlan
 from .factories.surface_factory import SurfaceFactory
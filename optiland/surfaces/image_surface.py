@@ -59,8 +59,6 @@ class ImageSurface(Surface):
         # inverse transform coordinate system
         self.geometry.globalize(rays)
 
-        self._record(rays)
-
         return rays
 
     def _interact(self, rays):
@@ -0,0 +1,193 @@
+"""Index Table
+
+This module contains the IndexTable class, which holds the refractive indices
+and extinction coefficients of the materials of a SurfaceGroup at the distinct
+wavelengths of the traced rays. Rays typically share only a few wavelengths,
+so the materials are evaluated once per wavelength and the per-ray values are
+gathered from the table, rather than evaluating the dispersion formulas for
+every ray on every surface.
+
+Kramer Harrison, 2025
+"""
+
+import numpy as np
+
+import optiland.backend as be
+
+
+class IndexTable:
+    """Table of refractive indices and extinction coefficients.
+
+    The table has one column per distinct wavelength and one entry per
+    material. Materials are identified by object identity and revision, so
+    that replacing a material of a surface adds a new entry, and assigning a
+    parameter of a material, e.g. `index`, evaluates it again. Values that
+    require gradients are dropped at the start of each trace, so that
+    autograd graphs are not reused between traces.
+
+    Attributes:
+        wavelengths (list[float]): The wavelengths of the table columns.
+
+    """
+
+    def __init__(self):
+        self.wavelengths = []
+        self._entries = {}
+        self._backend = None
+        self._wavelength = None
+        self._index = None
+
+    def begin(self, surfaces, wavelength):
+        """Prepare the table for a trace.
+
+        Args:
+            surfaces (list[Surface]): The surfaces to be traced.
+            wavelength (be.ndarray): The wavelengths of the rays.
+
+        """
+        backend = be.backend_key()
+        if backend != self._backend:
+            self.clear()
+            self._backend = backend
+
+        materials = {
+            id(material): material
+            for surface in surfaces
+            for material in (surface.material_pre, surface.material_post)
+        }
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if key in materials
+            and _is_current(entry, materials[key])
+            and not _requires_grad(entry[2])
+        }
+        self._wavelength = None
+        self._update_index(wavelength)
+
+    def clear(self):
+        """Remove all values from the table."""
+        self.wavelengths = []
+        self._entries = {}
+        self._wavelength = None
+        self._index = None
+
+    def n(self, material, wavelength):
+        """Get the refractive index of a material for the rays.
+
+        Args:
+            material (BaseMaterial): The material.
+            wavelength (be.ndarray): The wavelengths of the rays.
+
+        Returns:
+            be.ndarray: The refractive index for each ray, or a single value
+                if all rays have the same wavelength.
+
+        """
+        return self._gather(self._entry(material)[2], wavelength)
+
+    def k(self, material, wavelength):
+        """Get the extinction coefficient of a material for the rays.
+
+        Args:
+            material (BaseMaterial): The material.
+            wavelength (be.ndarray): The wavelengths of the rays.
+
+        Returns:
+            be.ndarray: The extinction coefficient for each ray, or a single
+                value if all rays have the same wavelength.
+
+        """
+        return self._gather(self._entry(material)[3], wavelength)
+
+    def view(self, material):
+        """Get a material-like view of the table for one material.
+
+        Args:
+            material (BaseMaterial): The material.
+
+        Returns:
+            TabulatedMaterialView: The view, with `n` and `k` methods.
+
+        """
+        return TabulatedMaterialView(self, material)
+
+    def _update_index(self, wavelength):
+        """Map the wavelengths of the rays to the table columns."""
+        if wavelength is self._wavelength:
+            return
+
+        values, inverse = be.unique_wavelengths(wavelength)
+        columns = []
+        for value in values:
+            if value not in self.wavelengths:
+                self.wavelengths.append(value)
+                self._entries.clear()
+            columns.append(self.wavelengths.index(value))
+
+        if inverse is None:
+            self._index = columns[0] if columns else None
+        else:
+            self._index = np.asarray(columns)[inverse]
+        self._wavelength = wavelength
+
+    def _entry(self, material):
+        """Get the tabulated values of a material, evaluating them if needed."""
+        entry = self._entries.get(id(material))
+        if entry is None or not _is_current(entry, material):
+            w = be.array(self.wavelengths)
+            entry = (
+                material,
+                material._revision,
+                self._column(material.n(w)),
+                self._column(material.k(w)),
+            )
+            self._entries[id(material)] = entry
+        return entry
+
+    def _column(self, value):
+        """Returns material values as an array with one value per wavelength."""
+        value = be.ravel(be.array(value))
+        if be.size(value) == 1 and len(self.wavelengths) > 1:
+            value = be.repeat(value, len(self.wavelengths))
+        return value
+
+    def _gather(self, values, wavelength):
+        """Gather the tabulated values for the rays."""
+        self._update_index(wavelength)
+        return values[self._index]
+
+
+class TabulatedMaterialView:
+    """A material-like view of the values of one material in an IndexTable.
+
+    The view is only valid for the wavelengths of the rays of the current
+    trace.
+
+    Args:
+        table (IndexTable): The index table.
+        material (BaseMaterial): The material.
+
+    """
+
+    def __init__(self, table, material):
+        self.table = table
+        self.material = material
+
+    def n(self, wavelength):
+        """Returns the refractive index for the given ray wavelengths."""
+        return self.table.n(self.material, wavelength)
+
+    def k(self, wavelength):
+        """Returns the extinction coefficient for the given ray wavelengths."""
+        return self.table.k(self.material, wavelength)
+
+
+def _is_current(entry, material):
+    """Returns True if a table entry holds the current values of a material."""
+    return entry[0] is material and entry[1] == material._revision
+
+
+def _requires_grad(value):
+    """Returns True if a value is part of an autograd graph."""
+    return bool(getattr(value, "requires_grad", False))
@@ -47,11 +47,13 @@ class ObjectSurface(Surface):
     def set_aperture(self):
         """Sets the aperture of the surface."""
 
-    def trace(self, rays):
+    def trace(self, rays, record=True):
         """Traces the given rays through the surface.
 
         Args:
             rays (Rays): The rays to be traced.
+            record (bool, optional): Whether to record the ray information on
+                the surface. Defaults to True.
 
         Returns:
             RealRays: The traced rays.
@@ -61,7 +63,8 @@ class ObjectSurface(Surface):
         self.reset()
 
         # record ray information
-        self._record(rays)
+        if record:
+            self._record(rays)
 
         return rays
 
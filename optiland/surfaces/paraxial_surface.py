@@ -72,9 +72,10 @@ class ParaxialSurface(Surface):
         # TODO: develop more robust method
         rays.opd = rays.opd - (rays.x**2 + rays.y**2) / (2 * self.f * rays.N)
 
-        n1 = self.material_pre.n(rays.w)
+        material_pre, material_post = self._materials()
+        n1 = material_pre.n(rays.w)
 
-        n2 = -n1 if self.is_reflective else self.material_post.n(rays.w)
+        n2 = -n1 if self.is_reflective else material_post.n(rays.w)
 
         ux1 = rays.L / rays.N
         uy1 = rays.M / rays.N
@@ -146,8 +147,6 @@ class ParaxialSurface(Surface):
         # inverse transform coordinate system
         self.geometry.globalize(rays)
 
-        self._record(rays)
-
         return rays
 
     def to_dict(self):
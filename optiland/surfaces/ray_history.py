@@ -0,0 +1,109 @@
+"""Ray History
+
+This module contains the RayHistory class, which stores the ray information
+recorded on the surfaces of a SurfaceGroup during a trace in one contiguous
+buffer. Surfaces write their data into the buffer in place and the
+SurfaceGroup exposes views into it, avoiding repeated copies and stacking of
+per-surface arrays.
+
+Kramer Harrison, 2025
+"""
+
+import optiland.backend as be
+from optiland.rays import ParaxialRays
+
+REAL_FIELDS = ("x", "y", "z", "L", "M", "N", "intensity", "opd")
+PARAXIAL_FIELDS = ("y", "u")
+
+# mapping of recorded field names to ray attribute names
+_RAY_ATTRIBUTES = {"intensity": "i"}
+
+
+class RayHistory:
+    """Contiguous buffer of ray information recorded on surfaces.
+
+    The buffer has shape (num_fields, num_surfaces, num_rays), where the
+    surface axis only spans the surfaces that record ray information.
+
+    Args:
+        fields (tuple[str]): Names of the recorded fields.
+        surface_indices (list[int]): Indices of the recorded surfaces within
+            the surface group, in tracing order.
+        num_rays (int): The number of rays.
+
+    Attributes:
+        fields (tuple[str]): Names of the recorded fields.
+        surface_indices (list[int]): Indices of the recorded surfaces.
+        data (be.ndarray): The history buffer.
+
+    """
+
+    def __init__(self, fields, surface_indices, num_rays):
+        self.fields = fields
+        self.surface_indices = list(surface_indices)
+        self.data = be.empty((len(fields), len(self.surface_indices), num_rays))
+        self._field_index = {name: k for k, name in enumerate(fields)}
+        self._rows = {index: row for row, index in enumerate(self.surface_indices)}
+
+    @classmethod
+    def from_rays(cls, rays, surface_indices):
+        """Create an empty history buffer sized for the given rays.
+
+        Args:
+            rays (BaseRays): The rays that will be traced.
+            surface_indices (list[int]): Indices of the recorded surfaces.
+
+        Returns:
+            RayHistory: The history buffer.
+
+        """
+        fields = PARAXIAL_FIELDS if isinstance(rays, ParaxialRays) else REAL_FIELDS
+        num_rays = max(
+            be.size(getattr(rays, _RAY_ATTRIBUTES.get(name, name))) for name in fields
+        )
+        return cls(fields, surface_indices, num_rays)
+
+    def __contains__(self, name):
+        return name in self._field_index
+
+    def get(self, name):
+        """Returns a view of one recorded field on all recorded surfaces.
+
+        Args:
+            name (str): The field name, e.g. 'x' or 'intensity'.
+
+        Returns:
+            be.ndarray: View of shape (num_surfaces, num_rays).
+
+        """
+        return self.data[self._field_index[name]]
+
+    def row(self, surface_index):
+        """Returns the buffer row of a recorded surface.
+
+        Args:
+            surface_index (int): The index of the surface in the group.
+
+        Returns:
+            int: The row of the surface in the buffer.
+
+        """
+        return self._rows[surface_index]
+
+    def record(self, row, rays):
+        """Write the ray information into a row of the buffer.
+
+        Args:
+            row (int): The buffer row to write.
+            rays (BaseRays): The rays to record.
+
+        Returns:
+            dict: Views of the recorded values for each field.
+
+        """
+        views = {}
+        for k, name in enumerate(self.fields):
+            value = getattr(rays, _RAY_ATTRIBUTES.get(name, name))
+            self.data[k, row] = value
+            views[name] = self.data[k, row]
+        return views
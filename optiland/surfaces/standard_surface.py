@@ -17,10 +17,11 @@ from optiland.materials import BaseMaterial
 from optiland.physical_apertures import BaseAperture
 from optiland.physical_apertures.radial import configure_aperture
 from optiland.rays import BaseRays, ParaxialRays, RealRays
+from optiland.revision import RevisionMixin
 from optiland.scatter import BaseBSDF
 
 
-class Surface:
+class Surface(RevisionMixin):
     """Represents a standard refractice surface in an optical system.
 
     Args:
@@ -36,9 +37,16 @@ class Surface:
             Defaults to None.
         comment (str, optional): A comment for the surface. Defaults to ''.
 
+    Note:
+        The surface keeps a revision of its parameters, see `RevisionMixin`.
+        The recorded rays and the semi-aperture do not change the revision.
+
     """
 
     _registry = {}  # registry for all surfaces
+    _trace_attributes = frozenset(
+        {"x", "y", "z", "u", "L", "M", "N", "intensity", "aoi", "opd", "semi_aperture"}
+    )
 
     def __init__(
         self,
@@ -67,6 +75,14 @@ class Surface:
 
         self.thickness = 0.0  # used for surface positioning
 
+        # slot (history, row) in the surface group ray history, set while
+        # the surface is traced as part of a surface group
+        self._history_slot = None
+
+        # index table of the surface group, set while the surface is traced
+        # as part of a surface group
+        self._index_table = None
+
         self.reset()
 
     def __init_subclass__(cls, **kwargs):
@@ -74,20 +90,29 @@ class Surface:
         super().__init_subclass__(**kwargs)
         Surface._registry[cls.__name__] = cls
 
-    def trace(self, rays: BaseRays):
+    def trace(self, rays: BaseRays, record: bool = True):
         """Traces the given rays through the surface.
 
         Args:
             rays (BaseRays): The rays to be traced.
+            record (bool, optional): Whether to record the ray information on
+                the surface. Defaults to True.
 
         Returns:
             BaseRays: The traced rays.
 
         """
         if isinstance(rays, ParaxialRays):
-            return self._trace_paraxial(rays)
-        if isinstance(rays, RealRays):
-            return self._trace_real(rays)
+            rays = self._trace_paraxial(rays)
+        elif isinstance(rays, RealRays):
+            rays = self._trace_real(rays)
+        else:
+            return None
+
+        if record:
+            self._record(rays)
+
+        return rays
 
     def set_semi_aperture(self, r_max: float):
         """Sets the physical semi-aperture of the surface.
@@ -125,7 +150,11 @@ class Surface:
             rays: The rays.
 
         """
-        if isinstance(rays, ParaxialRays):
+        if self._history_slot is not None:
+            history, row = self._history_slot
+            for name, value in history.record(row, rays).items():
+                setattr(self, name, value)
+        elif isinstance(rays, ParaxialRays):
             self.y = be.copy(be.atleast_1d(rays.y))
             self.u = be.copy(be.atleast_1d(rays.u))
         elif isinstance(rays, RealRays):
@@ -140,6 +169,21 @@ class Surface:
             self.intensity = be.copy(be.atleast_1d(rays.i))
             self.opd = be.copy(be.atleast_1d(rays.opd))
 
+    def _materials(self):
+        """Returns the materials before and after the surface for tracing.
+
+        While the surface is traced as part of a surface group, views into
+        the index table of the group are returned instead of the materials.
+
+        Returns:
+            tuple: The materials before and after the surface.
+
+        """
+        if self._index_table is None:
+            return self.material_pre, self.material_post
+        table = self._index_table
+        return table.view(self.material_pre), table.view(self.material_post)
+
     def _interact(self, rays):
         """Interacts the rays with the surface by either reflecting or refracting
 
@@ -157,8 +201,9 @@ class Surface:
         if self.is_reflective:
             rays.reflect(nx, ny, nz)
         else:
-            n1 = self.material_pre.n(rays.w)
-            n2 = self.material_post.n(rays.w)
+            material_pre, material_post = self._materials()
+            n1 = material_pre.n(rays.w)
+            n2 = material_post.n(rays.w)
             rays.refract(nx, ny, nz, n1, n2)
 
         # if there is a surface scatter model, modify ray properties
@@ -213,8 +258,6 @@ class Surface:
         # inverse transform coordinate system
         self.geometry.globalize(rays)
 
-        self._record(rays)
-
         return rays
 
     def _trace_real(self, rays: RealRays):
@@ -237,10 +280,11 @@ class Surface:
         t = self.geometry.distance(rays)
 
         # propagate the rays a distance t through material
-        rays.propagate(t, self.material_pre)
+        material_pre, _ = self._materials()
+        rays.propagate(t, material_pre)
 
         # update OPD
-        rays.opd = rays.opd + be.abs(t * self.material_pre.n(rays.w))
+        rays.opd = rays.opd + be.abs(t * material_pre.n(rays.w))
 
         # if there is a limiting aperture, clip rays outside of it
         if self.aperture:
@@ -252,9 +296,6 @@ class Surface:
         # inverse transform coordinate system
         self.geometry.globalize(rays)
 
-        # record ray information
-        self._record(rays)
-
         return rays
 
     def is_rotationally_symmetric(self):
@@ -8,10 +8,17 @@ converting the group to and from a dictionary for serialization.
 Kramer Harrison, 2024
 """
 
+from copy import copy
+
 import optiland.backend as be
 from optiland.coatings import BaseCoatingPolarized
+from optiland.rays import RealRays
 from optiland.surfaces.factories.surface_factory import SurfaceFactory
+from optiland.surfaces.index_table import IndexTable
+from optiland.surfaces.ray_history import RayHistory
 from optiland.surfaces.standard_surface import Surface
+from optiland.surfaces.trace_checkpoints import TraceCheckpoints
+from optiland.surfaces.trace_plan import TracePlan
 
 
 class SurfaceGroup:
@@ -19,6 +26,8 @@ class SurfaceGroup:
 
     Attributes:
         surfaces (list): List of surfaces in the group.
+        checkpoints (TraceCheckpoints or None): The ray states saved after
+            each surface of recent traces, if enabled.
         _last_thickness (float): The thickness of the last surface added.
 
     """
@@ -37,6 +46,9 @@ class SurfaceGroup:
             self.surfaces = surfaces
 
         self.surface_factory = SurfaceFactory(self)
+        self.index_table = IndexTable()
+        self.checkpoints = None
+        self._history = None
 
     def __add__(self, other):
         """Add two SurfaceGroup objects together.
@@ -64,49 +76,47 @@ class SurfaceGroup:
     @property
     def x(self):
         """np.array: x intersection points on all surfaces"""
-        return be.stack([surf.x for surf in self.surfaces if be.size(surf.x) > 0])
+        return self._get_recorded("x")
 
     @property
     def y(self):
         """np.array: y intersection points on all surfaces"""
-        return be.stack([surf.y for surf in self.surfaces if be.size(surf.y) > 0])
+        return self._get_recorded("y")
 
     @property
     def z(self):
         """np.array: z intersection points on all surfaces"""
-        return be.stack([surf.z for surf in self.surfaces if be.size(surf.z) > 0])
+        return self._get_recorded("z")
 
     @property
     def L(self):
         """np.array: x direction cosines on all surfaces"""
-        return be.stack([surf.L for surf in self.surfaces if be.size(surf.L) > 0])
+        return self._get_recorded("L")
 
     @property
     def M(self):
         """np.array: y direction cosines on all surfaces"""
-        return be.stack([surf.M for surf in self.surfaces if be.size(surf.M) > 0])
+        return self._get_recorded("M")
 
     @property
     def N(self):
         """np.array: z direction cosines on all surfaces"""
-        return be.stack([surf.N for surf in self.surfaces if be.size(surf.N) > 0])
+        return self._get_recorded("N")
 
     @property
     def opd(self):
         """np.array: optical path difference recorded on all surfaces"""
-        return be.stack([surf.opd for surf in self.surfaces if be.size(surf.opd) > 0])
+        return self._get_recorded("opd")
 
     @property
     def u(self):
         """np.array: paraxial ray angles on all surfaces"""
-        return be.stack([surf.u for surf in self.surfaces if be.size(surf.u) > 0])
+        return self._get_recorded("u")
 
     @property
     def intensity(self):
         """np.array: ray intensities on all surfaces"""
-        return be.stack(
-            [surf.intensity for surf in self.surfaces if be.size(surf.intensity) > 0]
-        )
+        return self._get_recorded("intensity")
 
     @property
     def positions(self):
@@ -191,20 +201,153 @@ class SurfaceGroup:
         t = self.positions
         return t[surface_number + 1] - t[surface_number]
 
-    def trace(self, rays, skip=0):
+    def trace(self, rays, skip=0, record="all", compact=False, return_indices=False):
         """Trace the given rays through the surfaces.
 
         Args:
             rays (BaseRays): List of rays to be traced.
             skip (int, optional): Number of surfaces to skip before tracing.
                 Defaults to 0.
+            record (str or list[int], optional): Which surfaces record ray
+                information. Options are "all", "image_only", "none", or a
+                list of surface indices. Properties such as `x` and `y` only
+                contain data for the recorded surfaces. Defaults to "all".
+            compact (bool, optional): If True, real rays that are blocked
+                (zero intensity) or lost (non-finite position or direction)
+                are dropped after each surface and are not traced through
+                the remaining surfaces. The returned rays keep the state of
+                dropped rays at the surface on which they were dropped. On
+                later recorded surfaces, dropped rays have zero intensity
+                and NaN position, direction and OPD. Defaults to False.
+            return_indices (bool, optional): If True, and `compact` is True,
+                only the surviving rays are returned, together with their
+                indices in the input rays. Defaults to False.
+
+        If checkpoints are enabled, see `enable_checkpoints`, and the same
+        real rays were traced before, the trace resumes behind the last
+        surface that is unchanged since then. This does not apply to
+        compacted traces.
+
+        Returns:
+            BaseRays or tuple: The traced rays, or the surviving rays and
+                their indices if `return_indices` is True.
 
         """
         self.reset()
-        for surface in self.surfaces[skip:]:
-            surface.trace(rays)
+        recorded = self.get_record_indices(record)
+        self._history = self._create_history(rays, recorded, skip)
+        is_real = isinstance(rays, RealRays)
+        if is_real:
+            self.index_table.begin(self.surfaces[skip:], rays.w)
+        try:
+            if is_real:
+                for surface in self.surfaces[skip:]:
+                    surface._index_table = self.index_table
+            if compact and is_real:
+                return self._trace_compacted(rays, skip, recorded, return_indices)
+            checkpoint, start = None, skip
+            if is_real and self.checkpoints is not None:
+                checkpoint, start = self.checkpoints.begin(self.surfaces, rays, skip)
+            for index, surface in enumerate(self.surfaces[skip:], start=skip):
+                is_recorded = index in recorded
+                if is_recorded:
+                    surface._history_slot = (self._history, self._history.row(index))
+                if index < start:
+                    if is_recorded:
+                        surface._record(checkpoint.state(index))
+                    continue
+                surface.trace(rays, record=is_recorded)
+                if checkpoint is not None:
+                    checkpoint.save(index, rays)
+        finally:
+            for surface in self.surfaces:
+                surface._history_slot = None
+                surface._index_table = None
         return rays
 
+    def get_record_indices(self, record="all"):
+        """Get the indices of the surfaces that record ray information.
+
+        Args:
+            record (str or list[int], optional): The recording mode. Options
+                are "all", "image_only", "none", or a list of surface indices.
+                Negative indices count from the image surface. Defaults to
+                "all".
+
+        Returns:
+            set[int]: The indices of the surfaces that record ray information.
+
+        Raises:
+            ValueError: If the recording mode is invalid.
+            IndexError: If a surface index is out of bounds.
+
+        """
+        num_surfaces = self.num_surfaces
+        if isinstance(record, str):
+            if record == "all":
+                return set(range(num_surfaces))
+            if record == "image_only":
+                return {num_surfaces - 1}
+            if record == "none":
+                return set()
+            raise ValueError(
+                f"Invalid record mode: {record}. Must be 'all', 'image_only', "
+                "'none', or a list of surface indices."
+            )
+
+        indices = set()
+        for index in record:
+            index = int(index)
+            if not -num_surfaces <= index < num_surfaces:
+                raise IndexError(
+                    f"Surface index {index} is out of bounds for "
+                    f"{num_surfaces} surfaces."
+                )
+            indices.add(index % num_surfaces)
+        return indices
+
+    def enable_checkpoints(self, max_traces=16):
+        """Save the ray states after each surface during real ray traces.
+
+        A later trace of the same rays restores the saved states of the
+        surfaces that are unchanged since then, up to the first changed
+        surface, and only traces the remaining surfaces. Surfaces are
+        compared by their serialized parameters, so the saved states stay
+        valid when a surface is changed and restored.
+
+        Args:
+            max_traces (int, optional): The number of traces kept. Defaults
+                to 16.
+
+        Returns:
+            TraceCheckpoints: The saved ray states.
+
+        """
+        self.checkpoints = TraceCheckpoints(max_traces)
+        return self.checkpoints
+
+    def disable_checkpoints(self):
+        """Stop saving ray states and discard the saved states."""
+        self.checkpoints = None
+
+    def compile(self, wavelengths=None):
+        """Compile the surface group into a trace plan.
+
+        The plan freezes the current state of the surfaces into flat arrays
+        and traces real rays through each standard surface with a single
+        fused kernel. The plan must be compiled again after any change to
+        the surfaces.
+
+        Args:
+            wavelengths (list, optional): Wavelengths in microns at which the
+                refractive indices are evaluated up front. Defaults to None.
+
+        Returns:
+            TracePlan: The compiled trace plan.
+
+        """
+        return TracePlan(self, wavelengths)
+
     def add_surface(
         self,
         new_surface=None,
@@ -317,6 +460,7 @@ class SurfaceGroup:
         This method iterates over each surface in the collection and calls
             its `reset` method.
         """
+        self._history = None
         for surface in self.surfaces:
             surface.reset()
 
@@ -350,6 +494,89 @@ class SurfaceGroup:
             [Surface.from_dict(surface_data) for surface_data in data["surfaces"]],
         )
 
+    def _create_history(self, rays, recorded, skip=0):
+        """Creates the ray history buffer for a trace.
+
+        Args:
+            rays (BaseRays): The rays to be traced.
+            recorded (set[int]): Indices of the surfaces that record ray
+                information.
+            skip (int, optional): Number of surfaces skipped during tracing.
+                Defaults to 0.
+
+        Returns:
+            RayHistory: The ray history buffer.
+
+        """
+        indices = [i for i in range(skip, self.num_surfaces) if i in recorded]
+        return RayHistory.from_rays(rays, indices)
+
+    def _trace_compacted(self, rays, skip, recorded, return_indices):
+        """Trace real rays, dropping dead rays after each surface.
+
+        The input rays hold the full ray layout. Rays are written back into
+        them when they are dropped, when a surface records ray information
+        and at the end of the trace. Surfaces behind the surface on which a
+        ray was dropped record the ray with zero intensity and NaN position,
+        direction and OPD.
+
+        Args:
+            rays (RealRays): The rays to be traced.
+            skip (int): Number of surfaces to skip before tracing.
+            recorded (set[int]): Indices of the surfaces that record ray
+                information.
+            return_indices (bool): Whether to return the surviving rays and
+                their indices instead of the full ray layout.
+
+        Returns:
+            RealRays or tuple: The traced rays, or the surviving rays and
+                their indices.
+
+        """
+        alive = be.ones_like(rays.x) > 0
+        working = copy(rays)
+        for index, surface in enumerate(self.surfaces[skip:], start=skip):
+            working = surface.trace(working, record=False)
+            keep = _is_alive(working)
+            is_recorded = index in recorded
+            if is_recorded or not be.all(keep):
+                _scatter_rays(rays, alive, working)
+            if is_recorded:
+                surface._history_slot = (self._history, self._history.row(index))
+                surface._record(rays if be.all(alive) else _mask_dropped(rays, alive))
+            if not be.all(keep):
+                alive = be.masked_assign(alive, alive, keep)
+                working = _select_rays(working, keep)
+
+        _scatter_rays(rays, alive, working)
+        if return_indices:
+            return working, be.flatnonzero(alive)
+        return rays
+
+    def _get_recorded(self, name):
+        """Get the recorded values of a ray field on all recorded surfaces.
+
+        Values are returned as a view into the ray history buffer of the last
+        trace, if available. Otherwise, the values recorded on the individual
+        surfaces are stacked.
+
+        Args:
+            name (str): The name of the recorded field.
+
+        Returns:
+            be.ndarray: The recorded values, shape (num_surfaces, num_rays).
+
+        """
+        if self._history is not None and name in self._history:
+            return self._history.get(name)
+        return be.stack(
+            [
+                getattr(surf, name)
+                for surf in self.surfaces
+                if be.size(getattr(surf, name)) > 0
+            ]
+        )
+
     def _update_coordinate_systems(self, start_index):
         """Updates the coordinate systems of surfaces from start_index.
 
@@ -402,3 +629,58 @@ class SurfaceGroup:
                 new_z = prev_surface.geometry.cs.z + thickness
 
             current_surface.geometry.cs.z = be.array(new_z)
+
+
+def _per_ray_attributes(rays):
+    """Returns the names of the ray attributes with one entry per ray."""
+    num_rays = be.size(rays.x)
+    return [name for name, value in vars(rays).items() if _has_rays(value, num_rays)]
+
+
+def _has_rays(value, num_rays):
+    """Returns True if a value is an array with one entry per ray."""
+    shape = getattr(value, "shape", ())
+    return len(shape) > 0 and shape[0] == num_rays
+
+
+def _is_alive(rays):
+    """Returns a mask of the rays that carry intensity and are finite."""
+    keep = rays.i > 0
+    for value in (rays.x, rays.y, rays.z, rays.L, rays.M, rays.N):
+        keep = keep & be.isfinite(value)
+    return keep
+
+
+def _select_rays(rays, mask):
+    """Returns a copy of the rays with only the masked rays."""
+    selected = copy(rays)
+    for name in _per_ray_attributes(rays):
+        setattr(selected, name, getattr(rays, name)[mask])
+    return selected
+
+
+def _mask_dropped(rays, alive):
+    """Returns a copy of the rays with the dropped rays blanked out.
+
+    Dropped rays get zero intensity and NaN position, direction and OPD.
+    """
+    masked = copy(rays)
+    for name in ("x", "y", "z", "L", "M", "N", "opd"):
+        setattr(masked, name, be.where(alive, getattr(rays, name), be.nan))
+    masked.i = be.where(alive, rays.i, 0.0)
+    return masked
+
+
+def _scatter_rays(rays, mask, values):
+    """Write the values of the selected rays back into the full ray layout.
+
+    Attributes that the full rays do not have yet, e.g. directions stored
+    during refraction, are created and filled with zeros.
+    """
+    num_rays = be.size(mask)
+    for name in _per_ray_attributes(values):
+        value = getattr(values, name)
+        full = getattr(rays, name, None)
+        if not _has_rays(full, num_rays):
+            full = be.zeros((num_rays,) + tuple(value.shape[1:]))
+        setattr(rays, name, be.masked_assign(full, mask, value))
@@ -0,0 +1,312 @@
+"""Trace Checkpoints
+
+This module contains the TraceCheckpoints class, which saves the state of the
+real rays after each surface of a SurfaceGroup trace. When the same rays are
+traced again after a change to the optical system, the trace resumes behind
+the last unchanged surface, instead of tracing all surfaces again. This pays
+off when a single surface changes between traces, e.g. in finite-difference
+derivatives and tolerance sensitivity runs.
+
+Kramer Harrison, 2025
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+import optiland.backend as be
+from optiland.physical_apertures.base import BaseBooleanAperture
+
+
+def _requires_grad(value):
+    """Returns True if a value, or an item of a list, requires gradients."""
+    if isinstance(value, (list, tuple)):
+        return any(_requires_grad(item) for item in value)
+    return bool(getattr(value, "requires_grad", False))
+
+
+def _has_grad(surface):
+    """Returns True if a parameter of a surface requires gradients."""
+    geometry = surface.geometry
+    objects = [surface, geometry, surface.material_pre, surface.material_post]
+    objects.extend(geometry.cs._chain())
+    return any(_requires_grad(value) for obj in objects for value in vars(obj).values())
+
+
+def _freeze(value):
+    """Convert a serialized value into a comparable form."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if be.is_array_like(value):
+        return tuple(np.ravel(be.to_numpy(value)).tolist())
+    return value
+
+
+def _parameter_objects(surface):
+    """Returns the objects holding the parameters of a surface."""
+    geometry = surface.geometry
+    objects = [surface, geometry, surface.material_pre, surface.material_post]
+    objects.extend([surface.coating, surface.bsdf])
+    apertures = [surface.aperture]
+    while apertures:
+        aperture = apertures.pop()
+        objects.append(aperture)
+        if isinstance(aperture, BaseBooleanAperture):
+            apertures.extend([aperture.a, aperture.b])
+    objects.extend(geometry.cs._chain())
+    return objects
+
+
+def revision_key(surface):
+    """Returns the identity and revision of each parameter object of a surface.
+
+    The key changes whenever a parameter of the surface, its geometry,
+    coordinate system, materials, coating, BSDF or physical aperture is
+    assigned, see `RevisionMixin`. Computing it is cheap, so it is evaluated
+    for every surface on every trace.
+
+    Args:
+        surface (Surface): The surface.
+
+    Returns:
+        tuple: The identity and revision of each object.
+
+    """
+    objects = _parameter_objects(surface)
+    return tuple((id(obj), getattr(obj, "_revision", None)) for obj in objects)
+
+
+def state_key(surface):
+    """Returns a stamp identifying the current parameters of a surface.
+
+    The stamp consists of the identity of the surface and its serialized
+    parameters, including its geometry, coordinate system and materials. It
+    is equal again when a surface is restored to a previous state, e.g. after
+    a finite-difference step. Surfaces with parameters that require gradients
+    get a unique stamp, so that they are always traced.
+
+    Serializing a surface is comparatively expensive. `TraceCheckpoints`
+    therefore only calls this function when the `revision_key` of a surface
+    has changed.
+
+    Args:
+        surface (Surface): The surface.
+
+    Returns:
+        tuple or object: The stamp of the surface.
+
+    """
+    if be.get_backend() == "torch" and _has_grad(surface):
+        return object()
+    return id(surface), _freeze(surface.to_dict())
+
+
+def _ray_state(rays):
+    """Returns copies of the ray attributes with one entry per ray."""
+    num_rays = be.size(rays.x)
+    return {
+        name: be.copy(value)
+        for name, value in vars(rays).items()
+        if len(getattr(value, "shape", ())) > 0 and value.shape[0] == num_rays
+    }
+
+
+def _equal_states(state, other):
+    """Returns True if two ray states hold the same rays."""
+    if state.keys() != other.keys():
+        return False
+    return all(
+        state[name].shape == other[name].shape and bool(be.all(state[name] == value))
+        for name, value in other.items()
+    )
+
+
+class _Trace:
+    """The saved input rays and ray states of one trace.
+
+    Args:
+        skip (int): Number of surfaces skipped before tracing.
+        rays_type (type): The class of the traced rays.
+        inputs (dict): The state of the input rays.
+        keys (list): The state key of each traced surface.
+
+    """
+
+    def __init__(self, skip, rays_type, inputs, keys):
+        self.skip = skip
+        self.rays_type = rays_type
+        self.inputs = inputs
+        self.keys = keys
+        self.states = []
+
+    def matches(self, skip, rays_type, inputs, keys):
+        """Returns the number of leading surfaces that can be restored.
+
+        Args:
+            skip (int): Number of surfaces skipped before tracing.
+            rays_type (type): The class of the rays to be traced.
+            inputs (dict): The state of the input rays.
+            keys (list): The current state key of each surface to be traced.
+
+        Returns:
+            int: The number of surfaces, counted from `skip`.
+
+        """
+        if skip != self.skip or rays_type is not self.rays_type:
+            return 0
+        if not _equal_states(self.inputs, inputs):
+            return 0
+        count = 0
+        for saved_key, key in zip(self.keys[: len(self.states)], keys):
+            if saved_key != key:
+                break
+            count += 1
+        return count
+
+    def state(self, index):
+        """Returns the rays saved after a surface.
+
+        Args:
+            index (int): The index of the surface in the surface group.
+
+        Returns:
+            SimpleNamespace: The ray attributes after the surface.
+
+        """
+        return SimpleNamespace(**self.states[index - self.skip])
+
+    def restore(self, rays, index):
+        """Set the rays to their state after a surface.
+
+        Args:
+            rays (RealRays): The rays, modified in place.
+            index (int): The index of the surface in the surface group.
+
+        """
+        for name, value in self.states[index - self.skip].items():
+            setattr(rays, name, be.copy(value))
+
+    def save(self, index, rays):
+        """Save the state of the rays after a surface.
+
+        States are only saved for consecutive surfaces, and not once the rays
+        require gradients.
+
+        Args:
+            index (int): The index of the surface in the surface group.
+            rays (RealRays): The rays after the surface.
+
+        """
+        if len(self.states) != index - self.skip:
+            return
+        state = _ray_state(rays)
+        if not any(_requires_grad(value) for value in state.values()):
+            self.states.append(state)
+
+
+class TraceCheckpoints:
+    """Ray states saved after each surface of recent traces.
+
+    For each trace, the input rays are saved together with the state of the
+    rays after each surface and the state key of each surface, see
+    `state_key`. A later trace of equal input rays restores the saved state
+    behind the longest run of unchanged surfaces, and only traces the
+    remaining surfaces. Only real rays are saved.
+
+    The state key of a surface is reused as long as its `revision_key` is
+    unchanged. It is only computed again after a parameter was assigned, so
+    that a surface restored to a previous state matches the saved traces.
+
+    Args:
+        max_traces (int, optional): The number of traces kept. The least
+            recently used trace is dropped first. It should be at least twice
+            the number of distinct sets of rays traced per evaluation, e.g.
+            per field and wavelength of a merit function, so that the traces
+            of the unperturbed system are kept. Defaults to 16.
+
+    Attributes:
+        max_traces (int): The number of traces kept.
+        surfaces_skipped (int): The total number of surfaces that were
+            restored instead of traced.
+
+    Raises:
+        ValueError: If `max_traces` is not a positive integer.
+
+    """
+
+    def __init__(self, max_traces=16):
+        if int(max_traces) < 1:
+            raise ValueError("max_traces must be a positive integer.")
+        self.max_traces = int(max_traces)
+        self.surfaces_skipped = 0
+        self._traces = []
+        self._backend = None
+        self._keys = {}
+
+    def __len__(self):
+        return len(self._traces)
+
+    def clear(self):
+        """Remove all saved traces."""
+        self._traces = []
+        self._keys = {}
+
+    def begin(self, surfaces, rays, skip=0):
+        """Prepare a trace, restoring the rays from the best saved trace.
+
+        Args:
+            surfaces (list[Surface]): All surfaces of the surface group.
+            rays (RealRays): The input rays. If a saved trace can be resumed,
+                they are set in place to the state behind the last unchanged
+                surface.
+            skip (int, optional): Number of surfaces skipped before tracing.
+                Defaults to 0.
+
+        Returns:
+            tuple: The trace in which the states of the traced surfaces are
+                saved, or None if the rays are not saved, and the index of
+                the first surface to be traced.
+
+        """
+        backend = be.backend_key()
+        if backend != self._backend:
+            self.clear()
+            self._backend = backend
+
+        inputs = _ray_state(rays)
+        if any(_requires_grad(value) for value in inputs.values()):
+            return None, skip
+
+        keys = [self._state_key(surface) for surface in surfaces[skip:]]
+        best, count = None, 0
+        for trace in self._traces:
+            matched = trace.matches(skip, type(rays), inputs, keys)
+            if matched > count:
+                best, count = trace, matched
+
+        if best is not None:
+            best.restore(rays, skip + count - 1)
+            self.surfaces_skipped += count
+            self._traces.remove(best)
+            self._traces.insert(0, best)
+            if count == len(keys):
+                return best, skip + count
+
+        trace = _Trace(skip, type(rays), inputs, keys)
+        if best is not None:
+            trace.states = best.states[:count]
+        self._traces.insert(0, trace)
+        del self._traces[self.max_traces :]
+        return trace, skip + count
+
+    def _state_key(self, surface):
+        """Returns the state key of a surface, reusing it while unchanged."""
+        revisions = revision_key(surface)
+        saved = self._keys.get(id(surface))
+        if saved is not None and saved[0] == revisions:
+            return saved[1]
+        key = state_key(surface)
+        self._keys[id(surface)] = (revisions, key)
+        return key
@@ -0,0 +1,429 @@
+"""Trace Plan
+
+This module contains the TracePlan class, a compiled, array-backed form of a
+SurfaceGroup. Compiling a surface group freezes the lens into per-surface
+transform matrices, geometry kinds, refractive indices at the requested
+wavelengths and aperture parameters. Real rays are then traced through each
+eligible surface by a single fused kernel that performs the localize,
+intersect, propagate, OPD, clip, refract/reflect, globalize and record steps
+in one pass over the rays, writing into the ray history buffer of the group.
+
+Surfaces that cannot be expressed in the fused kernel (e.g., coatings,
+scattering, non-conic geometries or polygonal apertures) fall back to their
+regular `Surface.trace` method, so a plan always reproduces the result of
+`SurfaceGroup.trace`.
+
+Kramer Harrison, 2025
+"""
+
+import numpy as np
+from numba import njit
+
+import optiland.backend as be
+from optiland.geometries import Plane, StandardGeometry
+from optiland.physical_apertures import RadialAperture
+from optiland.rays import PolarizedRays, RealRays
+from optiland.surfaces.image_surface import ImageSurface
+from optiland.surfaces.ray_history import REAL_FIELDS
+from optiland.surfaces.standard_surface import Surface
+
+_GEOMETRY_PLANE = 0
+_GEOMETRY_STANDARD = 1
+
+_INTERACT_REFRACT = 0
+_INTERACT_REFLECT = 1
+_INTERACT_NONE = 2
+
+# ray attributes, in the order of the recorded fields
+_RAY_FIELDS = ("x", "y", "z", "L", "M", "N", "i", "opd")
+
+
+@njit(cache=True, error_model="numpy")
+def _trace_surface(
+    x,
+    y,
+    z,
+    L,
+    M,
+    N,
+    i,
+    opd,
+    w,
+    widx,
+    rot,
+    trans,
+    geometry_kind,
+    radius,
+    conic,
+    interaction,
+    n1,
+    n2,
+    k1,
+    has_aperture,
+    r_min,
+    r_max,
+    do_record,
+    record,
+):  # pragma: no cover
+    """Trace rays through a single surface in place.
+
+    Args:
+        x, y, z (np.ndarray): Global ray positions, updated in place.
+        L, M, N (np.ndarray): Global direction cosines, updated in place.
+        i (np.ndarray): Ray intensities, updated in place.
+        opd (np.ndarray): Ray optical path lengths, updated in place.
+        w (np.ndarray): Ray wavelengths in microns.
+        widx (np.ndarray): Index of each ray's wavelength in the index tables.
+        rot (np.ndarray): Effective 3x3 rotation matrix of the surface.
+        trans (np.ndarray): Effective translation of the surface.
+        geometry_kind (int): Geometry identifier (plane or standard).
+        radius (float): Radius of curvature of the surface.
+        conic (float): Conic constant of the surface.
+        interaction (int): Interaction identifier (refract, reflect or none).
+        n1 (np.ndarray): Refractive index before the surface per wavelength.
+        n2 (np.ndarray): Refractive index after the surface per wavelength.
+        k1 (np.ndarray): Extinction coefficient before the surface per
+            wavelength.
+        has_aperture (bool): Whether the surface has a radial aperture.
+        r_min (float): Minimum radius of the radial aperture.
+        r_max (float): Maximum radius of the radial aperture.
+        do_record (bool): Whether to record the ray state after the surface.
+        record (np.ndarray): Buffer of shape (8, num_rays) into which the ray
+            state is recorded after the surface, if `do_record` is True.
+
+    """
+    for j in range(x.shape[0]):
+        # localize: p_local = R^T (p - t)
+        px = x[j] - trans[0]
+        py = y[j] - trans[1]
+        pz = z[j] - trans[2]
+        xl = rot[0, 0] * px + rot[1, 0] * py + rot[2, 0] * pz
+        yl = rot[0, 1] * px + rot[1, 1] * py + rot[2, 1] * pz
+        zl = rot[0, 2] * px + rot[1, 2] * py + rot[2, 2] * pz
+        Ll = rot[0, 0] * L[j] + rot[1, 0] * M[j] + rot[2, 0] * N[j]
+        Ml = rot[0, 1] * L[j] + rot[1, 1] * M[j] + rot[2, 1] * N[j]
+        Nl = rot[0, 2] * L[j] + rot[1, 2] * M[j] + rot[2, 2] * N[j]
+
+        # distance to surface
+        if geometry_kind == _GEOMETRY_PLANE:
+            t = -zl / Nl
+        else:
+            a = conic * Nl**2 + Ll**2 + Ml**2 + Nl**2
+            b = (
+                2 * conic * Nl * zl
+                + 2 * Ll * xl
+                + 2 * Ml * yl
+                - 2 * Nl * radius
+                + 2 * Nl * zl
+            )
+            c = conic * zl**2 - 2 * radius * zl + xl**2 + yl**2 + zl**2
+            if a == 0:
+                t = -c / b
+            else:
+                d = np.sqrt(b**2 - 4 * a * c)
+                t1 = (-b + d) / (2 * a)
+                t2 = (-b - d) / (2 * a)
+                t = t1 if abs(zl + t1 * Nl) <= abs(zl + t2 * Nl) else t2
+
+        # propagate through material before the surface
+        xl = xl + t * Ll
+        yl = yl + t * Ml
+        zl = zl + t * Nl
+        wi = widx[j]
+        alpha = 4 * np.pi * k1[wi] / w[j]
+        intensity = i[j] * np.exp(-alpha * t * 1e3)  # mm to microns
+
+        # update OPD
+        opd[j] = opd[j] + abs(t * n1[wi])
+
+        # clip rays outside of the aperture
+        if has_aperture:
+            r2 = xl**2 + yl**2
+            if not (r2 <= r_max**2 and r2 >= r_min**2):
+                intensity = 0.0
+        i[j] = intensity
+
+        # interact with surface
+        if interaction != _INTERACT_NONE:
+            if geometry_kind == _GEOMETRY_PLANE:
+                nx = 0.0
+                ny = 0.0
+                nz = 1.0
+            else:
+                denom = radius * np.sqrt(1 - (1 + conic) * (xl**2 + yl**2) / radius**2)
+                dfdx = xl / denom
+                dfdy = yl / denom
+                mag = np.sqrt(dfdx**2 + dfdy**2 + 1)
+                nx = dfdx / mag
+                ny = dfdy / mag
+                nz = -1 / mag
+
+            dot = Ll * nx + Ml * ny + Nl * nz
+            sgn = np.sign(dot)
+            nx = nx * sgn
+            ny = ny * sgn
+            nz = nz * sgn
+            dot = abs(dot)
+
+            if interaction == _INTERACT_REFLECT:
+                Ll = Ll - 2 * dot * nx
+                Ml = Ml - 2 * dot * ny
+                Nl = Nl - 2 * dot * nz
+            else:
+                u = n1[wi] / n2[wi]
+                root = np.sqrt(1 - u**2 * (1 - dot**2))
+                Ll = u * Ll + nx * root - u * nx * dot
+                Ml = u * Ml + ny * root - u * ny * dot
+                Nl = u * Nl + nz * root - u * nz * dot
+
+        # globalize: p = R p_local + t
+        x[j] = rot[0, 0] * xl + rot[0, 1] * yl + rot[0, 2] * zl + trans[0]
+        y[j] = rot[1, 0] * xl + rot[1, 1] * yl + rot[1, 2] * zl + trans[1]
+        z[j] = rot[2, 0] * xl + rot[2, 1] * yl + rot[2, 2] * zl + trans[2]
+        L[j] = rot[0, 0] * Ll + rot[0, 1] * Ml + rot[0, 2] * Nl
+        M[j] = rot[1, 0] * Ll + rot[1, 1] * Ml + rot[1, 2] * Nl
+        N[j] = rot[2, 0] * Ll + rot[2, 1] * Ml + rot[2, 2] * Nl
+
+        # record ray information
+        if do_record:
+            record[0, j] = x[j]
+            record[1, j] = y[j]
+            record[2, j] = z[j]
+            record[3, j] = L[j]
+            record[4, j] = M[j]
+            record[5, j] = N[j]
+            record[6, j] = i[j]
+            record[7, j] = opd[j]
+
+
+class _SurfaceStep:
+    """Frozen, array-backed description of a single surface in a trace plan.
+
+    Args:
+        surface (Surface): The surface to freeze.
+
+    Attributes:
+        surface (Surface): The original surface, used for fallback tracing
+            and for storing recorded ray data.
+        fused (bool): True if the surface is traced by the fused kernel.
+
+    """
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.fused = self._is_fusable(surface)
+        if not self.fused:
+            return
+
+        geometry = surface.geometry
+        translation, rotation = geometry.cs.get_effective_transform()
+        self.rot = np.ascontiguousarray(be.to_numpy(rotation), dtype=np.float64)
+        self.trans = np.ascontiguousarray(be.to_numpy(translation), dtype=np.float64)
+
+        if isinstance(geometry, Plane):
+            self.geometry_kind = _GEOMETRY_PLANE
+            self.radius = np.inf
+            self.conic = 0.0
+        else:
+            self.geometry_kind = _GEOMETRY_STANDARD
+            self.radius = float(be.to_numpy(geometry.radius))
+            self.conic = float(be.to_numpy(geometry.k))
+
+        if isinstance(surface, ImageSurface):
+            self.interaction = _INTERACT_NONE
+        elif surface.is_reflective:
+            self.interaction = _INTERACT_REFLECT
+        else:
+            self.interaction = _INTERACT_REFRACT
+
+        self.has_aperture = surface.aperture is not None
+        if self.has_aperture:
+            self.r_min = float(surface.aperture.r_min)
+            self.r_max = float(surface.aperture.r_max)
+        else:
+            self.r_min = 0.0
+            self.r_max = np.inf
+
+        self._indices = {}
+
+    @staticmethod
+    def _is_fusable(surface):
+        """Determines whether a surface can be traced by the fused kernel."""
+        if type(surface) not in (Surface, ImageSurface):
+            return False
+        if surface.coating is not None or surface.bsdf is not None:
+            return False
+        aperture = surface.aperture
+        if aperture is not None and type(aperture) is not RadialAperture:
+            return False
+
+        geometry = surface.geometry
+        if type(geometry) is Plane:
+            return True
+        if type(geometry) is StandardGeometry:
+            return bool(np.isfinite(be.to_numpy(geometry.radius)))
+        return False
+
+    def indices(self, wavelength):
+        """Returns the frozen (n_pre, n_post, k_pre) at a wavelength.
+
+        Values are computed once per wavelength and cached on the step.
+
+        Args:
+            wavelength (float): The wavelength in microns.
+
+        Returns:
+            tuple[float, float, float]: The refractive index before and after
+            the surface and the extinction coefficient before the surface.
+
+        """
+        if wavelength not in self._indices:
+            w = be.array([wavelength])
+            surface = self.surface
+            self._indices[wavelength] = (
+                _to_float(surface.material_pre.n(w)),
+                _to_float(surface.material_post.n(w)),
+                _to_float(surface.material_pre.k(w)),
+            )
+        return self._indices[wavelength]
+
+
+def _to_float(value):
+    """Converts a scalar or single-element array to a Python float."""
+    return float(np.ravel(be.to_numpy(value))[0])
+
+
+class TracePlan:
+    """A compiled trace plan for a SurfaceGroup.
+
+    The plan freezes the state of the surface group at the time of
+    compilation. Any subsequent change to the lens (radii, positions,
+    materials, apertures, etc.) requires the plan to be compiled again.
+
+    The fused kernel is used for real rays with the NumPy backend. For other
+    backends, paraxial rays or polarized rays, the plan defers to the regular
+    per-surface trace so that results are always identical to
+    `SurfaceGroup.trace`.
+
+    Args:
+        surface_group (SurfaceGroup): The surface group to compile.
+        wavelengths (list, optional): Wavelengths in microns at which the
+            refractive indices are evaluated up front. Indices at any other
+            wavelength are evaluated and frozen on first use. Defaults to None.
+
+    Attributes:
+        surface_group (SurfaceGroup): The compiled surface group.
+        steps (list[_SurfaceStep]): The frozen per-surface steps.
+
+    """
+
+    def __init__(self, surface_group, wavelengths=None):
+        self.surface_group = surface_group
+        self.steps = [_SurfaceStep(surface) for surface in surface_group.surfaces]
+
+        if wavelengths is not None:
+            for wavelength in np.ravel(be.to_numpy(wavelengths)):
+                for step in self.steps:
+                    if step.fused:
+                        step.indices(float(wavelength))
+
+    @property
+    def num_fused(self):
+        """int: the number of surfaces traced by the fused kernel"""
+        return sum(step.fused for step in self.steps)
+
+    def trace(self, rays, skip=0, record="all"):
+        """Trace the given rays through the compiled surfaces.
+
+        Args:
+            rays (BaseRays): The rays to be traced.
+            skip (int, optional): Number of surfaces to skip before tracing.
+                Defaults to 0.
+            record (str or list[int], optional): Which surfaces record ray
+                information. See `SurfaceGroup.trace`. Defaults to "all".
+
+        Returns:
+            BaseRays: The traced rays.
+
+        """
+        if (
+            be.get_backend() != "numpy"
+            or not isinstance(rays, RealRays)
+            or isinstance(rays, PolarizedRays)
+            or not rays.is_normalized
+        ):
+            return self.surface_group.trace(rays, skip, record)
+
+        surface_group = self.surface_group
+        surface_group.reset()
+        recorded = surface_group.get_record_indices(record)
+
+        # the kernel updates rays in place, so never write into caller arrays
+        for attr in _RAY_FIELDS:
+            setattr(rays, attr, np.array(getattr(rays, attr), dtype=np.float64))
+
+        history = surface_group._create_history(rays, recorded, skip)
+        surface_group._history = history
+        empty = np.empty((len(REAL_FIELDS), 0))
+
+        for index, step in enumerate(self.steps[skip:], start=skip):
+            do_record = index in recorded
+            row = history.row(index) if do_record else None
+            if not step.fused:
+                step.surface._history_slot = (history, row) if do_record else None
+                try:
+                    step.surface.trace(rays, record=do_record)
+                finally:
+                    step.surface._history_slot = None
+                continue
+
+            rays.w = np.ascontiguousarray(rays.w, dtype=np.float64)
+            wavelengths, widx = self._wavelength_index(rays.w)
+            n1, n2, k1 = (
+                np.array(values, dtype=np.float64)
+                for values in zip(*[step.indices(w) for w in wavelengths])
+            )
+
+            _trace_surface(
+                *(self._contiguous(rays, attr) for attr in _RAY_FIELDS),
+                rays.w,
+                widx,
+                step.rot,
+                step.trans,
+                step.geometry_kind,
+                step.radius,
+                step.conic,
+                step.interaction,
+                n1,
+                n2,
+                k1,
+                step.has_aperture,
+                step.r_min,
+                step.r_max,
+                do_record,
+                history.data[:, row] if do_record else empty,
+            )
+
+            if do_record:
+                for name in REAL_FIELDS:
+                    setattr(step.surface, name, history.get(name)[row])
+
+        return rays
+
+    @staticmethod
+    def _contiguous(rays, attr):
+        """Ensures a ray attribute is a contiguous float64 array."""
+        value = getattr(rays, attr)
+        if not (value.flags.c_contiguous and value.dtype == np.float64):
+            value = np.ascontiguousarray(value, dtype=np.float64)
+            setattr(rays, attr, value)
+        return value
+
+    @staticmethod
+    def _wavelength_index(w):
+        """Maps each ray wavelength to an index into the unique wavelengths."""
+        if w.size == 0 or w.min() == w.max():
+            wavelengths = [float(w[0])] if w.size else [1.0]
+            return wavelengths, np.zeros(w.size, dtype=np.int64)
+        unique, widx = np.unique(w, return_inverse=True)
+        return [float(v) for v in unique], widx.astype(np.int64)
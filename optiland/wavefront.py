@@ -19,6 +19,7 @@ from scipy.interpolate import griddata
 
 import optiland.backend as be
 from optiland.distribution import create_distribution
+from optiland.parallel import map_method
 from optiland.zernike import ZernikeFit
 
 
@@ -58,6 +59,11 @@ class Wavefront:
         wavelengths (str or List[float]): Wavelengths or 'all'/'primary'.
         num_rays (int): Number of rays for pupil sampling.
         distribution (str or Distribution): Ray distribution or its name.
+        n_workers (int, optional): If given, the fields and wavelengths are
+            traced in this many worker processes. Defaults to None (serial).
+        executor (OpticExecutor, optional): An existing executor for the
+            optic, used to trace the fields and wavelengths in parallel.
+            Defaults to None.
 
     Attributes:
         data (List[List[WavefrontData]]): Nested lists indexed
@@ -71,8 +77,13 @@ class Wavefront:
         wavelengths="all",
         num_rays=12,
         distribution="hexapolar",
+        *,
+        n_workers=None,
+        executor=None,
     ):
         self.optic = optic
+        self.n_workers = n_workers
+        self.executor = executor
         self.fields = self._resolve_fields(fields)
         self.wavelengths = self._resolve_wavelengths(wavelengths)
         self.num_rays = num_rays
@@ -119,20 +130,39 @@ class Wavefront:
     def _generate_data(self):
         """Generate wavefront data for all fields and wavelengths."""
         pupil_z = self.optic.paraxial.XPL() + self.optic.surface_group.positions[-1]
-        for field in self.fields:
-            for wl in self.wavelengths:
-                # trace chief ray and get reference sphere
-                self._trace_chief_ray(field, wl)
-                xc, yc, zc, R = self._get_reference_sphere(pupil_z)
-
-                # reference OPD (chief ray)
-                opd_ref, _ = self._get_path_length(xc, yc, zc, R, wl)
-                opd_ref = self._correct_tilt(field, opd_ref, x=0, y=0)
-
-                # generate full field data
-                self.data[(field, wl)] = self._generate_field_data(
-                    field, wl, opd_ref, xc, yc, zc, R
-                )
+        pairs = [(field, wl) for field in self.fields for wl in self.wavelengths]
+        results = map_method(
+            self,
+            "_generate_pair_data",
+            [(field, wl, pupil_z) for field, wl in pairs],
+            self.n_workers,
+            self.executor,
+        )
+        self.data.update(zip(pairs, results))
+
+    def _generate_pair_data(self, field, wl, pupil_z):
+        """
+        Generate WavefrontData for a single field and wavelength, including
+        the chief ray trace and the reference sphere.
+
+        Args:
+            field (tuple): Field coordinates.
+            wl (float): Wavelength.
+            pupil_z: z-coordinate of the exit pupil.
+
+        Returns:
+            WavefrontData: All per-ray results.
+        """
+        # trace chief ray and get reference sphere
+        self._trace_chief_ray(field, wl)
+        xc, yc, zc, R = self._get_reference_sphere(pupil_z)
+
+        # reference OPD (chief ray)
+        opd_ref, _ = self._get_path_length(xc, yc, zc, R, wl)
+        opd_ref = self._correct_tilt(field, opd_ref, x=0, y=0)
+
+        # generate full field data
+        return self._generate_field_data(field, wl, opd_ref, xc, yc, zc, R)
 
     def _generate_field_data(self, field, wavelength, opd_ref, xc, yc, zc, R):
         """
@@ -11,9 +11,10 @@ Kramer Harrison, 2024
 """
 
 import optiland.backend as be
+from optiland.revision import RevisionMixin
 
 
-class Wavelength:
+class Wavelength(RevisionMixin):
     """Represents a wavelength value with support for unit conversion.
 
     Args:
@@ -25,6 +26,10 @@ class Wavelength:
     Methods:
         _convert_to_um(): Converts the wavelength value to microns.
 
+    Note:
+        The wavelength keeps a revision of its parameters, see
+        `RevisionMixin`.
+
     """
 
     def __init__(self, value, is_primary=True, unit="um"):
@@ -792,6 +792,16 @@ def test_generate_field_data_global(set_test_backend, cooke_triplet):
     assert_allclose(plot_y, global_y)
 
 
+def test_spot_diagram_chunked(set_test_backend, cooke_triplet):
+    spot = analysis.SpotDiagram(cooke_triplet, num_rings=8)
+    spot_chunked = analysis.SpotDiagram(cooke_triplet, num_rings=8, chunk_size=50)
+    for field_data, field_data_chunked in zip(spot.data, spot_chunked.data):
+        for data, data_chunked in zip(field_data, field_data_chunked):
+            assert_allclose(data_chunked.x, data.x)
+            assert_allclose(data_chunked.y, data.y)
+            assert_allclose(data_chunked.intensity, data.intensity)
+
+
 @pytest.fixture
 def test_system_irradiance_v1():
     class TestSystemIrradianceV1(Optic):
@@ -903,6 +913,19 @@ class TestIncoherentIrradiance:
         irr_user.view()
         plt.close()
 
+    def test_irradiance_chunked(self, set_test_backend, test_system_irradiance_v1):
+        kwargs = {"num_rays": 40, "distribution": "uniform", "res": (8, 8)}
+        irr = analysis.IncoherentIrradiance(test_system_irradiance_v1, **kwargs)
+        irr_chunked = analysis.IncoherentIrradiance(
+            test_system_irradiance_v1, chunk_size=100, **kwargs
+        )
+        irr_map, x_edges, y_edges = irr.data[0][0]
+        irr_map_chunked, x_edges_chunked, y_edges_chunked = irr_chunked.data[0][0]
+        assert be.sum(irr_map) > 0
+        assert_allclose(irr_map_chunked, irr_map)
+        assert_allclose(x_edges_chunked, x_edges)
+        assert_allclose(y_edges_chunked, y_edges)
+
     @patch("matplotlib.pyplot.show")
     def test_irradiance_v1_one_ray_per_other_pixel(
         self, mock_show, set_test_backend, test_system_irradiance_v1
@@ -126,3 +126,73 @@ def test_coordinate_system_from_dict(set_test_backend):
     assert cs.ry == 0.0
     assert cs.rz == 0.0
     assert cs.reference_cs is None
+
+
+def _random_rays(num_rays=5):
+    x = be.linspace(-1, 1, num_rays)
+    L = be.linspace(-0.2, 0.2, num_rays)
+    M = be.linspace(0.1, -0.1, num_rays)
+    N = be.sqrt(1 - L**2 - M**2)
+    return RealRays(x, -2 * x, x**2, L, M, N, be.ones_like(x), be.ones_like(x))
+
+
+def test_coordinate_system_matches_sequential(set_test_backend):
+    ref_cs = CoordinateSystem(5, 5, 5, 0.2, 0.3, 0.4)
+    mid_cs = CoordinateSystem(-1, 0, 2, 0.0, 0.0, 0.0, ref_cs)
+    cs = CoordinateSystem(10, 20, 30, 0.5, 0.6, 0.7, mid_cs)
+
+    rays = _random_rays()
+    expected = _random_rays()
+    cs.localize(rays)
+    cs._localize_sequential(expected)
+    for name in ("x", "y", "z", "L", "M", "N"):
+        assert_allclose(getattr(rays, name), getattr(expected, name))
+
+    cs.globalize(rays)
+    cs._globalize_sequential(expected)
+    for name in ("x", "y", "z", "L", "M", "N"):
+        assert_allclose(getattr(rays, name), getattr(expected, name))
+        assert_allclose(getattr(rays, name), getattr(_random_rays(), name))
+
+
+def test_coordinate_system_transform_cache(set_test_backend):
+    ref_cs = CoordinateSystem(0, 0, 1, 0.1, 0.0, 0.0)
+    cs = CoordinateSystem(0, 0, 2, 0.0, 0.2, 0.0, ref_cs)
+
+    rotation, translation = cs._get_transform()
+    rotation_again, translation_again = cs._get_transform()
+    if be.get_backend() == "numpy":
+        assert rotation_again is rotation
+        assert translation_again is translation
+
+    # changes anywhere in the reference chain invalidate the transform
+    for change in (
+        lambda: setattr(cs, "z", be.array(3.0)),
+        lambda: setattr(ref_cs, "rx", be.array(0.3)),
+        lambda: setattr(cs, "reference_cs", CoordinateSystem(1.0, 0, 0)),
+    ):
+        change()
+        rays = _random_rays()
+        expected = _random_rays()
+        cs.localize(rays)
+        cs._localize_sequential(expected)
+        assert_allclose(rays.z, expected.z)
+        assert_allclose(rays.M, expected.M)
+
+
+def test_coordinate_system_gradient():
+    torch = pytest.importorskip("torch")
+    be.set_backend("torch")
+    be.set_precision("float64")
+    try:
+        be.grad_mode.enable()
+        cs = CoordinateSystem(0, 0, 5, 0.1, 0, 0)
+        rays = _random_rays()
+        cs.localize(rays)
+        rays.y.sum().backward()
+        assert cs.rx.grad is not None
+        assert torch.isfinite(cs.rx.grad)
+        assert cs._transform_cache is None
+    finally:
+        be.grad_mode.disable()
+        be.set_backend("numpy")
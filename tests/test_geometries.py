@@ -1,3 +1,5 @@
+import math
+
 import optiland.backend as be
 import pytest
 import numpy as np
@@ -304,6 +306,69 @@ class TestEvenAsphere:
         distance = geometry.distance(rays)
         assert_allclose(distance, 10.625463223037386)
 
+    def test_distance_iterations_and_failures(self, set_test_backend):
+        cs = CoordinateSystem()
+        geometry = geometries.EvenAsphere(
+            cs,
+            radius=-41.1,
+            conic=0.0,
+            coefficients=[1e-3, -1e-5, 1e-7],
+        )
+
+        # on-axis ray hits the vertex directly; the second ray misses the
+        # base sphere and cannot be traced
+        rays = RealRays(
+            [0.0, 1.0, 100.0],
+            [0.0, 2.0, 0.0],
+            [-3.0, -3.0, -3.0],
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0],
+            [1.0, 1.0, 1.0],
+            [1.0, 1.0, 1.0],
+            [1.0, 1.0, 1.0],
+        )
+        distance = geometry.distance(rays)
+        assert_allclose(distance[:2], [3.0, 2.9438901710409624])
+        assert be.to_numpy(geometry.failed).tolist() == [False, False, True]
+
+        iterations = be.to_numpy(geometry.iterations)
+        assert iterations[0] == 1
+        assert 1 < iterations[1] < 10
+        assert iterations[2] == 0
+
+    def test_distance_signed(self, set_test_backend):
+        cs = CoordinateSystem()
+        geometry = geometries.EvenAsphere(
+            cs,
+            radius=-41.1,
+            conic=0.0,
+            coefficients=[1e-3, -1e-5, 1e-7],
+        )
+
+        # ray starts behind the surface
+        rays = RealRays(1.0, 2.0, 3.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+        distance = geometry.distance(rays)
+        assert_allclose(distance, -3.0561098289590376)
+
+    def test_distance_warm_start(self, set_test_backend):
+        cs = CoordinateSystem()
+        geometry = geometries.EvenAsphere(
+            cs,
+            radius=-41.1,
+            conic=0.0,
+            coefficients=[1e-3, -1e-5, 1e-7],
+        )
+        geometry.warm_start = True
+
+        rays = RealRays(1.0, 2.0, -3.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+        geometry.distance(rays)
+        cold_iterations = be.to_numpy(geometry.iterations)[0]
+
+        rays = RealRays(1.0, 2.0, -3.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+        distance = geometry.distance(rays)
+        assert_allclose(distance, 2.9438901710409624)
+        assert be.to_numpy(geometry.iterations)[0] < cold_iterations
+
     def test_surface_normal(self, set_test_backend):
         cs = CoordinateSystem()
         geometry = geometries.EvenAsphere(
@@ -616,6 +681,43 @@ class TestChebyshevGeometry:
         with pytest.raises(ValueError):
             geometry.sag(100, 100)
 
+    def test_sag_matches_chebval2d(self, set_test_backend):
+        cs = CoordinateSystem()
+        coefficients = np.random.default_rng(0).normal(size=(8, 6)) * 1e-3
+        geometry = geometries.ChebyshevPolynomialGeometry(
+            cs,
+            radius=-26.0,
+            conic=0.1,
+            coefficients=coefficients,
+            norm_x=10,
+            norm_y=12,
+        )
+        x = np.array([0.0, 3.0, -8.0, 9.5, -10.0])
+        y = np.array([0.0, -7.0, 2.1, 12.0, -4.4])
+
+        r2 = x**2 + y**2
+        expected = r2 / (-26.0 * (1 + np.sqrt(1 - 1.1 * r2 / 26.0**2)))
+        expected += np.polynomial.chebyshev.chebval2d(x / 10, y / 12, coefficients)
+        assert_allclose(geometry.sag(be.array(x), be.array(y)), expected)
+
+    def test_surface_normal_at_edge(self, set_test_backend):
+        cs = CoordinateSystem()
+        coefficients = be.array(
+            [[0.0, 1e-2, -2e-3], [0.1, 1e-2, -1e-3], [0.2, 1e-2, 0.0]]
+        )
+        geometry = geometries.ChebyshevPolynomialGeometry(
+            cs,
+            radius=-26.0,
+            conic=0.1,
+            coefficients=coefficients,
+            norm_x=10,
+            norm_y=10,
+        )
+        nx, ny, nz = geometry._surface_normal(be.array([10.0]), be.array([-10.0]))
+        assert be.all(be.isfinite(nx))
+        assert be.all(be.isfinite(ny))
+        assert_allclose(nx**2 + ny**2 + nz**2, 1.0)
+
     def test_to_dict(self, set_test_backend):
         cs = CoordinateSystem()
         coefficients = be.array(
@@ -740,6 +842,60 @@ class TestOddAsphere:
         )
         assert str(geometry) == "Odd Asphere"
 
+    def test_normal_at_vertex(self, set_test_backend):
+        cs = CoordinateSystem()
+        geometry = geometries.OddAsphere(
+            cs,
+            radius=10.0,
+            conic=0.5,
+            coefficients=[1e-2, -1e-5],
+        )
+        nx, ny, nz = geometry._surface_normal(be.array([0.0]), be.array([0.0]))
+        assert_allclose(nx, 0.0)
+        assert_allclose(ny, 0.0)
+        assert_allclose(nz, -1.0)
+
+
+@pytest.mark.parametrize(
+    "geometry_factory",
+    [
+        lambda cs: geometries.EvenAsphere(
+            cs, radius=25.0, conic=-0.7, coefficients=[1e-3, -2e-5, 3e-7]
+        ),
+        lambda cs: geometries.OddAsphere(
+            cs, radius=-40.0, conic=0.3, coefficients=[1e-3, 2e-4, -2e-5]
+        ),
+        lambda cs: geometries.PolynomialGeometry(
+            cs, radius=30.0, conic=0.1, coefficients=[[0, 1e-3, 0], [2e-3, 0, 1e-4]]
+        ),
+        lambda cs: geometries.ZernikePolynomialGeometry(
+            cs,
+            radius=30.0,
+            conic=0.1,
+            coefficients=[1e-3 * (-1) ** i / (i + 1) for i in range(40)],
+            norm_radius=5.0,
+        ),
+    ],
+)
+def test_sag_and_normal_consistent(set_test_backend, geometry_factory):
+    geometry = geometry_factory(CoordinateSystem())
+    x = be.array([0.5, -1.5, 2.0, 0.3])
+    y = be.array([1.0, 0.7, -2.5, -0.4])
+
+    sag, (nx, ny, nz) = geometry._sag_and_normal(x, y)
+    assert_allclose(sag, geometry.sag(x, y))
+    normal = geometry._surface_normal(x, y)
+    assert_allclose(nx, normal[0])
+    assert_allclose(ny, normal[1])
+    assert_allclose(nz, normal[2])
+
+    # the normal follows from the finite-difference gradient of the sag
+    h = 1e-6
+    dzdx = (geometry.sag(x + h, y) - geometry.sag(x - h, y)) / (2 * h)
+    dzdy = (geometry.sag(x, y + h) - geometry.sag(x, y - h)) / (2 * h)
+    assert_allclose(nx / nz, -dzdx, atol=1e-6)
+    assert_allclose(ny / nz, -dzdy, atol=1e-6)
+
 
 class TestZernikeGeometry:
     def test_str(self, set_test_backend):
@@ -754,6 +910,63 @@ class TestZernikeGeometry:
         )
         assert str(geometry) == "Zernike Polynomial"
 
+    def test_sag(self, set_test_backend):
+        cs = CoordinateSystem()
+        coefficients = [1e-3 * (i % 5 - 2) for i in range(66)]
+        geometry = geometries.ZernikePolynomialGeometry(
+            cs,
+            radius=40.0,
+            conic=-0.5,
+            coefficients=coefficients,
+            norm_radius=8.0,
+        )
+        x = np.array([0.0, 1.2, -3.5, 4.0, -0.7])
+        y = np.array([0.0, 2.5, -1.0, -5.0, 6.1])
+
+        # explicit factorial form of the radial polynomials
+        rho = np.hypot(x, y) / 8.0
+        theta = np.arctan2(y, x)
+        expected = x**2 + y**2
+        expected = expected / (40.0 * (1 + np.sqrt(1 - 0.5 * expected / 40.0**2)))
+        for i, c in enumerate(coefficients):
+            n, m = geometry._fringezernike_order_to_zernike_order(i + 1)
+            radial = sum(
+                (-1) ** k
+                * math.factorial(n - k)
+                / (
+                    math.factorial(k)
+                    * math.factorial((n + abs(m)) // 2 - k)
+                    * math.factorial((n - abs(m)) // 2 - k)
+                )
+                * rho ** (n - 2 * k)
+                for k in range((n - abs(m)) // 2 + 1)
+            )
+            angular = np.cos(m * theta) if m >= 0 else np.sin(-m * theta)
+            expected += np.sqrt(2 * (i + 1) / np.pi) * c * radial * angular
+
+        assert_allclose(geometry.sag(be.array(x), be.array(y)), expected)
+
+    def test_surface_normal_at_vertex(self, set_test_backend):
+        cs = CoordinateSystem()
+        geometry = geometries.ZernikePolynomialGeometry(
+            cs,
+            radius=40.0,
+            coefficients=[0.0, 0.0, 0.0, 1e-3, 0.0, 0.0, 0.0, 0.0, 2e-3],
+            norm_radius=8.0,
+        )
+        nx, ny, nz = geometry._surface_normal(be.array([0.0]), be.array([0.0]))
+        assert_allclose(nx, 0.0)
+        assert_allclose(ny, 0.0)
+        assert_allclose(nz, -1.0)
+
+    def test_no_coefficients(self, set_test_backend):
+        cs = CoordinateSystem()
+        geometry = geometries.ZernikePolynomialGeometry(cs, radius=40.0)
+        standard = geometries.StandardGeometry(cs, radius=40.0)
+        x = be.array([0.0, 0.3, -0.5])
+        y = be.array([0.0, 0.4, 0.2])
+        assert_allclose(geometry.sag(x, y), standard.sag(x, y))
+
 
 # --- Fixtures for Toroidal Tests ---
 @pytest.fixture
@@ -1159,6 +1372,49 @@ class TestToroidalGeometry:
         with pytest.raises(ValueError):
             geometries.ToroidalGeometry.from_dict(invalid_dict)
 
+    @pytest.mark.parametrize("geometry", ["cylinder_x_geometry", "cylinder_y_geometry"])
+    def test_cylinder_distance_closed_form(self, geometry, request, set_test_backend):
+        geom = request.getfixturevalue(geometry)
+        # the last ray travels parallel to the vertex plane and misses
+        rays = RealRays(
+            [0.0, 3.0, -6.0, 0.0],
+            [0.0, -4.0, 7.0, 0.0],
+            [-2.0, -2.0, -2.0, -2.0],
+            [0.0, 0.1, -0.05, 1.0],
+            [0.0, -0.05, 0.1, 0.0],
+            [1.0, np.sqrt(0.9875), np.sqrt(0.9875), 0.0],
+            1.0,
+            0.55,
+        )
+        t = geom.distance(rays)
+        assert be.to_numpy(geom.failed).tolist() == [False, False, False, True]
+        assert be.all(geom.iterations == 0)
+
+        x = rays.x[:3] + t[:3] * rays.L[:3]
+        y = rays.y[:3] + t[:3] * rays.M[:3]
+        z = rays.z[:3] + t[:3] * rays.N[:3]
+        assert_allclose(z, geom.sag(x, y), atol=1e-12)
+
+    def test_toroid_distance_iterative(self, basic_toroid_geometry, set_test_backend):
+        rays = RealRays(
+            [3.0, -6.0],
+            [-4.0, 7.0],
+            [-2.0, -2.0],
+            [0.1, -0.05],
+            [-0.05, 0.1],
+            [np.sqrt(0.9875), np.sqrt(0.9875)],
+            1.0,
+            0.55,
+        )
+        t = basic_toroid_geometry.distance(rays)
+        assert not be.any(basic_toroid_geometry.failed)
+        assert be.all(basic_toroid_geometry.iterations > 0)
+
+        x = rays.x + t * rays.L
+        y = rays.y + t * rays.M
+        z = rays.z + t * rays.N
+        assert_allclose(z, basic_toroid_geometry.sag(x, y), atol=1e-9)
+
     def test_inf_radius_intersect_sphere_normal_incidence(
         self, cylinder_x_geometry, set_test_backend
     ):
@@ -1310,6 +1566,58 @@ class TestBiconicGeometry:
         # In Biconic.__init__, self.radius is set to radius_x. So this path is tested.
         assert_allclose(geom.distance(rays), 5.0, atol=1e-9)
 
+    @pytest.mark.parametrize(
+        "radius_x, radius_y, conic_x, conic_y",
+        [(30.0, be.inf, -0.5, 0.0), (be.inf, -25.0, 0.0, 1.2), (30.0, -50.0, -1, -1)],
+    )
+    def test_distance_closed_form(
+        self, set_test_backend, radius_x, radius_y, conic_x, conic_y
+    ):
+        cs = CoordinateSystem()
+        geom = BiconicGeometry(cs, radius_x, radius_y, conic_x, conic_y)
+        # the last ray travels parallel to the vertex plane and misses
+        rays = RealRays(
+            [0.0, 3.0, -6.0, 0.0],
+            [0.0, -4.0, 7.0, 0.0],
+            [-2.0, -2.0, -2.0, -2.0],
+            [0.0, 0.1, -0.05, 1.0],
+            [0.0, -0.05, 0.1, 0.0],
+            [1.0, np.sqrt(0.9875), np.sqrt(0.9875), 0.0],
+            1.0,
+            0.55,
+        )
+        t = geom.distance(rays)
+        assert be.to_numpy(geom.failed).tolist() == [False, False, False, True]
+        assert be.all(geom.iterations == 0)
+
+        x = rays.x[:3] + t[:3] * rays.L[:3]
+        y = rays.y[:3] + t[:3] * rays.M[:3]
+        z = rays.z[:3] + t[:3] * rays.N[:3]
+        assert_allclose(z, geom.sag(x, y), atol=1e-12)
+        assert_allclose(t[0], 2.0)
+
+    def test_distance_iterative(self, set_test_backend):
+        cs = CoordinateSystem()
+        geom = BiconicGeometry(cs, 30.0, -50.0, 0.2, -0.7)
+        rays = RealRays(
+            [3.0, -6.0],
+            [-4.0, 7.0],
+            [-2.0, -2.0],
+            [0.1, -0.05],
+            [-0.05, 0.1],
+            [np.sqrt(0.9875), np.sqrt(0.9875)],
+            1.0,
+            0.55,
+        )
+        t = geom.distance(rays)
+        assert not be.any(geom.failed)
+        assert be.all(geom.iterations > 0)
+
+        x = rays.x + t * rays.L
+        y = rays.y + t * rays.M
+        z = rays.z + t * rays.N
+        assert_allclose(z, geom.sag(x, y), atol=1e-9)
+
     def test_to_dict_from_dict(self, set_test_backend):
         cs = CoordinateSystem(x=1, y=2, z=3, rx=0.1, ry=-0.1, rz=0.05)
         original_geom = BiconicGeometry(
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+import optiland.backend as be
+from optiland.materials import GlassCatalog, Material, MaterialFile
+
+from .utils import assert_allclose
+
+
+@pytest.fixture(scope="module")
+def schott():
+    return GlassCatalog(["schott"])
+
+
+def test_refractive_index_matches_materials(set_test_backend):
+    # includes Sellmeier, Cauchy and tabulated glasses
+    catalog = GlassCatalog(["ami", "misc"])
+    assert len(catalog) == 16
+    assert catalog._other
+
+    wavelength = be.array([0.5, 0.6, 0.7])
+    n = catalog.n(wavelength)
+    assert n.shape == (16, 3)
+    for index, filename in enumerate(catalog.filenames):
+        expected = be.ravel(MaterialFile(filename).n(wavelength))
+        assert_allclose(n[index], expected)
+
+
+def test_scalar_wavelength(set_test_backend, schott):
+    n = schott.n(0.55)
+    assert n.shape == (len(schott),)
+    index = schott.index("N-BK7")
+    assert_allclose(n[index], Material("N-BK7", "schott").n(0.55))
+
+
+def test_abbe_number(set_test_backend, schott):
+    index = schott.index("n-bk7", manufacturer="Schott")
+    material = schott.material(index)
+    assert_allclose(schott.nd[index], material.n(0.5875618))
+    assert_allclose(schott.vd[index], material.abbe())
+
+
+def test_partial_dispersion(set_test_backend, schott):
+    index = schott.index("N-SF11")
+    material = schott.material(index)
+    n_g, n_F, n_C = (material.n(w) for w in (0.4358343, 0.4861327, 0.6562725))
+    expected = (n_g - n_F) / (n_F - n_C)
+    assert_allclose(schott.partial_dispersion()[index], expected)
+
+
+def test_nearest(set_test_backend, schott):
+    index = schott.index("N-BK7")
+    nd = float(be.to_numpy(schott.nd)[index])
+    vd = float(be.to_numpy(schott.vd)[index])
+
+    nearest = schott.nearest(nd, vd, count=3)
+    assert len(nearest) == 3
+    assert nearest[0] == index
+
+    distance = np.hypot(
+        be.to_numpy(schott.nd)[nearest] - nd,
+        0.01 * (be.to_numpy(schott.vd)[nearest] - vd),
+    )
+    assert np.all(np.diff(distance) >= 0)
+
+
+def test_invalid_catalog(set_test_backend, schott):
+    with pytest.raises(ValueError):
+        GlassCatalog(["not a manufacturer"])
+    with pytest.raises(ValueError):
+        schott.index("not a glass")
+
+
+def test_materials_created_lazily(set_test_backend, monkeypatch):
+    created = []
+    init = MaterialFile.__init__
+
+    def counting_init(self, filename, *args, **kwargs):
+        created.append(filename)
+        init(self, filename, *args, **kwargs)
+
+    monkeypatch.setattr(MaterialFile, "__init__", counting_init)
+    catalog = GlassCatalog(["schott"])
+    assert created == []
+
+    catalog.n(0.55)
+    assert len(created) == len(catalog._other)
+
+    catalog.material(catalog.index("N-BK7"))
+    assert len(created) == len(catalog._other) + 1
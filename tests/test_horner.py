@@ -0,0 +1,39 @@
+import numpy as np
+
+import optiland.backend as be
+from optiland.geometries import horner
+
+from .utils import assert_allclose
+
+
+def test_polyval(set_test_backend):
+    c = [1.5, -2.0, 0.25, 3.0]
+    t = be.array([-1.2, 0.0, 0.7, 2.0])
+    expected = np.polynomial.polynomial.polyval(be.to_numpy(t), c)
+    assert_allclose(horner.polyval(c, t), expected)
+    assert horner.polyval([], t) == 0
+
+
+def test_polyval_with_derivative(set_test_backend):
+    c = [1.5, -2.0, 0.25, 3.0]
+    t = be.array([-1.2, 0.0, 0.7, 2.0])
+    p, dp = horner.polyval_with_derivative(c, t)
+    t_np = be.to_numpy(t)
+    assert_allclose(p, np.polynomial.polynomial.polyval(t_np, c))
+    derivative = np.polynomial.polynomial.polyder(c)
+    assert_allclose(dp, np.polynomial.polynomial.polyval(t_np, derivative))
+
+
+def test_polyval2d_with_gradient(set_test_backend):
+    rng = np.random.default_rng(0)
+    c = rng.normal(size=(4, 3))
+    x = be.array([-1.0, 0.0, 0.5, 2.0])
+    y = be.array([0.3, -0.7, 0.0, 1.5])
+    x_np, y_np = be.to_numpy(x), be.to_numpy(y)
+
+    p, dp_dx, dp_dy = horner.polyval2d_with_gradient(be.array(c), x, y)
+    poly = np.polynomial.polynomial
+    assert_allclose(p, poly.polyval2d(x_np, y_np, c))
+    assert_allclose(dp_dx, poly.polyval2d(x_np, y_np, poly.polyder(c, axis=0)))
+    assert_allclose(dp_dy, poly.polyval2d(x_np, y_np, poly.polyder(c, axis=1)))
+    assert_allclose(horner.polyval2d(be.array(c), x, y), p)
@@ -0,0 +1,117 @@
+import numpy as np
+
+import optiland.backend as be
+from optiland.materials import AbbeMaterial, IdealMaterial, Material
+from optiland.samples.objectives import CookeTriplet
+from optiland.surfaces.index_table import IndexTable
+from .utils import assert_allclose
+
+
+def test_unique_wavelengths(set_test_backend):
+    values, inverse = be.unique_wavelengths(be.array([0.55, 0.48, 0.55, 0.65]))
+    assert values == [0.48, 0.55, 0.65]
+    assert np.array_equal(inverse, [1, 0, 1, 2])
+
+    values, inverse = be.unique_wavelengths(be.full((5,), 0.55))
+    assert values == [0.55]
+    assert inverse is None
+
+
+def test_index_table_gathers_values(set_test_backend):
+    glass = Material("N-BK7")
+    air = IdealMaterial(n=1.0)
+    lens = CookeTriplet()
+    surface = lens.surface_group.surfaces[1]
+    surface.material_pre, surface.material_post = air, glass
+
+    wavelength = be.array([0.48, 0.55, 0.65, 0.55])
+    table = IndexTable()
+    table.begin([surface], wavelength)
+    assert table.wavelengths == [0.48, 0.55, 0.65]
+    assert_allclose(table.n(glass, wavelength), glass.n(wavelength))
+    assert_allclose(table.view(glass).k(wavelength), glass.k(wavelength))
+    assert_allclose(table.view(air).n(wavelength), be.ones(4))
+
+    # a single wavelength gives a single value
+    uniform = be.full((3,), 0.55)
+    assert_allclose(table.n(glass, uniform), glass.n(0.55))
+
+
+def test_index_table_tracks_materials(set_test_backend):
+    lens = CookeTriplet()
+    surface = lens.surface_group.surfaces[1]
+    wavelength = be.full((2,), 0.55)
+
+    table = IndexTable()
+    table.begin([surface], wavelength)
+    n = table.n(surface.material_post, wavelength)
+
+    surface.material_post = IdealMaterial(n=1.7)
+    table.begin([surface], wavelength)
+    assert_allclose(table.n(surface.material_post, wavelength), 1.7)
+    assert abs(np.ravel(be.to_numpy(n))[0] - 1.7) > 1e-3
+
+
+def test_trace_matches_material_evaluation(set_test_backend):
+    lens = CookeTriplet()
+    rays = lens.ray_tracer.ray_generator.generate_rays(
+        0.0, 1.0, be.zeros(3), be.array([-0.5, 0.0, 0.5]), 0.55
+    )
+    rays.w = be.array([0.48, 0.55, 0.65])
+    lens.surface_group.trace(rays)
+    for surface in lens.surface_group.surfaces:
+        assert surface._index_table is None
+
+    reference = lens.ray_tracer.ray_generator.generate_rays(
+        0.0, 1.0, be.zeros(3), be.array([-0.5, 0.0, 0.5]), 0.55
+    )
+    reference.w = be.array([0.48, 0.55, 0.65])
+    for surface in lens.surface_group.surfaces:
+        surface.trace(reference)
+    assert_allclose(rays.x, reference.x)
+    assert_allclose(rays.y, reference.y)
+    assert_allclose(rays.opd, reference.opd)
+
+
+def test_index_table_cleared_by_invalidate(set_test_backend):
+    lens = CookeTriplet()
+    lens.trace(0.0, 1.0, 0.55, num_rays=3)
+    assert lens.surface_group.index_table.wavelengths == [0.55]
+    lens.invalidate()
+    assert lens.surface_group.index_table.wavelengths == []
+
+
+def test_index_table_tracks_material_changes(set_test_backend):
+    lens = CookeTriplet()
+    lens.set_index(1.6, 1)
+    material = lens.surface_group.surfaces[1].material_post
+    lens.trace(0.0, 1.0, 0.55, num_rays=3)
+    y = be.copy(lens.surface_group.y[-1])
+
+    material.index = be.array([1.7])
+    lens.trace(0.0, 1.0, 0.55, num_rays=3)
+    assert not np.allclose(be.to_numpy(lens.surface_group.y[-1]), be.to_numpy(y))
+
+    reference = CookeTriplet()
+    reference.set_index(1.7, 1)
+    reference.trace(0.0, 1.0, 0.55, num_rays=3)
+    assert_allclose(lens.surface_group.y[-1], reference.surface_group.y[-1])
+
+
+def test_index_table_tracks_abbe_material_changes(set_test_backend):
+    lens = CookeTriplet()
+    surface = lens.surface_group.surfaces[1]
+    material = AbbeMaterial(n=1.6, abbe=50.0)
+    surface.material_post = material
+    lens.surface_group.surfaces[2].material_pre = material
+
+    wavelength = be.full((2,), 0.55)
+    table = lens.surface_group.index_table
+    table.begin(lens.surface_group.surfaces, wavelength)
+    n = table.n(material, wavelength)
+
+    material.index = be.array([1.7])
+    table.begin(lens.surface_group.surfaces, wavelength)
+    assert_allclose(table.n(material, wavelength), material.n(0.55))
+    assert_allclose(AbbeMaterial(n=1.7, abbe=50.0).n(0.55), material.n(0.55))
+    assert not np.allclose(be.to_numpy(table.n(material, wavelength)), be.to_numpy(n))
@@ -3,8 +3,10 @@ from importlib import resources
 import optiland.backend as be
 import pytest
 import numpy as np
+from scipy.interpolate import CubicSpline
 
 from optiland import materials
+from optiland.materials.interpolation import TabulatedInterpolant
 from .utils import assert_allclose
 
 
@@ -277,6 +279,185 @@ class TestMaterialFile:
         material_dict = {"filename": filename, "type": materials.MaterialFile.__name__}
         assert materials.MaterialFile.from_dict(material_dict).filename == filename
 
+    def test_cached_values_match_formula(self, set_test_backend):
+        material = materials.Material("N-BK7")
+        func = material.formula_map[material._n_formula]
+        wavelengths = be.array([0.48, 0.55, 0.48, 0.65, 0.55])
+        assert_allclose(material.n(wavelengths), func(wavelengths))
+        assert_allclose(material.n(0.55), func(0.55))
+
+        # uniform wavelengths and repeated calls use the cache
+        uniform = be.full((4,), 0.55)
+        assert_allclose(material.n(uniform), func(uniform))
+        assert_allclose(material.n(wavelengths), func(wavelengths))
+        assert material.n(wavelengths).shape == wavelengths.shape
+
+    def test_cache_evaluates_each_wavelength_once(self, set_test_backend):
+        material = materials.Material("N-BK7")
+        calls = []
+        formula = material._n_formula
+        func = material.formula_map[formula]
+
+        def counting_func(w):
+            calls.append(be.size(w))
+            return func(w)
+
+        material.formula_map = {**material.formula_map, formula: counting_func}
+        material.n(be.array([0.48, 0.55, 0.48, 0.55]))
+        material.n(be.array([0.55, 0.65, 0.48]))
+        material.n(be.array([0.65, 0.65]))
+        assert calls == [2, 1]
+
+    def test_cache_size_is_limited(self, set_test_backend, monkeypatch):
+        from optiland.materials import material_file
+
+        monkeypatch.setattr(material_file, "_MAX_CACHED_VALUES", 4)
+        material = materials.Material("N-BK7")
+        func = material.formula_map[material._n_formula]
+        wavelengths = be.linspace(0.45, 0.65, 10)
+        assert_allclose(material.n(wavelengths), func(wavelengths))
+        assert len(material._values) == 4
+
+        # the most recently used values are kept
+        assert_allclose(material.n(wavelengths[-4:]), func(wavelengths[-4:]))
+        assert len(material._values) == 4
+
+    def test_cache_cleared_when_data_changes(self, set_test_backend):
+        material = materials.Material("N-BK7")
+        n = material.n(be.array([0.55, 0.65]))
+        material.coefficients = material.coefficients * 1.1
+        assert be.all(material.n(be.array([0.55, 0.65])) > n)
+
+        n = material.n(be.array([0.55, 0.65]))
+        material.coefficients[1] = material.coefficients[1] * 1.1
+        assert_allclose(material.n(be.array([0.55, 0.65])), n)
+        material.clear_cache()
+        assert be.all(material.n(be.array([0.55, 0.65])) > n)
+
+    def test_parsed_file_shared(self, set_test_backend, monkeypatch):
+        filename = str(
+            resources.files("optiland.database").joinpath(
+                "data-nk/glass/schott/BAFN6.yml",
+            ),
+        )
+        first = materials.MaterialFile(filename)
+
+        def fail():
+            raise AssertionError("material file parsed again")
+
+        monkeypatch.setattr(materials.MaterialFile, "_read_file", lambda self: fail())
+        second = materials.MaterialFile(filename)
+        assert_allclose(second.n(0.5), first.n(0.5))
+        assert_allclose(second.k(0.56), first.k(0.56))
+        assert second.reference_data == first.reference_data
+
+        # instances do not share their data
+        for name in ("coefficients", "_k_wavelength", "_k"):
+            assert not np.shares_memory(
+                be.to_numpy(getattr(first, name)),
+                be.to_numpy(getattr(second, name)),
+            )
+
+    def test_disk_cache(self, set_test_backend, tmp_path, monkeypatch):
+        source = resources.files("optiland.database").joinpath(
+            "data-nk/main/CaGdAlO4/Loiko-o.yml",
+        )
+        filename = tmp_path / "material.yml"
+        filename.write_text(source.read_text())
+
+        materials.MaterialFile.enable_disk_cache(tmp_path / "cache")
+        try:
+            parsed = materials.MaterialFile(str(filename))
+            assert len(list((tmp_path / "cache").glob("*.npz"))) == 1
+
+            materials.MaterialFile.clear_parsed_cache()
+            monkeypatch.setattr(
+                materials.MaterialFile,
+                "_read_file",
+                lambda self: pytest.fail("material file parsed again"),
+            )
+            cached = materials.MaterialFile(str(filename))
+        finally:
+            materials.MaterialFile.disable_disk_cache()
+
+        assert cached._n_formula == parsed._n_formula
+        assert cached.reference_data == parsed.reference_data
+        assert_allclose(cached.n(0.6), parsed.n(0.6))
+        assert cached.k(1.0) == 0.0
+
+    def test_modified_file_parsed_again(self, set_test_backend, tmp_path):
+        filename = tmp_path / "material.yml"
+        data = "DATA:\n  - type: tabulated n\n    data: |\n        0.5 {n}\n        0.7 {n}\n"
+        filename.write_text(data.format(n=1.5))
+        assert_allclose(materials.MaterialFile(str(filename)).n(0.6), 1.5)
+
+        filename.write_text(data.format(n=1.75))
+        assert_allclose(materials.MaterialFile(str(filename)).n(0.6), 1.75)
+
+    def test_cubic_interpolation(self, set_test_backend):
+        filename = str(
+            resources.files("optiland.database").joinpath(
+                "data-nk/main/Ag/Johnson.yml",
+            ),
+        )
+        linear = materials.MaterialFile(filename)
+        cubic = materials.MaterialFile(filename, interpolation="cubic")
+
+        # the interpolants agree at the tabulated wavelengths
+        w = linear._n_wavelength[2:5]
+        assert_allclose(cubic.n(w), linear.n(w))
+        assert_allclose(cubic.k(w), linear.k(w))
+
+        # and differ between them
+        w_mid = (w[:-1] + w[1:]) / 2
+        assert not np.allclose(
+            be.to_numpy(cubic.n(w_mid)), be.to_numpy(linear.n(w_mid))
+        )
+
+        # values are clamped outside the table
+        assert_allclose(cubic.n(100.0), linear._n[-1])
+
+        assert cubic.to_dict()["interpolation"] == "cubic"
+        assert "interpolation" not in linear.to_dict()
+        restored = materials.MaterialFile.from_dict(cubic.to_dict())
+        assert_allclose(restored.n(w_mid), cubic.n(w_mid))
+
+    def test_invalid_interpolation(self, set_test_backend):
+        with pytest.raises(ValueError):
+            materials.Material("Ag", interpolation="quadratic")
+
+
+class TestTabulatedInterpolant:
+    def test_linear(self, set_test_backend):
+        interpolant = TabulatedInterpolant(
+            be.array([0.7, 0.5, 0.6]), be.array([3.0, 1.0, 2.0])
+        )
+        assert_allclose(interpolant(be.array([0.4, 0.55, 0.65, 0.8])), [1, 1.5, 2.5, 3])
+        assert_allclose(interpolant(0.55), 1.5)
+
+    def test_cubic(self, set_test_backend):
+        x = np.linspace(0.4, 0.8, 9)
+        interpolant = TabulatedInterpolant(be.array(x), be.array(x**3), "cubic")
+        w = be.array([0.45, 0.6, 0.73])
+        expected = CubicSpline(x, x**3, bc_type="natural")(be.to_numpy(w))
+        assert_allclose(interpolant(w), expected)
+        assert_allclose(interpolant(0.6), 0.6**3)
+
+    def test_short_tables(self, set_test_backend):
+        single = TabulatedInterpolant(be.array([0.5]), be.array([1.5]), "cubic")
+        assert_allclose(single(be.array([0.4, 0.6])), [1.5, 1.5])
+
+        pair = TabulatedInterpolant(be.array([0.5, 0.7]), be.array([1.0, 2.0]), "cubic")
+        assert_allclose(pair(0.6), 1.5)
+
+    def test_invalid(self, set_test_backend):
+        with pytest.raises(ValueError):
+            TabulatedInterpolant(be.array([0.5]), be.array([1.0]), "nearest")
+        with pytest.raises(ValueError):
+            TabulatedInterpolant(None, None)
+        with pytest.raises(ValueError):
+            TabulatedInterpolant(be.array([0.5, 0.6]), be.array([1.0]))
+
 
 class TestMaterial:
     def test_standard_material(self, set_test_backend):
@@ -353,6 +534,47 @@ class TestMaterial:
     def test_raise_warning(self, set_test_backend):
         materials.Material("LITHOTEC-CAF2")  # prints a warning
 
+    def test_levenshtein_distance(self):
+        distance = materials.Material._levenshtein_distance
+        assert distance("kitten", "sitting") == 3
+        assert distance("", "abc") == 3
+        assert distance("n-bk7", "n-bk7") == 0
+
+    def test_index_matches_dataframe_search(self, set_test_backend):
+        df = materials.Material._load_dataframe()
+        material = materials.Material("SF11", reference="schott")
+        matches = material._find_material_matches(df)
+
+        name, reference = "sf11", "schott"
+        expected = df[
+            df["category_name"].str.lower().str.contains(name)
+            | df["name"].str.lower().str.contains(name)
+            | df["filename_no_ext"].str.lower().str.contains(name)
+        ]
+        expected = expected[
+            expected["category_name"].str.lower().str.contains(reference)
+            | expected["category_name_full"].str.lower().str.contains(reference)
+            | expected["reference"].str.lower().str.contains(reference)
+            | expected["name"].str.lower().str.contains(reference)
+            | expected["filename"].str.lower().str.contains(reference)
+        ]
+        assert sorted(matches["filename"]) == sorted(expected["filename"])
+        assert list(matches["similarity_score"]) == sorted(matches["similarity_score"])
+        assert material.material_data["filename"] == matches["filename"][0]
+
+    def test_regex_name_search(self, set_test_backend):
+        df = materials.Material._load_dataframe()
+        material = materials.Material("n-bk7|n-sf11")
+        names = set(material._find_material_matches(df)["filename_no_ext"])
+        assert "N-BK7" in names
+        assert "N-SF11" in names
+
+    def test_repeated_lookup(self, set_test_backend):
+        first = materials.Material("N-BK7")
+        second = materials.Material("n-bk7")
+        assert first.filename == second.filename
+        assert first.material_data == second.material_data
+
 
 @pytest.fixture
 def abbe_material():
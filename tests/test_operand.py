@@ -586,3 +586,44 @@ class TestOperandManager:
         manager.add("f1", 1)
         del manager[0]
         assert len(manager) == 0
+
+    def test_evaluate_shares_traces(self, set_test_backend, hubble):
+        manager = operand.OperandManager()
+        operand_types = ["real_x_intercept", "real_y_intercept", "real_M"]
+        for Hy in [0.0, 1.0]:
+            for Py in [0.0, 0.5, 1.0]:
+                for operand_type in operand_types:
+                    data = {
+                        "optic": hubble,
+                        "surface_number": -1,
+                        "Hx": 0.0,
+                        "Hy": Hy,
+                        "Px": 0.0,
+                        "Py": Py,
+                        "wavelength": 0.55,
+                    }
+                    manager.add(operand_type, 0.1, weight=2, input_data=data)
+        manager.add("f2", 57600, input_data={"optic": hubble})
+
+        plan = manager.plan()
+        assert plan.num_traces == 2
+        assert all(len(points) == 3 for _, points in plan.groups.values())
+
+        expected = be.array([op.fun() for op in manager])
+        assert_allclose(manager.evaluate(), expected)
+        assert RayOperand._shared_traces is None
+
+    def test_evaluate_unplanned_inputs(self, set_test_backend, hubble):
+        manager = operand.OperandManager()
+        data = {
+            "optic": hubble,
+            "surface_number": -1,
+            "Hx": 0.0,
+            "Hy": be.array([1.0]),
+            "Px": 0.0,
+            "Py": 0.0,
+            "wavelength": 0.55,
+        }
+        manager.add("real_y_intercept", 0.0, input_data=data)
+        assert manager.plan().num_traces == 0
+        assert_allclose(manager.evaluate(), be.array([manager[0].fun()]))
@@ -8,6 +8,7 @@ from optiland.rays import create_polarization
 from optiland.samples.objectives import HeliarLens
 from optiland.surfaces import SurfaceGroup
 from optiland.wavelength import WavelengthGroup
+from tests.utils import assert_allclose
 
 
 def singlet_infinite_object():
@@ -329,6 +330,38 @@ class TestOptic:
         with pytest.raises(ValueError):
             lens.trace_generic(0.0, 5.0, 0.0, 0.0, 0.55)
 
+    def test_trace_record_image_only(self, set_test_backend):
+        lens = HeliarLens()
+        rays = lens.trace(0.0, 1.0, 0.55, record="image_only")
+        assert lens.surface_group.x.shape == (1, be.size(rays.x))
+        assert_allclose(lens.surface_group.y[-1, :], rays.y)
+        for surface in lens.surface_group.surfaces[:-1]:
+            assert be.size(surface.y) == 0
+
+    def test_trace_record_none(self, set_test_backend):
+        lens = HeliarLens()
+        rays_all = lens.trace(0.0, 1.0, 0.55)
+        rays_none = lens.trace(0.0, 1.0, 0.55, record="none")
+        assert_allclose(rays_none.y, rays_all.y)
+        for surface in lens.surface_group.surfaces:
+            assert be.size(surface.x) == 0
+
+    def test_trace_generic_record_list(self, set_test_backend):
+        lens = HeliarLens()
+        lens.trace_generic(0.0, 1.0, 0.0, 1.0, 0.55)
+        y_all = be.copy(lens.surface_group.y)
+        lens.trace_generic(0.0, 1.0, 0.0, 1.0, 0.55, record=[2, -1])
+        assert lens.surface_group.y.shape == (2, 1)
+        assert_allclose(lens.surface_group.surfaces[2].y, y_all[2])
+        assert_allclose(lens.surface_group.y[-1], y_all[-1])
+
+    def test_trace_invalid_record(self, set_test_backend):
+        lens = HeliarLens()
+        with pytest.raises(ValueError):
+            lens.trace(0.0, 0.0, 0.55, record="first")
+        with pytest.raises(IndexError):
+            lens.trace_generic(0.0, 0.0, 0.0, 0.0, 0.55, record=[100])
+
     def test_trace_polarized(self, set_test_backend):
         lens = HeliarLens()
         state = create_polarization("unpolarized")
@@ -1,14 +1,19 @@
 import warnings
 
+import numpy as np
+
 import optiland.backend as be
 import pytest
+from scipy.optimize import approx_fprime
 
-from optiland.optimization import optimization
+from optiland.optimization import optimization, sparsity
+from optiland.optimization.jacobian import ParallelJacobian
 from optiland.samples.microscopes import (
     Microscope20x,
     Objective60x,
     UVReflectingMicroscope,
 )
+from optiland.samples.objectives import CookeTriplet
 
 
 class TestOptimizationProblem:
@@ -626,3 +631,316 @@ class TestBasinHopping:
         optimizer = optimization.BasinHopping(problem)
         with pytest.raises(ValueError):
             optimizer.optimize(niter=10)
+
+
+class TestParallelJacobian:
+    @staticmethod
+    def build_problem():
+        lens = Objective60x()
+        problem = optimization.OptimizationProblem()
+        problem.add_variable(lens, "radius", surface_number=1)
+        problem.add_variable(lens, "thickness", surface_number=2)
+        problem.add_operand(operand_type="f2", target=3, input_data={"optic": lens})
+        input_data = {
+            "optic": lens,
+            "surface_number": -1,
+            "Hx": 0.0,
+            "Hy": 1.0,
+            "Px": 0.0,
+            "Py": 1.0,
+            "wavelength": 0.55,
+        }
+        problem.add_operand(
+            operand_type="real_y_intercept", target=0.0, input_data=input_data
+        )
+        return problem
+
+    def test_residual_jacobian(self):
+        optimizer = optimization.LeastSquares(self.build_problem())
+        x0 = np.array([var.value for var in optimizer.problem.variables])
+        with ParallelJacobian(
+            optimizer, "_compute_residuals_vector", n_workers=2
+        ) as jacobian:
+            jac = jacobian(x0)
+            h = jacobian.steps(x0)
+        expected = approx_fprime(x0, optimizer._compute_residuals_vector, h)
+        assert jac.shape == (2, 2)
+        assert np.allclose(jac, expected)
+
+    def test_gradient(self):
+        optimizer = optimization.OptimizerGeneric(self.build_problem())
+        x0 = np.array([var.value for var in optimizer.problem.variables])
+        with ParallelJacobian(optimizer, "_fun", n_workers=2) as jacobian:
+            grad = jacobian(x0)
+            h = jacobian.steps(x0)
+        expected = approx_fprime(x0, optimizer._fun, h)
+        assert grad.shape == (2,)
+        assert np.allclose(grad, expected)
+
+    def test_base_point_evaluated_once(self):
+        optimizer = optimization.LeastSquares(self.build_problem())
+        x0 = np.array([var.value for var in optimizer.problem.variables])
+        with ParallelJacobian(
+            optimizer, "_compute_residuals_vector", n_workers=2
+        ) as jacobian:
+            tasks = []
+            executor_map = jacobian._executor.map
+
+            def recording_map(func, batch):
+                tasks.extend(batch)
+                return executor_map(func, batch)
+
+            jacobian._executor.map = recording_map
+            jacobian(x0)
+
+        f0 = optimizer._compute_residuals_vector(x0)
+        points = [point for _, _, batch in tasks for point in batch]
+        assert len(points) == x0.size
+        assert not any(np.array_equal(point, x0) for point in points)
+        for _, base, _ in tasks:
+            assert np.array_equal(base, f0)
+
+    def test_steps_respect_bounds(self):
+        optimizer = optimization.OptimizerGeneric(self.build_problem())
+        bounds = ([0.0, 0.0], [1.0, np.inf])
+        with ParallelJacobian(optimizer, "_fun", 1, bounds) as jacobian:
+            h = jacobian.steps(np.array([1.0, 1.0]))
+        assert h[0] < 0
+        assert h[1] > 0
+
+    def test_invalid_workers(self):
+        optimizer = optimization.OptimizerGeneric(self.build_problem())
+        with pytest.raises(ValueError):
+            ParallelJacobian(optimizer, "_fun", n_workers=0)
+
+    def test_optimizer_generic(self):
+        problem = self.build_problem()
+        optimizer = optimization.OptimizerGeneric(problem)
+        optimizer.optimize(method="L-BFGS-B", maxiter=5, disp=False, n_workers=2)
+        assert problem.sum_squared() < problem.initial_value
+
+    def test_least_squares(self):
+        problem = self.build_problem()
+        optimizer = optimization.LeastSquares(problem)
+        result = optimizer.optimize(maxiter=20, method_choice="trf", n_workers=2)
+        assert result.njev > 0
+        assert problem.sum_squared() < problem.initial_value
+
+
+class TestJacobianSparsity:
+    @staticmethod
+    def build_problem():
+        lens = CookeTriplet()
+        problem = optimization.OptimizationProblem()
+        problem.add_variable(lens, "radius", surface_number=1)
+        problem.add_variable(lens, "radius", surface_number=5)
+        problem.add_variable(lens, "conic", surface_number=6)
+        problem.add_operand(operand_type="f2", target=50, input_data={"optic": lens})
+        for surface_number in [4, -1]:
+            input_data = {
+                "optic": lens,
+                "surface_number": surface_number,
+                "Hx": 0.0,
+                "Hy": 1.0,
+                "Px": 0.0,
+                "Py": 1.0,
+                "wavelength": 0.55,
+            }
+            problem.add_operand(
+                operand_type="real_y_intercept", target=0.0, input_data=input_data
+            )
+        return problem
+
+    expected = np.array(
+        [
+            [True, True, False],
+            [True, False, False],
+            [True, True, True],
+        ]
+    )
+
+    def test_declared(self):
+        problem = self.build_problem()
+        assert np.array_equal(sparsity.declared_sparsity(problem), self.expected)
+
+    def test_declared_with_pickup(self):
+        problem = self.build_problem()
+        lens = problem.variables[0].optic
+        lens.pickups.add(5, "radius", 2, scale=1)
+        declared = sparsity.declared_sparsity(problem)
+        assert declared[1, 1]
+
+    def test_declared_other_optic(self):
+        problem = self.build_problem()
+        other = CookeTriplet()
+        problem.add_variable(other, "radius", surface_number=1)
+        declared = sparsity.declared_sparsity(problem)
+        assert not declared[:, 3].any()
+
+    def test_probed(self):
+        problem = self.build_problem()
+        x0 = [var.value for var in problem.variables]
+        probed = sparsity.probed_sparsity(problem)
+        assert np.array_equal(probed, self.expected)
+        assert [var.value for var in problem.variables] == x0
+
+    def test_column_groups(self):
+        groups = sparsity.column_groups(self.expected)
+        assert groups == [[0], [1], [2]]
+
+        block = np.array([[True, False, True], [False, True, False]])
+        assert sparsity.column_groups(block) == [[0, 1], [2]]
+
+    def test_parallel_jacobian(self):
+        optimizer = optimization.LeastSquares(self.build_problem())
+        x0 = np.array([var.value for var in optimizer.problem.variables])
+        with ParallelJacobian(
+            optimizer,
+            "_compute_residuals_vector",
+            n_workers=2,
+            sparsity=self.expected,
+        ) as jacobian:
+            jac = jacobian(x0)
+            h = jacobian.steps(x0)
+        expected = approx_fprime(x0, optimizer._compute_residuals_vector, h)
+        assert np.allclose(jac, expected)
+
+    @pytest.mark.parametrize("jac_sparsity", ["declared", "probe"])
+    def test_least_squares(self, jac_sparsity):
+        problem = self.build_problem()
+        optimizer = optimization.LeastSquares(problem)
+        optimizer.optimize(
+            maxiter=10, method_choice="trf", jac_sparsity=jac_sparsity
+        )
+        assert problem.sum_squared() < problem.initial_value
+
+    def test_least_squares_lm_warning(self, capsys):
+        problem = self.build_problem()
+        optimizer = optimization.LeastSquares(problem)
+        optimizer.optimize(maxiter=10, jac_sparsity=self.expected)
+        captured = capsys.readouterr()
+        assert "Switching to 'trf' method" in captured.out
+
+    def test_invalid_sparsity(self):
+        optimizer = optimization.LeastSquares(self.build_problem())
+        with pytest.raises(ValueError):
+            optimizer.optimize(jac_sparsity="unknown")
+        with pytest.raises(ValueError):
+            optimizer.optimize(jac_sparsity=np.ones((2, 2), dtype=bool))
+
+
+class TestAutodiff:
+    @pytest.fixture(autouse=True)
+    def torch_backend(self):
+        pytest.importorskip("torch")
+        be.set_backend("torch")
+        be.set_precision("float64")
+        yield
+        be.set_backend("numpy")
+
+    @staticmethod
+    def build_problem():
+        lens = Objective60x()
+        problem = optimization.OptimizationProblem()
+        problem.add_variable(lens, "radius", surface_number=1)
+        problem.add_variable(lens, "thickness", surface_number=2)
+        problem.add_operand(operand_type="f2", target=3, input_data={"optic": lens})
+        for Py in [0.5, 1.0]:
+            input_data = {
+                "optic": lens,
+                "surface_number": -1,
+                "Hx": 0.0,
+                "Hy": 1.0,
+                "Px": 0.0,
+                "Py": Py,
+                "wavelength": 0.55,
+            }
+            problem.add_operand(
+                operand_type="real_y_intercept", target=0.0, input_data=input_data
+            )
+        return problem
+
+    def test_use_autodiff(self):
+        optimizer = optimization.OptimizerGeneric(self.build_problem())
+        assert optimizer._use_autodiff()
+        assert optimizer._use_autodiff("L-BFGS-B")
+        assert not optimizer._use_autodiff("Nelder-Mead")
+
+        be.set_backend("numpy")
+        assert not optimizer._use_autodiff()
+
+    def test_jacobian(self):
+        optimizer = optimization.LeastSquares(self.build_problem())
+        x0 = be.to_numpy([var.value for var in optimizer.problem.variables])
+        jac = optimizer._compute_jacobian(x0)
+        assert jac.shape == (3, 2)
+
+        h = 1e-6
+        for i in range(2):
+            dx = np.zeros(2)
+            dx[i] = h
+            plus = optimizer._compute_residuals_vector(x0 + dx)
+            minus = optimizer._compute_residuals_vector(x0 - dx)
+            assert np.allclose(jac[:, i], (plus - minus) / (2 * h), rtol=1e-5)
+
+    def test_gradient(self):
+        optimizer = optimization.OptimizerGeneric(self.build_problem())
+        x0 = be.to_numpy([var.value for var in optimizer.problem.variables])
+        grad = optimizer._grad(x0)
+
+        h = 1e-6
+        for i in range(2):
+            dx = np.zeros(2)
+            dx[i] = h
+            plus = optimizer._fun(x0 + dx)
+            minus = optimizer._fun(x0 - dx)
+            assert grad[i] == pytest.approx((plus - minus) / (2 * h), rel=1e-5)
+
+    def test_least_squares(self):
+        problem = self.build_problem()
+        optimizer = optimization.LeastSquares(problem)
+        result = optimizer.optimize(maxiter=20, method_choice="trf")
+        assert result.njev > 0
+        assert problem.sum_squared() < problem.initial_value
+
+    def test_finite_difference_fallback(self, monkeypatch):
+        def unsupported(fun, x):
+            raise be.AutodiffUnsupportedError("not differentiable")
+
+        monkeypatch.setattr(be.torch_backend, "jacobian", unsupported)
+        problem = self.build_problem()
+        optimizer = optimization.LeastSquares(problem)
+        x0 = be.to_numpy([var.value for var in problem.variables])
+        with pytest.warns(UserWarning, match="finite differences"):
+            jac = optimizer._compute_jacobian(x0)
+        assert jac.shape == (3, 2)
+        assert np.any(jac != 0)
+
+        h = 1e-6
+        for i in range(2):
+            dx = np.zeros(2)
+            dx[i] = h
+            plus = optimizer._compute_residuals_vector(x0 + dx)
+            minus = optimizer._compute_residuals_vector(x0 - dx)
+            assert np.allclose(jac[:, i], (plus - minus) / (2 * h), rtol=1e-3)
+
+    def test_fallback_optimizes(self, monkeypatch):
+        def unsupported(fun, x):
+            raise be.AutodiffUnsupportedError("not differentiable")
+
+        monkeypatch.setattr(be.torch_backend, "jacobian", unsupported)
+        problem = self.build_problem()
+        optimizer = optimization.OptimizerGeneric(problem)
+        with pytest.warns(UserWarning, match="finite differences"):
+            optimizer.optimize(maxiter=20, disp=False)
+        assert problem.sum_squared() < problem.initial_value
+
+    def test_unexpected_error_propagates(self, monkeypatch):
+        def broken(fun, x):
+            raise KeyError("bug")
+
+        monkeypatch.setattr(be.torch_backend, "jacobian", broken)
+        optimizer = optimization.OptimizerGeneric(self.build_problem())
+        x0 = be.to_numpy([var.value for var in optimizer.problem.variables])
+        with pytest.raises(KeyError):
+            optimizer._grad(x0)
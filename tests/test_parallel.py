@@ -0,0 +1,118 @@
+import pytest
+
+import optiland.backend as be
+from optiland import analysis, wavefront
+from optiland.parallel import OpticExecutor, map_method
+from optiland.physical_apertures import RectangularAperture
+from optiland.samples.objectives import CookeTriplet
+
+from .utils import assert_allclose
+
+
+def _image_y(optic, Hy, wavelength):
+    rays = optic.trace(0.0, Hy, wavelength, num_rays=3)
+    return be.to_numpy(rays.y)
+
+
+class _Task:
+    def __init__(self, optic, offset):
+        self.optic = optic
+        self.offset = offset
+        self.data = "not sent to the workers"
+
+    def total_length(self, scale):
+        return scale * float(self.optic.total_track) + self.offset
+
+    def has_data(self):
+        return hasattr(self, "data")
+
+
+@pytest.fixture
+def cooke_triplet():
+    return CookeTriplet()
+
+
+def test_executor_map(cooke_triplet):
+    tasks = [(Hy, 0.55) for Hy in (0.0, 0.5, 1.0)]
+    with OpticExecutor(cooke_triplet, n_workers=2) as executor:
+        results = executor.map(_image_y, tasks)
+    for result, task in zip(results, tasks):
+        assert_allclose(result, _image_y(cooke_triplet, *task))
+
+
+def test_executor_map_method(cooke_triplet):
+    obj = _Task(cooke_triplet, offset=1.0)
+    with OpticExecutor(cooke_triplet, n_workers=2) as executor:
+        results = executor.map_method(obj, "total_length", [(1,), (2,), (3,)])
+        assert executor.map_method(obj, "has_data", [()]) == [False]
+    expected = [obj.total_length(scale) for scale in (1, 2, 3)]
+    assert_allclose(results, expected)
+
+
+def test_executor_different_optic(cooke_triplet):
+    obj = _Task(CookeTriplet(), offset=0.0)
+    with OpticExecutor(cooke_triplet, n_workers=1) as executor:
+        with pytest.raises(ValueError):
+            executor.map_method(obj, "total_length", [(1,)])
+
+
+def test_executor_invalid_workers(cooke_triplet):
+    with pytest.raises(ValueError):
+        OpticExecutor(cooke_triplet, n_workers=0)
+
+
+def test_map_method_serial(cooke_triplet):
+    obj = _Task(cooke_triplet, offset=2.0)
+    results = map_method(obj, "total_length", [(1,), (2,)])
+    assert results == [obj.total_length(1), obj.total_length(2)]
+    assert obj.has_data()
+
+
+def test_spot_diagram_parallel(cooke_triplet):
+    spot = analysis.SpotDiagram(cooke_triplet, num_rings=4)
+    spot_parallel = analysis.SpotDiagram(cooke_triplet, num_rings=4, n_workers=2)
+    for field_data, field_data_parallel in zip(spot.data, spot_parallel.data):
+        for data, data_parallel in zip(field_data, field_data_parallel):
+            assert_allclose(data_parallel.x, data.x)
+            assert_allclose(data_parallel.y, data.y)
+
+
+def test_irradiance_parallel(cooke_triplet):
+    cooke_triplet.image_surface.aperture = RectangularAperture(
+        x_min=-20, x_max=20, y_min=-20, y_max=20
+    )
+    kwargs = {"num_rays": 5, "res": (8, 8), "distribution": "uniform"}
+    irr = analysis.IncoherentIrradiance(cooke_triplet, **kwargs)
+    irr_parallel = analysis.IncoherentIrradiance(cooke_triplet, **kwargs, n_workers=2)
+    for field_data, field_data_parallel in zip(irr.data, irr_parallel.data):
+        for data, data_parallel in zip(field_data, field_data_parallel):
+            assert_allclose(data_parallel[0], data[0])
+
+    # the parallel options are keyword-only
+    with pytest.raises(TypeError):
+        analysis.IncoherentIrradiance(
+            cooke_triplet, 5, (8, 8), None, -1, "all", "all", "uniform", None, None, 2
+        )
+
+
+def test_wavefront_parallel_executor(cooke_triplet):
+    wf = wavefront.Wavefront(cooke_triplet, num_rays=4)
+    with OpticExecutor(cooke_triplet, n_workers=2) as executor:
+        wf_parallel = wavefront.Wavefront(cooke_triplet, num_rays=4, executor=executor)
+    assert list(wf_parallel.data) == list(wf.data)
+    for key, data in wf.data.items():
+        assert_allclose(wf_parallel.data[key].opd, data.opd)
+        assert_allclose(wf_parallel.data[key].radius, data.radius)
+
+
+def test_through_focus_spot_diagram_parallel(cooke_triplet):
+    tf = analysis.ThroughFocusSpotDiagram(cooke_triplet, num_steps=3, num_rings=3)
+    z = be.copy(cooke_triplet.image_surface.geometry.cs.z)
+    tf_parallel = analysis.ThroughFocusSpotDiagram(
+        cooke_triplet, num_steps=3, num_rings=3, n_workers=2
+    )
+    assert_allclose(cooke_triplet.image_surface.geometry.cs.z, z)
+    for result, result_parallel in zip(tf.results, tf_parallel.results):
+        for field_data, field_data_parallel in zip(result, result_parallel):
+            for data, data_parallel in zip(field_data, field_data_parallel):
+                assert_allclose(data_parallel.y, data.y)
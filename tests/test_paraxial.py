@@ -668,3 +668,164 @@ def test_EPD_float_by_stop_size_infinite(set_test_backend):
     lens.add_wavelength(value=0.65)
 
     assert_allclose(lens.paraxial.EPD(), 9.997764563903152)
+
+
+@pytest.fixture
+def disable_grad(set_test_backend):
+    """Results that require gradients are not cached, so disable them."""
+    if be.get_backend() == "torch":
+        be.grad_mode.disable()
+
+
+def test_paraxial_cache_reused(disable_grad):
+    lens = CookeTriplet()
+    epd = lens.paraxial.EPD()
+
+    calls = []
+    trace_generic = lens.paraxial._ray_tracer.trace_generic
+
+    def counting_trace_generic(*args, **kwargs):
+        calls.append(args)
+        return trace_generic(*args, **kwargs)
+
+    lens.paraxial._ray_tracer.trace_generic = counting_trace_generic
+    for _ in range(3):
+        assert_allclose(lens.paraxial.EPD(), epd)
+        lens.paraxial.EPL()
+        lens.paraxial.marginal_ray()
+    num_calls = len(calls)
+    assert num_calls <= 3  # EPL and marginal ray are traced only once
+
+    lens.paraxial.EPL()
+    lens.paraxial.marginal_ray()
+    assert len(calls) == num_calls
+
+
+def test_paraxial_cache_returns_copies(disable_grad):
+    lens = CookeTriplet()
+    ya, _ = lens.paraxial.marginal_ray()
+    expected = be.copy(ya)
+    ya[0] = 1e3
+    ya_new, _ = lens.paraxial.marginal_ray()
+    assert_allclose(ya_new, expected)
+
+
+def test_paraxial_cache_invalidated_by_setters(set_test_backend):
+    lens = CookeTriplet()
+    reference = CookeTriplet()
+    lens.paraxial.XPD()
+    lens.paraxial.FNO()
+
+    lens.set_radius(25.0, 1)
+    reference.set_radius(25.0, 1)
+    assert_allclose(lens.paraxial.XPD(), reference.paraxial.XPD())
+    assert_allclose(lens.paraxial.FNO(), reference.paraxial.FNO())
+
+    lens.set_thickness(3.0, 2)
+    reference.set_thickness(3.0, 2)
+    assert_allclose(lens.paraxial.EPL(), reference.paraxial.EPL())
+
+    lens.set_aperture("EPD", 5.0)
+    assert_allclose(lens.paraxial.EPD(), 5.0)
+
+
+def test_paraxial_cache_invalidated_by_coordinate_change(set_test_backend):
+    lens = CookeTriplet()
+    xpl = lens.paraxial.XPL()
+
+    image = lens.image_surface
+    image.geometry.cs.z = image.geometry.cs.z + 1.0
+    assert_allclose(lens.paraxial.XPL(), xpl - 1.0)
+
+
+def test_paraxial_cache_invalidated_by_parameter_change(disable_grad):
+    lens = CookeTriplet()
+    f2 = lens.paraxial.f2()
+    geometry = lens.surface_group.surfaces[1].geometry
+    geometry.radius = geometry.radius * 2
+    assert not be.isclose(lens.paraxial.f2(), f2)
+
+    reference = CookeTriplet()
+    reference.set_radius(geometry.radius, 1)
+    assert_allclose(lens.paraxial.f2(), reference.paraxial.f2())
+
+
+def test_paraxial_cache_invalidated_by_material_change(disable_grad):
+    lens = CookeTriplet()
+    lens.set_index(1.6, 1)
+    f2 = lens.paraxial.f2()
+    lens.surface_group.surfaces[1].material_post.index = be.array([1.7])
+    assert not be.isclose(lens.paraxial.f2(), f2)
+
+
+def test_paraxial_cache_invalidated_by_aperture_change(disable_grad):
+    lens = CookeTriplet()
+    lens.paraxial.EPD()
+    lens.aperture.value = 5.0
+    assert_allclose(lens.paraxial.EPD(), 5.0)
+
+
+def test_paraxial_cache_invalidated_by_stop_change(disable_grad):
+    def move_stop(lens):
+        lens.surface_group.surfaces[3].is_stop = False
+        lens.surface_group.surfaces[1].is_stop = True
+
+    lens = CookeTriplet()
+    lens.paraxial.EPL()
+    move_stop(lens)
+    reference = CookeTriplet()
+    move_stop(reference)
+    assert_allclose(lens.paraxial.EPL(), reference.paraxial.EPL())
+
+
+def test_paraxial_cache_invalidated_by_primary_wavelength(disable_grad):
+    def switch_primary(lens):
+        for wavelength in lens.wavelengths.wavelengths:
+            wavelength.is_primary = False
+        lens.wavelengths.wavelengths[0].is_primary = True
+
+    lens = CookeTriplet()
+    f2 = lens.paraxial.f2()
+    switch_primary(lens)
+    reference = CookeTriplet()
+    switch_primary(reference)
+    assert_allclose(lens.paraxial.f2(), reference.paraxial.f2())
+    assert not be.isclose(lens.paraxial.f2(), f2)
+
+
+def test_paraxial_cache_invalidated_by_field_change(disable_grad):
+    lens = CookeTriplet()
+    y, _ = lens.paraxial.chief_ray()
+    lens.fields.fields[-1].y = 30
+    reference = CookeTriplet()
+    reference.fields.fields[-1].y = 30
+    y_new, _ = lens.paraxial.chief_ray()
+    assert_allclose(y_new, reference.paraxial.chief_ray()[0])
+    assert not be.isclose(y_new[-1], y[-1])
+
+
+def test_paraxial_cache_invalidate(disable_grad):
+    lens = CookeTriplet()
+    lens.set_index(1.6, 1)
+    f2 = lens.paraxial.f2()
+    material = lens.surface_group.surfaces[1].material_post
+    material.index[0] = 1.7
+    assert_allclose(lens.paraxial.f2(), f2)  # element-wise edits are not tracked
+
+    lens.invalidate()
+    assert not be.isclose(lens.paraxial.f2(), f2)
+
+
+def test_paraxial_cache_skips_gradients():
+    pytest.importorskip("torch")
+    be.set_backend("torch")
+    be.grad_mode.enable()
+    try:
+        lens = CookeTriplet()
+        f2 = lens.paraxial.f2()
+        radius = lens.surface_group.surfaces[1].geometry.radius
+        lens.surface_group.surfaces[1].geometry.radius = radius * 2
+        assert not be.isclose(lens.paraxial.f2(), f2)
+    finally:
+        be.grad_mode.disable()
+        be.set_backend("numpy")
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 
 import optiland.backend as be
@@ -191,6 +192,24 @@ class TestBooleanApertures:
         difference_aperture = DifferenceAperture(self.aperture1, self.aperture2)
         assert difference_aperture.extent == (-1, 1, -1, 1)
 
+    def test_nested_apertures(self, set_test_backend):
+        square = PolygonAperture(x=[-1, 1, 1, -1], y=[-1, -1, 1, 1])
+        hole = EllipticalAperture(a=0.2, b=0.1, offset_x=0.5)
+        tab = RectangularAperture(x_min=0.9, x_max=1.5, y_min=-0.1, y_max=0.1)
+        aperture = (square - hole) | tab
+
+        x = be.array([[0.0, 0.5, 0.75, 1.2], [1.6, 0.5, -3.0, 0.0]])
+        y = be.array([[0.0, 0.0, 0.0, 0.0], [0.0, 0.08, 0.0, 0.95]])
+        result = aperture.contains(x, y)
+        expected = be.array([[True, False, True, True], [False, False, False, True]])
+        assert result.shape == (2, 4)
+        assert be.all(result == expected)
+
+    def test_outside_extents(self, set_test_backend):
+        aperture = RadialAperture(r_max=1) & OffsetRadialAperture(r_max=1, offset_x=5)
+        result = aperture.contains(be.array([0.0, 5.0, 3.0]), be.array([0.0] * 3))
+        assert not be.any(result)
+
 
 class TestRectangularAperture:
     def setup_method(self, set_test_backend):
@@ -250,6 +269,9 @@ class TestRectangularAperture:
     def test_extent(self, set_test_backend):
         assert self.aperture.extent == (-1, 1, -0.5, 0.5)
 
+        aperture = EllipticalAperture(a=1, b=0.5, offset_x=2, offset_y=-1)
+        assert aperture.extent == (1, 3, -1.5, -0.5)
+
 
 class TestEllipticalAperture:
     def setup_method(self, set_test_backend):
@@ -354,6 +376,43 @@ class TestPolygonAperture:
     def test_extent(self):
         assert self.aperture.extent == (-10, 10, -15, 15)
 
+    def test_contains_matches_path(self):
+        rng = np.random.default_rng(42)
+        t = np.sort(rng.uniform(0, 2 * np.pi, 200))
+        r = rng.uniform(0.5, 1.5, 200)
+        aperture = PolygonAperture(x=r * np.cos(t), y=r * np.sin(t))
+
+        x = be.array(rng.uniform(-2, 2, 5000))
+        y = be.array(rng.uniform(-2, 2, 5000))
+        expected = be.path_contains_points(aperture.vertices, be.column_stack((x, y)))
+        assert be.all(aperture.contains(x, y) == expected)
+
+    def test_contains_concave(self):
+        # U-shaped polygon, opening at the top
+        aperture = PolygonAperture(
+            x=[-3, 3, 3, 1, 1, -1, -1, -3], y=[0, 0, 4, 4, 1, 1, 4, 4]
+        )
+        x = be.array([0, 0, 2, -2, 0, 4, 2])
+        y = be.array([0.5, 2, 3, 3, 5, 1, -1])
+        result = aperture.contains(x, y)
+        expected = be.array([True, False, True, True, False, False, False])
+        assert be.all(result == expected)
+
+    def test_contains_shape(self):
+        x, y = be.meshgrid(be.linspace(-20, 20, 5), be.linspace(-20, 20, 3))
+        assert self.aperture.contains(x, y).shape == (3, 5)
+        assert self.aperture.contains(0.0, 0.0)
+
+    def test_contains_after_scale(self):
+        self.aperture.scale(2)
+        result = self.aperture.contains(be.array([15, 25]), be.array([25, 0]))
+        assert be.all(result == be.array([True, False]))
+
+    def test_degenerate_polygon(self):
+        aperture = PolygonAperture(x=[0, 1, 2], y=[1, 1, 1])
+        result = aperture.contains(be.array([0.5, 1.0]), be.array([1.0, 0.0]))
+        assert not be.any(result)
+
 
 class TestFileAperture:
     def setup_method(self, temp_aperture_file):
@@ -0,0 +1,69 @@
+import pytest
+
+import optiland.backend as be
+from optiland.raytrace import RayBatch
+from optiland.samples.objectives import CookeTriplet
+
+from .utils import assert_allclose
+
+
+@pytest.fixture
+def cooke_triplet():
+    return CookeTriplet()
+
+
+def test_trace_batch_matches_trace(set_test_backend, cooke_triplet):
+    batch = cooke_triplet.trace_batch(num_rays=4, distribution="hexapolar")
+    assert isinstance(batch, RayBatch)
+    assert batch.shape == (3, 3)
+    assert len(batch) == 3
+    assert batch.num_pupil == 61
+
+    for f, field in enumerate(batch.fields):
+        for w, wavelength in enumerate(batch.wavelengths):
+            rays = cooke_triplet.trace(*field, wavelength, 4, "hexapolar")
+            rays_batch = batch[f, w]
+            for name in ("x", "y", "z", "L", "M", "N", "i", "w", "opd"):
+                assert_allclose(getattr(rays_batch, name), getattr(rays, name))
+
+
+def test_trace_batch_selection(set_test_backend, cooke_triplet):
+    batch = cooke_triplet.trace_batch(
+        fields=[(0.0, 0.5)], wavelengths="primary", num_rays=3
+    )
+    assert batch.shape == (1, 1)
+    rays = cooke_triplet.trace(0.0, 0.5, cooke_triplet.primary_wavelength, 3)
+    assert_allclose(batch[0, -1].y, rays.y)
+
+
+def test_trace_batch_intermediate_surface(set_test_backend, cooke_triplet):
+    batch = cooke_triplet.trace_batch(
+        wavelengths=[0.55], num_rays=3, distribution="uniform", surface=2
+    )
+    cooke_triplet.trace(0.0, 1.0, 0.55, 3, "uniform")
+    assert_allclose(batch[2, 0].y, cooke_triplet.surface_group.y[2])
+
+
+def test_trace_batch_items(set_test_backend, cooke_triplet):
+    batch = cooke_triplet.trace_batch(wavelengths=[0.5, 0.6], num_rays=2)
+    items = list(batch.items())
+    assert len(items) == 6
+    field, wavelength, rays = items[3]
+    assert field == batch.fields[1]
+    assert wavelength == 0.6
+    assert_allclose(rays.w, be.full((batch.num_pupil,), 0.6))
+
+
+def test_trace_batch_invalid(cooke_triplet):
+    with pytest.raises(ValueError):
+        cooke_triplet.trace_batch(wavelengths="invalid")
+    with pytest.raises(ValueError):
+        cooke_triplet.trace_batch(fields=[(0.0, 1.5)])
+
+    batch = cooke_triplet.trace_batch(num_rays=2)
+    with pytest.raises(IndexError):
+        batch[3, 0]
+    with pytest.raises(IndexError):
+        batch[0, -4]
+    with pytest.raises(IndexError):
+        batch[0]
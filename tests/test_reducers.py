@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+import optiland.backend as be
+from optiland.raytrace import (
+    CentroidReducer,
+    HistogramReducer,
+    OPDStatsReducer,
+    reduce_chunks,
+)
+from optiland.samples.objectives import CookeTriplet
+
+from .utils import assert_allclose
+
+
+@pytest.fixture
+def cooke_triplet():
+    return CookeTriplet()
+
+
+def test_trace_iter_matches_trace(set_test_backend, cooke_triplet):
+    rays = cooke_triplet.trace(0.0, 1.0, 0.55, num_rays=10, distribution="hexapolar")
+    chunks = list(
+        cooke_triplet.trace_iter(
+            0.0, 1.0, 0.55, num_rays=10, distribution="hexapolar", chunk_size=100
+        )
+    )
+    assert len(chunks) == 4
+    assert [be.size(chunk.x) for chunk in chunks] == [100, 100, 100, 31]
+    for name in ("x", "y", "z", "L", "M", "N", "i", "opd"):
+        value = be.concatenate([getattr(chunk, name) for chunk in chunks])
+        assert_allclose(value, getattr(rays, name))
+
+
+def test_trace_iter_intermediate_surface(set_test_backend, cooke_triplet):
+    cooke_triplet.trace(0.0, 0.5, 0.55, num_rays=5, distribution="uniform")
+    expected_y = be.copy(cooke_triplet.surface_group.y[3])
+    chunks = cooke_triplet.trace_iter(
+        0.0, 0.5, 0.55, num_rays=5, distribution="uniform", chunk_size=7, surface=3
+    )
+    y = be.concatenate([chunk.y for chunk in chunks])
+    assert_allclose(y, expected_y)
+
+
+def test_trace_iter_random(set_test_backend, cooke_triplet):
+    chunks = list(
+        cooke_triplet.trace_iter(
+            0.0, 0.0, 0.55, num_rays=250, distribution="random", chunk_size=100
+        )
+    )
+    assert [be.size(chunk.x) for chunk in chunks] == [100, 100, 50]
+
+
+def test_trace_iter_field_arrays(set_test_backend, cooke_triplet):
+    Hy = be.linspace(0, 1, 61)
+    rays = cooke_triplet.trace(0.0, Hy, 0.55, num_rays=4, distribution="hexapolar")
+    chunks = cooke_triplet.trace_iter(
+        0.0, Hy, 0.55, num_rays=4, distribution="hexapolar", chunk_size=20
+    )
+    y = be.concatenate([chunk.y for chunk in chunks])
+    assert_allclose(y, rays.y)
+
+
+def test_trace_iter_invalid_chunk_size(cooke_triplet):
+    with pytest.raises(ValueError):
+        next(cooke_triplet.trace_iter(0.0, 0.0, 0.55, chunk_size=0))
+
+
+def test_histogram_reducer(set_test_backend, cooke_triplet):
+    rays = cooke_triplet.trace(0.0, 1.0, 0.55, num_rays=12, distribution="hexapolar")
+    x = be.to_numpy(rays.x)
+    y = be.to_numpy(rays.y)
+    x_edges = np.linspace(x.min(), x.max(), 11)
+    y_edges = np.linspace(y.min(), y.max(), 9)
+    expected, _, _ = np.histogram2d(
+        x, y, bins=[x_edges, y_edges], weights=be.to_numpy(rays.i)
+    )
+
+    (reducer,) = reduce_chunks(
+        cooke_triplet.trace_iter(0.0, 1.0, 0.55, num_rays=12, chunk_size=64),
+        HistogramReducer(x_edges, y_edges),
+    )
+    assert reducer.result().shape == (10, 8)
+    assert_allclose(reducer.result(), expected)
+
+
+def test_centroid_and_opd_reducers(set_test_backend, cooke_triplet):
+    rays = cooke_triplet.trace(0.0, 0.7, 0.55, num_rays=15, distribution="hexapolar")
+    x = be.to_numpy(rays.x)
+    y = be.to_numpy(rays.y)
+    opd = be.to_numpy(rays.opd)
+
+    centroid, opd_stats = reduce_chunks(
+        cooke_triplet.trace_iter(0.0, 0.7, 0.55, num_rays=15, chunk_size=50),
+        CentroidReducer(),
+        OPDStatsReducer(),
+    )
+
+    assert_allclose(centroid.centroid[0], np.mean(x))
+    assert_allclose(centroid.centroid[1], np.mean(y))
+    rms = np.sqrt(np.mean((x - x.mean()) ** 2 + (y - y.mean()) ** 2))
+    assert_allclose(centroid.rms_radius, rms)
+    assert centroid.result()["rms_radius"] == centroid.rms_radius
+
+    assert opd_stats.count == opd.size
+    assert_allclose(opd_stats.mean, np.mean(opd))
+    assert_allclose(opd_stats.rms, np.std(opd))
+    assert_allclose(opd_stats.pv, np.ptp(opd))
+
+
+def test_centroid_reducer_local_coordinates(set_test_backend, cooke_triplet):
+    image = cooke_triplet.image_surface
+    image.geometry.cs.x = 1.5
+    reducer_global, reducer_local = reduce_chunks(
+        cooke_triplet.trace_iter(0.0, 0.0, 0.55, num_rays=6, chunk_size=20),
+        CentroidReducer(weighted=False),
+        CentroidReducer(surface=image, weighted=False),
+    )
+    assert_allclose(
+        reducer_local.centroid[0], reducer_global.centroid[0] - 1.5, atol=1e-10
+    )
+
+
+def test_opd_reducer_empty():
+    reducer = OPDStatsReducer()
+    assert reducer.count == 0
+    assert np.isnan(reducer.mean)
+    assert np.isnan(reducer.pv)
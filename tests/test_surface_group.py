@@ -425,3 +425,261 @@ class TestSurfaceGroupUpdatesRealObjects:
 
         rays = lens.trace(Hx=0, Hy=1, distribution="hexapolar", num_rays=3, wavelength=0.59)
         assert_allclose(be.mean(rays.y), 18.13506822442731)  # mean y position for Cooke triplet defined above
+
+
+class TestSurfaceGroupRecording:
+    def _surface_group(self):
+        sg = SurfaceGroup([])
+        for k in range(4):
+            sg.add_surface(new_surface=create_real_surface(name=f"s{k}"))
+        return sg
+
+    def test_record_indices_modes(self, set_test_backend):
+        sg = self._surface_group()
+        assert sg.get_record_indices("all") == {0, 1, 2, 3}
+        assert sg.get_record_indices("image_only") == {3}
+        assert sg.get_record_indices("none") == set()
+        assert sg.get_record_indices([1, -1]) == {1, 3}
+
+    def test_record_indices_invalid(self, set_test_backend):
+        sg = self._surface_group()
+        with pytest.raises(ValueError):
+            sg.get_record_indices("everything")
+        with pytest.raises(IndexError):
+            sg.get_record_indices([4])
+        with pytest.raises(IndexError):
+            sg.get_record_indices([-5])
+
+
+class TestSurfaceGroupRayHistory:
+    def test_properties_are_views_of_history(self):
+        lens = optic.Optic()
+        lens.add_surface(index=0, thickness=be.inf)
+        lens.add_surface(index=1, thickness=5, radius=50, material="N-BK7", is_stop=True)
+        lens.add_surface(index=2, thickness=45, radius=-50)
+        lens.add_surface(index=3)
+        lens.set_aperture(aperture_type="EPD", value=10)
+        lens.set_field_type(field_type="angle")
+        lens.add_field(y=0)
+        lens.add_wavelength(value=0.55, is_primary=True)
+
+        rays = lens.trace(0.0, 0.0, 0.55, num_rays=5)
+        sg = lens.surface_group
+        num_rays = be.size(rays.x)
+        assert sg.x.shape == (4, num_rays)
+        assert sg._history.data.shape == (8, 4, num_rays)
+        for k, surface in enumerate(sg.surfaces):
+            assert_allclose(sg.y[k], surface.y)
+            assert be.shares_memory(sg.y, surface.y)
+        assert_allclose(sg.L[-1], rays.L)
+
+    def test_history_cleared_on_reset(self, set_test_backend):
+        lens = optic.Optic()
+        lens.add_surface(index=0, thickness=be.inf)
+        lens.add_surface(index=1, thickness=5, radius=50, is_stop=True)
+        lens.add_surface(index=2)
+        lens.set_aperture(aperture_type="EPD", value=10)
+        lens.add_field(y=0)
+        lens.add_wavelength(value=0.55, is_primary=True)
+
+        lens.trace_generic(0.0, 0.0, 0.0, 1.0, 0.55)
+        assert lens.surface_group._history is not None
+        lens.surface_group.reset()
+        assert lens.surface_group._history is None
+        for surface in lens.surface_group.surfaces:
+            assert surface._history_slot is None
+
+    def test_paraxial_history(self, set_test_backend):
+        lens = optic.Optic()
+        lens.add_surface(index=0, thickness=50)
+        lens.add_surface(index=1, thickness=5, radius=50, is_stop=True, material="N-BK7")
+        lens.add_surface(index=2, thickness=40, radius=-50)
+        lens.add_surface(index=3)
+        lens.set_aperture(aperture_type="EPD", value=10)
+        lens.set_field_type(field_type="angle")
+        lens.add_field(y=0)
+        lens.add_wavelength(value=0.55, is_primary=True)
+
+        lens.paraxial.trace(0.0, 1.0, 0.55)
+        sg = lens.surface_group
+        assert sg.u.shape == sg.y.shape == (4, 1)
+        assert_allclose(sg.y[-1], sg.surfaces[-1].y)
+
+
+class TestSurfaceGroupCompaction:
+    def _vignetted_lens(self):
+        from optiland.physical_apertures import RadialAperture
+        from optiland.samples.objectives import CookeTriplet
+
+        lens = CookeTriplet()
+        lens.surface_group.surfaces[2].aperture = RadialAperture(r_max=4.0)
+        return lens
+
+    def test_compact_matches_full_trace(self, set_test_backend):
+        lens = self._vignetted_lens()
+        rays = lens.trace(0.0, 1.0, 0.55, num_rays=10, distribution="uniform")
+        alive = rays.i > 0
+        history_y = be.copy(lens.surface_group.y)
+
+        compact = lens.trace(
+            0.0, 1.0, 0.55, num_rays=10, distribution="uniform", compact=True
+        )
+        assert 0 < be.sum(alive) < be.size(alive)
+        assert_allclose(compact.i, rays.i)
+        assert_allclose(compact.x[alive], rays.x[alive])
+        assert_allclose(compact.y[alive], rays.y[alive])
+        assert_allclose(compact.N[alive], rays.N[alive])
+        assert_allclose(lens.surface_group.y[:, alive], history_y[:, alive])
+        assert be.all(be.isfinite(compact.x))
+
+    def test_compact_return_indices(self, set_test_backend):
+        lens = self._vignetted_lens()
+        full = lens.trace_generic(0.0, 1.0, 0.0, be.linspace(-1, 1, 11), 0.55)
+        rays = lens.ray_tracer.ray_generator.generate_rays(
+            0.0, 1.0, be.zeros(11), be.linspace(-1, 1, 11), 0.55
+        )
+        survivors, indices = lens.surface_group.trace(
+            rays, record="none", compact=True, return_indices=True
+        )
+        expected = be.to_numpy(full.i) > 0
+        assert be.size(indices) == expected.sum()
+        assert_allclose(survivors.y, full.y[indices])
+        assert be.all(survivors.i > 0)
+
+    def test_compact_dropped_rays(self, set_test_backend):
+        lens = self._vignetted_lens()
+        lens.trace(0.0, 1.0, 0.55, num_rays=10, distribution="uniform")
+        names = ("x", "y", "z", "L", "M", "N", "opd", "intensity")
+        sg = lens.surface_group
+        full = {name: be.copy(getattr(sg, name)) for name in names}
+
+        rays = lens.trace(
+            0.0, 1.0, 0.55, num_rays=10, distribution="uniform", compact=True
+        )
+        dead = rays.i == 0
+        z_clip = sg.surfaces[2].geometry.cs.z
+        # the returned rays keep their state at the clipping surface
+        assert be.all(be.abs(rays.z[dead] - z_clip) < 1.0)
+
+        # behind the clipping surface, dropped rays are recorded as NaN
+        live = ~be.isnan(sg.x)
+        assert be.all(live[:3])
+        assert be.all(live[3:] == ~dead)
+        assert be.all(sg.intensity[3:][:, dead] == 0)
+
+        # the history of the live rays matches the full trace
+        for name, values in full.items():
+            assert_allclose(getattr(sg, name)[live], values[live])
+
+
+class TestSurfaceGroupCheckpoints:
+    def _trace(self, lens):
+        return lens.trace_generic(0.0, 1.0, 0.0, be.linspace(-1, 1, 5), 0.55)
+
+    def test_resume_matches_full_trace(self):
+        from optiland.samples.objectives import CookeTriplet
+
+        lens = CookeTriplet()
+        checkpoints = lens.surface_group.enable_checkpoints()
+        self._trace(lens)
+        assert checkpoints.surfaces_skipped == 0
+
+        lens.set_radius(70.0, 5)
+        rays = self._trace(lens)
+        # the surfaces in front of surface 5 are restored
+        assert checkpoints.surfaces_skipped == 5
+
+        reference = CookeTriplet()
+        reference.set_radius(70.0, 5)
+        expected = self._trace(reference)
+        assert_allclose(rays.y, expected.y)
+        assert_allclose(rays.N, expected.N)
+        assert_allclose(rays.opd, expected.opd)
+        assert_allclose(lens.surface_group.y, reference.surface_group.y)
+
+    def test_restored_surface_reuses_trace(self):
+        from optiland.samples.objectives import CookeTriplet
+
+        lens = CookeTriplet()
+        checkpoints = lens.surface_group.enable_checkpoints()
+        expected = self._trace(lens)
+        expected_z = be.copy(lens.surface_group.z)
+
+        lens.set_radius(70.0, 5)
+        self._trace(lens)
+        lens.set_radius(79.68360, 5)
+        skipped = checkpoints.surfaces_skipped
+        rays = self._trace(lens)
+        assert checkpoints.surfaces_skipped == skipped + 8
+        assert_allclose(rays.y, expected.y)
+        assert_allclose(lens.surface_group.z, expected_z)
+
+    def test_state_key_serialized_on_change(self, monkeypatch):
+        from optiland.samples.objectives import CookeTriplet
+        from optiland.surfaces import trace_checkpoints
+
+        lens = CookeTriplet()
+        lens.surface_group.enable_checkpoints()
+        self._trace(lens)
+
+        serialized = []
+        state_key = trace_checkpoints.state_key
+
+        def counting_state_key(surface):
+            serialized.append(surface)
+            return state_key(surface)
+
+        monkeypatch.setattr(trace_checkpoints, "state_key", counting_state_key)
+        self._trace(lens)
+        assert serialized == []
+
+        lens.set_radius(70.0, 5)
+        self._trace(lens)
+        assert serialized == [lens.surface_group.surfaces[5]]
+
+    def test_serialization_errors_propagate(self, monkeypatch):
+        from optiland.samples.objectives import CookeTriplet
+
+        lens = CookeTriplet()
+        lens.surface_group.enable_checkpoints()
+        material = lens.surface_group.surfaces[1].material_post
+
+        def to_dict():
+            raise TypeError("not serializable")
+
+        monkeypatch.setattr(material, "to_dict", to_dict, raising=False)
+        with pytest.raises(TypeError):
+            self._trace(lens)
+
+    def test_different_rays_are_traced(self):
+        from optiland.samples.objectives import CookeTriplet
+
+        lens = CookeTriplet()
+        checkpoints = lens.surface_group.enable_checkpoints()
+        self._trace(lens)
+        lens.trace_generic(0.0, 0.5, 0.0, be.linspace(-1, 1, 5), 0.55)
+        assert checkpoints.surfaces_skipped == 0
+        assert len(checkpoints) == 2
+
+    def test_max_traces(self):
+        from optiland.samples.objectives import CookeTriplet
+
+        lens = CookeTriplet()
+        checkpoints = lens.surface_group.enable_checkpoints(max_traces=1)
+        for Hy in [0.0, 0.5, 1.0]:
+            lens.trace_generic(0.0, Hy, 0.0, 0.0, 0.55)
+        assert len(checkpoints) == 1
+
+        with pytest.raises(ValueError):
+            lens.surface_group.enable_checkpoints(max_traces=0)
+
+    def test_disable_checkpoints(self, set_test_backend):
+        from optiland.samples.objectives import CookeTriplet
+
+        lens = CookeTriplet()
+        lens.surface_group.enable_checkpoints()
+        self._trace(lens)
+        lens.surface_group.disable_checkpoints()
+        assert lens.surface_group.checkpoints is None
+        rays = self._trace(lens)
+        assert be.all(be.isfinite(rays.y))
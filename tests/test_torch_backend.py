@@ -94,3 +94,47 @@ def test_grad_mode_temporary_enable():
 
     # After the context, it should revert to the original state.
     assert torch_backend.grad_mode.requires_grad is initial_state
+
+
+def test_array_keeps_graph():
+    torch_backend.set_precision("float64")
+    x = torch.tensor(2.0, dtype=torch.float64, requires_grad=True)
+    y = torch_backend.array([x, 3.0, x**2])
+    assert y.shape == (3,)
+    (grad,) = torch.autograd.grad(y.sum(), x)
+    assert grad.item() == pytest.approx(5.0)
+
+
+def test_full_keeps_graph():
+    torch_backend.set_precision("float64")
+    x = torch.tensor(2.0, dtype=torch.float64, requires_grad=True)
+    y = torch_backend.full((3,), x) + torch_backend.full_like(torch.zeros(3), x)
+    assert torch.all(y == 4.0)
+    (grad,) = torch.autograd.grad(y.sum(), x)
+    assert grad.item() == pytest.approx(6.0)
+
+
+def test_jacobian():
+    torch_backend.set_precision("float64")
+
+    def fun(x):
+        return torch.stack([x[0] * x[1], torch.sin(x[1]), torch.tensor(1.0)])
+
+    jac = torch_backend.jacobian(fun, [2.0, 0.5])
+    expected = torch.tensor(
+        [[0.5, 2.0], [0.0, torch.cos(torch.tensor(0.5))], [0.0, 0.0]],
+        dtype=torch.float64,
+    )
+    assert jac.shape == (3, 2)
+    assert torch.allclose(jac, expected)
+    assert not jac.requires_grad
+
+
+def test_jacobian_disconnected():
+    torch_backend.set_precision("float64")
+
+    def fun(x):
+        return torch.tensor([float(x[0]), 1.0], dtype=torch.float64)
+
+    with pytest.raises(be.AutodiffUnsupportedError):
+        torch_backend.jacobian(fun, [2.0, 0.5])
@@ -0,0 +1,169 @@
+import numpy as np
+import pytest
+
+import optiland.backend as be
+from optiland import optic
+from optiland.coatings import SimpleCoating
+from optiland.physical_apertures import RadialAperture
+from optiland.rays import RealRays
+from optiland.samples.objectives import CookeTriplet
+from optiland.samples.telescopes import HubbleTelescope
+from optiland.surfaces import TracePlan
+from tests.utils import assert_allclose
+
+
+def generate_rays(lens, Hy=0.7, wavelength=0.55, num_rays=101):
+    Px = be.linspace(-0.7, 0.7, num_rays)
+    Py = be.linspace(-1.0, 1.0, num_rays)
+    return lens.ray_tracer.ray_generator.generate_rays(0.0, Hy, Px, Py, wavelength)
+
+
+def traced_data(surface_group):
+    return {
+        name: be.to_numpy(getattr(surface_group, name))
+        for name in ("x", "y", "z", "L", "M", "N", "opd", "intensity")
+    }
+
+
+def assert_plan_matches_trace(lens, rays_ref, rays_plan, plan=None):
+    sg = lens.surface_group
+    sg.trace(rays_ref)
+    expected = traced_data(sg)
+
+    if plan is None:
+        plan = sg.compile()
+    traced = plan.trace(rays_plan)
+    actual = traced_data(sg)
+
+    for name, value in expected.items():
+        nan_mask = np.isnan(value)
+        assert np.array_equal(nan_mask, np.isnan(actual[name]))
+        assert_allclose(actual[name][~nan_mask], value[~nan_mask], atol=1e-10)
+
+    assert_allclose(traced.x, rays_ref.x, atol=1e-10)
+    assert_allclose(traced.i, rays_ref.i, atol=1e-10)
+    return plan
+
+
+def tilted_lens():
+    lens = optic.Optic()
+    lens.add_surface(index=0, thickness=be.inf)
+    lens.add_surface(index=1, thickness=5, radius=50, material="N-BK7", is_stop=True)
+    lens.add_surface(index=2, thickness=30, radius=-50, rx=0.05, dy=0.5)
+    lens.add_surface(index=3, ry=0.02)
+    lens.set_aperture(aperture_type="EPD", value=10)
+    lens.set_field_type(field_type="angle")
+    lens.add_field(y=0)
+    lens.add_field(y=5)
+    lens.add_wavelength(value=0.55, is_primary=True)
+    return lens
+
+
+def test_compile_returns_plan(set_test_backend):
+    lens = CookeTriplet()
+    plan = lens.surface_group.compile(wavelengths=[0.48, 0.55])
+    assert isinstance(plan, TracePlan)
+    assert len(plan.steps) == lens.surface_group.num_surfaces
+    # object surface is always traced by the regular surface method
+    assert not plan.steps[0].fused
+    assert plan.num_fused == lens.surface_group.num_surfaces - 1
+
+
+def test_plan_matches_trace_cooke_triplet(set_test_backend):
+    lens = CookeTriplet()
+    assert_plan_matches_trace(lens, generate_rays(lens), generate_rays(lens))
+
+
+def test_plan_matches_trace_reflective(set_test_backend):
+    lens = HubbleTelescope()
+    assert_plan_matches_trace(lens, generate_rays(lens), generate_rays(lens))
+
+
+def test_plan_matches_trace_tilted_decentered(set_test_backend):
+    lens = tilted_lens()
+    assert_plan_matches_trace(
+        lens, generate_rays(lens, Hy=1.0), generate_rays(lens, Hy=1.0)
+    )
+
+
+def test_plan_matches_trace_with_aperture(set_test_backend):
+    lens = CookeTriplet()
+    lens.surface_group.surfaces[2].aperture = RadialAperture(r_max=4.0, r_min=0.5)
+    plan = assert_plan_matches_trace(lens, generate_rays(lens), generate_rays(lens))
+    assert be.any(lens.surface_group.intensity[-1] == 0)
+    assert plan.steps[2].fused
+
+
+def test_plan_multiple_wavelengths(set_test_backend):
+    lens = CookeTriplet()
+    rays = [generate_rays(lens, wavelength=w, num_rays=21) for w in (0.48, 0.65)]
+
+    def merge():
+        return RealRays(
+            *(
+                be.concatenate([getattr(r, name) for r in rays])
+                for name in ("x", "y", "z", "L", "M", "N", "i", "w")
+            )
+        )
+
+    assert_plan_matches_trace(lens, merge(), merge())
+
+
+def test_plan_fallback_surfaces(set_test_backend):
+    lens = CookeTriplet()
+    lens.surface_group.surfaces[3].coating = SimpleCoating(0.9, 0.1)
+    plan = lens.surface_group.compile()
+    assert not plan.steps[3].fused
+    assert plan.num_fused == lens.surface_group.num_surfaces - 2
+    assert_plan_matches_trace(lens, generate_rays(lens), generate_rays(lens), plan)
+
+
+def test_plan_does_not_modify_input_arrays():
+    lens = CookeTriplet()
+    x = np.zeros(5)
+    y = np.linspace(-5, 5, 5)
+    z = np.full(5, -10.0)
+    L = np.zeros(5)
+    M = np.zeros(5)
+    N = np.ones(5)
+    intensity = np.ones(5)
+    w = np.full(5, 0.55)
+    rays = RealRays(x, y, z, L, M, N, intensity, w)
+
+    lens.surface_group.compile().trace(rays)
+
+    assert np.all(z == -10.0)
+    assert np.all(N == 1.0)
+    assert not np.allclose(rays.z, -10.0)
+
+
+def test_plan_reuse_overwrites_records():
+    lens = CookeTriplet()
+    plan = lens.surface_group.compile(wavelengths=[0.55])
+    plan.trace(generate_rays(lens, Hy=0.0))
+    y_on_axis = be.copy(lens.surface_group.y[-1])
+    plan.trace(generate_rays(lens, Hy=1.0))
+    assert not np.allclose(y_on_axis, lens.surface_group.y[-1])
+
+
+@pytest.mark.parametrize("skip", [0, 1])
+def test_plan_skip(skip):
+    lens = CookeTriplet()
+    rays_ref = generate_rays(lens)
+    rays_plan = generate_rays(lens)
+    lens.surface_group.trace(rays_ref, skip=skip)
+    expected = be.copy(lens.surface_group.y)
+    lens.surface_group.compile().trace(rays_plan, skip=skip)
+    actual = lens.surface_group.y
+    assert actual.shape == expected.shape
+    assert_allclose(actual, expected, atol=1e-10)
+
+
+def test_plan_record_image_only(set_test_backend):
+    lens = CookeTriplet()
+    rays = lens.surface_group.compile().trace(
+        generate_rays(lens), record="image_only"
+    )
+    assert lens.surface_group.x.shape == (1, be.size(rays.x))
+    assert_allclose(lens.surface_group.y[-1], rays.y)
+    assert be.size(lens.surface_group.surfaces[1].y) == 0